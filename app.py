@@ -3,12 +3,15 @@ import pandas as pd
 import json
 import base64
 import os
+import tempfile
 from io import StringIO, BytesIO
 from modules.web_scraper import WebScraper
 from modules.social_scraper import SocialMediaScraper
 from modules.ai_assistant import AIAssistant
 from modules.data_processor import DataProcessor
 from modules.visualizer import Visualizer
+from modules.metrics import get_default_metrics
+from modules.pipeline import StepCache
 
 # Set page configuration
 st.set_page_config(
@@ -27,12 +30,17 @@ if 'source_type' not in st.session_state:
     st.session_state.source_type = None
 if 'current_tab' not in st.session_state:
     st.session_state.current_tab = "web"
+if 'step_cache' not in st.session_state:
+    # Outputs of processing steps, kept across reruns so changing one option
+    # only recomputes the steps after it
+    st.session_state.step_cache = StepCache()
 
 # Initialize tools
 web_scraper = WebScraper()
 social_scraper = SocialMediaScraper()
 ai_assistant = AIAssistant()
-data_processor = DataProcessor()
+# Copy-on-Write lets processing results share the columns they leave unchanged
+data_processor = DataProcessor(copy_on_write=True, step_cache=st.session_state.step_cache)
 visualizer = Visualizer()
 
 # Custom CSS
@@ -169,6 +177,7 @@ with tabs[1]:
         
         include_metadata = st.checkbox("Include metadata", value=True)
         include_replies = st.checkbox("Include replies/comments", value=True)
+        incremental = st.checkbox("Only new items since last run", value=False)
     
     if st.button("Extract Data", key="social_scrape_button"):
         with st.spinner(f"Extracting data from {platform}..."):
@@ -180,7 +189,8 @@ with tabs[1]:
                     limit=limit,
                     date_range=date_range,
                     include_metadata=include_metadata,
-                    include_replies=include_replies
+                    include_replies=include_replies,
+                    incremental=incremental
                 )
                 
                 st.session_state.scraped_data = scraped_data
@@ -215,12 +225,18 @@ with tabs[2]:
             
             col1, col2 = st.columns(2)
             
+            # Selected options are collected as pipeline steps and applied in one planned pass
+            steps = []
+            
             with col1:
                 if st.checkbox("Remove Duplicates"):
-                    data = data_processor.remove_duplicates(data)
+                    steps.append({"step": "remove_duplicates"})
                 
                 if st.checkbox("Remove Empty Rows"):
-                    data = data_processor.remove_empty_rows(data)
+                    steps.append({"step": "remove_empty_rows"})
+                
+                if st.checkbox("Remove Cross-Source Duplicates"):
+                    steps.append({"step": "remove_cross_source_duplicates"})
                 
                 if st.checkbox("Fill Missing Values"):
                     fill_method = st.selectbox(
@@ -233,21 +249,21 @@ with tabs[2]:
                     else:
                         fill_value = None
                         
-                    data = data_processor.fill_missing_values(data, method=fill_method, fill_value=fill_value)
+                    steps.append({"step": "fill_missing_values", "method": fill_method, "fill_value": fill_value})
                 
             with col2:
                 if st.checkbox("Convert Data Types"):
                     column = st.selectbox("Select Column", data.columns.tolist())
                     target_type = st.selectbox("Target Type", ["String", "Integer", "Float", "Boolean", "DateTime"])
                     
-                    data = data_processor.convert_data_type(data, column, target_type)
+                    steps.append({"step": "convert_data_type", "column": column, "target_type": target_type})
                 
                 if st.checkbox("Filter Data"):
                     filter_col = st.selectbox("Filter Column", data.columns.tolist(), key="filter_col")
                     filter_type = st.selectbox("Filter Type", ["Contains", "Equals", "Greater Than", "Less Than"])
                     filter_value = st.text_input("Filter Value")
                     
-                    data = data_processor.filter_data(data, filter_col, filter_type, filter_value)
+                    steps.append({"step": "filter_data", "column": filter_col, "filter_type": filter_type, "filter_value": filter_value})
                 
                 if st.checkbox("Text Cleaning"):
                     text_col = st.selectbox("Text Column", data.columns.tolist(), key="text_col")
@@ -256,7 +272,10 @@ with tabs[2]:
                         ["Remove HTML", "Remove URLs", "Remove Special Characters", "Lowercase", "Remove Extra Spaces", "Remove Stopwords"]
                     )
                     
-                    data = data_processor.clean_text(data, text_col, clean_options)
+                    steps.append({"step": "clean_text", "column": text_col, "clean_options": clean_options})
+            
+            if steps:
+                data = data_processor.run_pipeline(data, steps)
             
             # AI-assisted cleaning
             if st.checkbox("AI-Assisted Data Cleaning"):
@@ -279,26 +298,36 @@ with tabs[2]:
             
             # Export options
             st.write("Export Processed Data:")
-            export_format = st.selectbox("Export Format", ["CSV", "JSON", "Excel", "HTML", "SQL"])
+            export_format = st.selectbox("Export Format", ["CSV", "JSON", "NDJSON", "Excel", "Parquet", "Feather (Arrow IPC)", "HTML", "SQL"])
+            
+            if export_format in ("Parquet", "Feather (Arrow IPC)"):
+                compression = st.selectbox(
+                    "Compression",
+                    ["zstd", "snappy", "gzip", "none"] if export_format == "Parquet" else ["lz4", "zstd", "none"]
+                )
+                dictionary_encoding = st.checkbox("Dictionary-encode repeated values", value=True)
             
             if st.button("Export Data"):
                 with st.spinner("Preparing download..."):
-                    if export_format == "CSV":
-                        csv_data = data_processor.export_to_csv(data)
+                    if export_format in ("CSV", "JSON", "NDJSON"):
+                        # Stream the export chunk by chunk into a file that spills to
+                        # disk past 32 MB; Streamlit keeps only the finished bytes
+                        export_file = tempfile.SpooledTemporaryFile(max_size=32 * 1024 * 1024)
+                        if export_format == "CSV":
+                            data_processor.stream_csv(data, export_file)
+                            file_name, mime = "processed_data.csv", "text/csv"
+                        elif export_format == "JSON":
+                            data_processor.stream_json(data, export_file)
+                            file_name, mime = "processed_data.json", "application/json"
+                        else:
+                            data_processor.stream_ndjson(data, export_file)
+                            file_name, mime = "processed_data.ndjson", "application/x-ndjson"
+                        export_file.seek(0)
                         st.download_button(
-                            label="Download CSV",
-                            data=csv_data,
-                            file_name="processed_data.csv",
-                            mime="text/csv"
-                        )
-                    
-                    elif export_format == "JSON":
-                        json_data = data_processor.export_to_json(data)
-                        st.download_button(
-                            label="Download JSON",
-                            data=json_data,
-                            file_name="processed_data.json",
-                            mime="application/json"
+                            label=f"Download {export_format}",
+                            data=export_file.read(),
+                            file_name=file_name,
+                            mime=mime
                         )
                     
                     elif export_format == "Excel":
@@ -310,6 +339,28 @@ with tabs[2]:
                             mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
                         )
                     
+                    elif export_format == "Parquet":
+                        parquet_data = data_processor.export_to_parquet(
+                            data, compression=compression, dictionary=dictionary_encoding
+                        )
+                        st.download_button(
+                            label="Download Parquet",
+                            data=parquet_data,
+                            file_name="processed_data.parquet",
+                            mime="application/vnd.apache.parquet"
+                        )
+                    
+                    elif export_format == "Feather (Arrow IPC)":
+                        arrow_data = data_processor.export_to_arrow(
+                            data, compression=None if compression == "none" else compression, dictionary=dictionary_encoding
+                        )
+                        st.download_button(
+                            label="Download Feather",
+                            data=arrow_data,
+                            file_name="processed_data.feather",
+                            mime="application/vnd.apache.arrow.file"
+                        )
+                    
                     elif export_format == "HTML":
                         html_data = data_processor.export_to_html(data)
                         st.download_button(
@@ -358,7 +409,10 @@ with tabs[2]:
         
         # Upload data option
         st.write("Or upload data for processing:")
-        uploaded_file = st.file_uploader("Upload data file (CSV, JSON, Excel)", type=["csv", "json", "xlsx", "xls"])
+        uploaded_file = st.file_uploader(
+            "Upload data file (CSV, JSON, Excel, Parquet, Feather/Arrow)",
+            type=["csv", "json", "xlsx", "xls", "parquet", "feather", "arrow"]
+        )
         
         if uploaded_file is not None:
             try:
@@ -368,6 +422,10 @@ with tabs[2]:
                     data = pd.read_json(uploaded_file)
                 elif uploaded_file.name.endswith((".xlsx", ".xls")):
                     data = pd.read_excel(uploaded_file)
+                elif uploaded_file.name.endswith(".parquet"):
+                    data = data_processor.import_from_parquet(uploaded_file)
+                elif uploaded_file.name.endswith((".feather", ".arrow")):
+                    data = data_processor.import_from_arrow(uploaded_file)
                     
                 st.session_state.scraped_data = data
                 st.session_state.source_type = "upload"
@@ -676,6 +734,23 @@ with tabs[4]:
         else:
             st.info("No data available to summarize. Please scrape or process data first.")
 
+# Scraper timings, collected across reruns by the shared metrics collector
+with st.sidebar.expander("Scraper Timings"):
+    metrics = get_default_metrics()
+    timings = metrics.summary()
+    if timings.empty:
+        st.info("No scrapes timed yet.")
+    else:
+        st.dataframe(timings)
+        st.download_button(
+            "Download Prometheus Metrics",
+            metrics.to_prometheus(),
+            file_name="dataminer_metrics.prom",
+            mime="text/plain"
+        )
+        if st.button("Reset Timings"):
+            metrics.reset()
+
 # Footer
 st.markdown("---")
 st.markdown('<p style="text-align: center;">DataMiner AI - Developed with ❤️ using Streamlit</p>', unsafe_allow_html=True)
@@ -1,10 +1,15 @@
 # This file marks the directory as a Python package
-# Import key classes to make them directly accessible from the package
-from .web_scraper import WebScraper
-from .social_scraper import SocialMediaScraper
-from .ai_assistant import AIAssistant
-from .data_processor import DataProcessor
-from .visualizer import Visualizer
+# Key classes are accessible from the package; each is imported on first
+# access so importing one module does not load the dependencies of all others
+import importlib
+
+_EXPORTS = {
+    'WebScraper': '.web_scraper',
+    'SocialMediaScraper': '.social_scraper',
+    'AIAssistant': '.ai_assistant',
+    'DataProcessor': '.data_processor',
+    'Visualizer': '.visualizer',
+}
 
 __all__ = [
     'WebScraper',
@@ -13,3 +18,11 @@ __all__ = [
     'DataProcessor',
     'Visualizer'
 ]
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        value = getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -347,7 +347,7 @@ class AIAssistant:
         
         # Suggest type conversions
         for col, dtype in data.dtypes.items():
-            if dtype == 'object':
+            if pd.api.types.is_object_dtype(dtype) or pd.api.types.is_string_dtype(dtype):
                 sample_val = data[col].dropna().iloc[0] if not data[col].dropna().empty else ""
                 if isinstance(sample_val, str):
                     if sample_val.isdigit():
@@ -366,7 +366,7 @@ class AIAssistant:
                         })
         
         # Text cleaning for string columns
-        for col in data.select_dtypes(include=['object']).columns:
+        for col in data.select_dtypes(include=['object', 'string']).columns:
             operations.append({
                 "column": col,
                 "issue": "Text data may need cleaning",
@@ -489,7 +489,7 @@ class AIAssistant:
                     data_stats += f"\nNumeric column stats:\n{numeric_stats}\n\n"
                 
                 # Get categorical columns and counts
-                categorical_cols = data.select_dtypes(include=['object', 'category']).columns.tolist()
+                categorical_cols = data.select_dtypes(include=['object', 'string', 'category']).columns.tolist()
                 if categorical_cols and len(categorical_cols) < 10:  # Limit to avoid huge prompts
                     for col in categorical_cols[:3]:  # Limit to first 3 categorical columns
                         try:
@@ -559,7 +559,7 @@ class AIAssistant:
         
         # Basic visualization suggestions for DataFrame
         numeric_cols = data.select_dtypes(include=['number']).columns.tolist()
-        categorical_cols = data.select_dtypes(include=['object', 'category']).columns.tolist()
+        categorical_cols = data.select_dtypes(include=['object', 'string', 'category']).columns.tolist()
         datetime_cols = [col for col in data.columns if pd.api.types.is_datetime64_dtype(data[col])]
         
         suggestions = """
@@ -882,7 +882,7 @@ class AIAssistant:
                     pass
             
             # Get value counts for categorical columns
-            cat_cols = data.select_dtypes(include=['object', 'category']).columns.tolist()
+            cat_cols = data.select_dtypes(include=['object', 'string', 'category']).columns.tolist()
             if cat_cols and len(cat_cols) < 5:  # Limit to avoid huge prompts
                 for col in cat_cols[:2]:  # Limit to first 2 categorical columns
                     try:
@@ -5,28 +5,118 @@ import json
 import io
 import datetime
 import logging
-from bs4 import BeautifulSoup
+from contextlib import nullcontext
+from functools import partial, wraps
 from io import StringIO, BytesIO
-import nltk
-from nltk.corpus import stopwords
-from nltk.tokenize import word_tokenize
+from .dedup_index import DedupIndex
+from .text_cleaner import build_cleaner, clean_values, get_stopwords, remove_stopwords
+from .parallel import parallel_map
+from .pipeline import Pipeline
+from .frame_io import (
+    DEFAULT_CHUNK_ROWS, DEFAULT_EXPORT_ROWS, read_arrow, read_parquet, write_arrow, write_csv,
+    write_json, write_ndjson, write_parquet,
+)
+
+def _to_bool_values(values):
+    """Convert common true/false strings to booleans, leaving missing values as NaN"""
+    true_values = {'true', 'yes', 'y', '1', 'on', 't'}
+    false_values = {'false', 'no', 'n', '0', 'off', 'f'}
+    
+    def to_bool(val):
+        if pd.isna(val):
+            return np.nan
+        if isinstance(val, str):
+            val_lower = val.lower()
+            if val_lower in true_values:
+                return True
+            elif val_lower in false_values:
+                return False
+        return bool(val)
+    
+    return [to_bool(val) for val in values]
+
+def _with_copy_on_write(method):
+    """Run a DataProcessor method under the processor's Copy-on-Write scope"""
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._cow_scope():
+            return method(self, *args, **kwargs)
+    return wrapper
 
 class DataProcessor:
-    def __init__(self):
+    def __init__(self, workers=None, nltk_tokenize=False, copy_on_write=False, step_cache=None):
+        """
+        Args:
+            workers (int, optional): Processes for row-wise operations on large
+                columns; None uses parallel.get_default_workers(), 0 every core
+            nltk_tokenize (bool): Tokenize with NLTK's word_tokenize when removing
+                stopwords, matching its output exactly at a much higher cost
+            copy_on_write (bool): Run this processor's methods under pandas
+                Copy-on-Write, so the copies they return share every column they
+                do not modify. The setting is scoped to the calls and never
+                changed for the process; replace columns of the results rather
+                than writing into them in place unless Copy-on-Write is on globally
+            step_cache (StepCache, optional): Cache of pipeline step outputs, so
+                rerunning a pipeline only recomputes the steps that changed
+        """
         logging.basicConfig(level=logging.INFO)
         self.logger = logging.getLogger(__name__)
+        self.workers = workers
+        self.nltk_tokenize = nltk_tokenize
+        self.step_cache = step_cache
+        self.copy_on_write = copy_on_write
+    
+    def pipeline(self, steps):
+        """
+        Plan a list of processing steps to run as one pass.
         
-        # Initialize NLTK resources
-        try:
-            nltk.data.find('tokenizers/punkt')
-        except LookupError:
-            nltk.download('punkt', quiet=True)
+        Args:
+            steps (list): Step dicts naming a method of this class under "step"
+                plus its arguments, e.g. {"step": "clean_text", "column": "text",
+                "clean_options": ["Lowercase"]}
         
-        try:
-            nltk.data.find('corpora/stopwords')
-        except LookupError:
-            nltk.download('stopwords', quiet=True)
+        Returns:
+            Pipeline: Planned pipeline, applied to a DataFrame with run()
+        """
+        return Pipeline(steps, self)
+    
+    def run_pipeline(self, data, steps):
+        """
+        Apply a list of processing steps with a single planned pass.
+        
+        Gives the same result as calling the methods in order, with row
+        filters moved ahead where that does not change the outcome and at
+        most one copy of the data.
+        
+        Args:
+            data (pd.DataFrame): Input DataFrame
+            steps (list): Step dicts, see pipeline()
+        
+        Returns:
+            pd.DataFrame: Processed DataFrame
+        """
+        return self.pipeline(steps).run(data)
     
+    def process_file(self, source, destination, steps, chunksize=DEFAULT_CHUNK_ROWS, **options):
+        """
+        Apply a list of processing steps to a CSV, Parquet or Arrow IPC file chunk by chunk.
+        
+        Memory use is bounded by the chunk size rather than the file size, so
+        multi-GB archives can be processed on small workers.
+        
+        Args:
+            source (str): Input CSV, Parquet or Arrow IPC file
+            destination (str): Output CSV, Parquet or Arrow IPC file
+            steps (list): Step dicts, see pipeline()
+            chunksize (int): Rows read and processed at a time
+            options: Formats, compression and read options, see Pipeline.run_chunked
+            
+        Returns:
+            dict: Rows read and written, and the number of chunks
+        """
+        return self.pipeline(steps).run_chunked(source, destination, chunksize=chunksize, **options)
+    
+    @_with_copy_on_write
     def remove_duplicates(self, data):
         """
         Remove duplicate rows from DataFrame.
@@ -48,6 +138,7 @@ class DataProcessor:
         self.logger.info(f"Removed {removed} duplicate rows")
         return data
     
+    @_with_copy_on_write
     def remove_empty_rows(self, data):
         """
         Remove rows where all values are missing.
@@ -69,7 +160,33 @@ class DataProcessor:
         self.logger.info(f"Removed {removed} empty rows")
         return data
     
-    def fill_missing_values(self, data, method="Mean", fill_value=None):
+    def remove_cross_source_duplicates(self, data, url_columns=None, text_columns=None, index_path=None, drop_seen=False):
+        """
+        Collapse rows describing the same item scraped from different sources.
+        
+        Rows match when their links normalize to the same URL or their text
+        has a near-identical MinHash signature.
+        
+        Args:
+            data (pd.DataFrame): Input DataFrame
+            url_columns (list, optional): Columns holding the item link
+            text_columns (list, optional): Columns whose text is fingerprinted
+            index_path (str, optional): SQLite file persisting the index across runs,
+                e.g. dedup_index.DEFAULT_INDEX_PATH
+            drop_seen (bool): Also drop items recorded in the persisted index by earlier runs
+            
+        Returns:
+            pd.DataFrame: DataFrame keeping the first row of every item
+        """
+        if not isinstance(data, pd.DataFrame):
+            self.logger.warning("Data is not a DataFrame, cannot remove cross-source duplicates")
+            return data
+            
+        index = DedupIndex(path=index_path)
+        return index.deduplicate(data, url_columns=url_columns, text_columns=text_columns, drop_seen=drop_seen)
+    
+    @_with_copy_on_write
+    def fill_missing_values(self, data, method="Mean", fill_value=None, inplace=False):
         """
         Fill missing values in DataFrame.
         
@@ -77,43 +194,47 @@ class DataProcessor:
             data (pd.DataFrame): Input DataFrame
             method (str): Method to use for filling missing values
             fill_value: Custom value to use for filling
+            inplace (bool): Fill the input DataFrame itself instead of a copy
             
         Returns:
-            pd.DataFrame: DataFrame with missing values filled
+            pd.DataFrame: DataFrame with missing values filled, the input itself when inplace
         """
         if not isinstance(data, pd.DataFrame):
             self.logger.warning("Data is not a DataFrame, cannot fill missing values")
             return data
             
-        # Create a copy to avoid modifying the original
-        df = data.copy()
-        
+        return self._fill_missing(self._own(data, inplace), method, fill_value)
+    
+    def _fill_missing(self, df, method, fill_value):
+        """Fill missing values of a DataFrame the caller owns, returning the result"""
         # Apply the appropriate fill method
         if method == "Mean":
             # Only apply mean to numeric columns
             numeric_cols = df.select_dtypes(include=[np.number]).columns
             for col in numeric_cols:
-                df[col] = df[col].fillna(df[col].mean())
+                if df[col].hasnans:
+                    df[col] = df[col].fillna(df[col].mean())
                 
         elif method == "Median":
             # Only apply median to numeric columns
             numeric_cols = df.select_dtypes(include=[np.number]).columns
             for col in numeric_cols:
-                df[col] = df[col].fillna(df[col].median())
+                if df[col].hasnans:
+                    df[col] = df[col].fillna(df[col].median())
                 
         elif method == "Mode":
-            # Apply mode to all columns
+            # Apply mode to every column that has missing values
             for col in df.columns:
-                if not df[col].empty:
+                if df[col].hasnans:
                     mode_val = df[col].mode()
                     if not mode_val.empty:
                         df[col] = df[col].fillna(mode_val[0])
                 
         elif method == "Forward Fill":
-            df = df.ffill()
+            df.ffill(inplace=True)
                 
         elif method == "Backward Fill":
-            df = df.bfill()
+            df.bfill(inplace=True)
                 
         elif method == "Custom Value":
             # Try to convert fill_value to appropriate types
@@ -130,12 +251,16 @@ class DataProcessor:
                 # For other columns, use as is
                 non_numeric_cols = df.select_dtypes(exclude=[np.number]).columns
                 for col in non_numeric_cols:
+                    # Categorical columns only accept known categories
+                    if isinstance(df[col].dtype, pd.CategoricalDtype) and fill_value not in df[col].cat.categories:
+                        df[col] = df[col].cat.add_categories([fill_value])
                     df[col] = df[col].fillna(fill_value)
         
         self.logger.info(f"Filled missing values using method: {method}")
         return df
     
-    def convert_data_type(self, data, column, target_type):
+    @_with_copy_on_write
+    def convert_data_type(self, data, column, target_type, workers=None, inplace=False):
         """
         Convert a column to a specified data type.
         
@@ -143,9 +268,12 @@ class DataProcessor:
             data (pd.DataFrame): Input DataFrame
             column (str): Column name to convert
             target_type (str): Target data type
+            workers (int, optional): Processes for the row-wise Boolean conversion,
+                defaults to the processor's setting
+            inplace (bool): Replace the column in the input DataFrame instead of a copy
             
         Returns:
-            pd.DataFrame: DataFrame with converted column
+            pd.DataFrame: DataFrame with converted column, the input itself when inplace
         """
         if not isinstance(data, pd.DataFrame):
             self.logger.warning("Data is not a DataFrame, cannot convert data type")
@@ -155,9 +283,10 @@ class DataProcessor:
             self.logger.warning(f"Column '{column}' not found in data")
             return data
             
-        # Create a copy to avoid modifying the original
-        df = data.copy()
-        
+        return self._convert_column(self._own(data, inplace), column, target_type, workers)
+    
+    def _convert_column(self, df, column, target_type, workers=None):
+        """Convert a column of a DataFrame the caller owns, returning the result"""
         try:
             if target_type == "String":
                 df[column] = df[column].astype(str)
@@ -172,23 +301,9 @@ class DataProcessor:
                 
             elif target_type == "Boolean":
                 # Convert various string representations to boolean
-                if df[column].dtype == 'object':
-                    # Map common true/false strings
-                    true_values = ['true', 'yes', 'y', '1', 'on', 't']
-                    false_values = ['false', 'no', 'n', '0', 'off', 'f']
-                    
-                    def to_bool(val):
-                        if pd.isna(val):
-                            return np.nan
-                        if isinstance(val, str):
-                            val_lower = val.lower()
-                            if val_lower in true_values:
-                                return True
-                            elif val_lower in false_values:
-                                return False
-                        return bool(val)
-                    
-                    df[column] = df[column].apply(to_bool)
+                if pd.api.types.is_object_dtype(df[column]) or pd.api.types.is_string_dtype(df[column]):
+                    values = parallel_map(_to_bool_values, df[column].tolist(), workers=self._workers(workers))
+                    df[column] = pd.Series(values, index=df.index)
                 else:
                     df[column] = df[column].astype(bool)
                 
@@ -202,6 +317,7 @@ class DataProcessor:
             
         return df
     
+    @_with_copy_on_write
     def filter_data(self, data, column, filter_type, filter_value):
         """
         Filter DataFrame based on condition.
@@ -223,68 +339,69 @@ class DataProcessor:
             self.logger.warning(f"Column '{column}' not found in data")
             return data
             
-        # Create a copy to avoid modifying the original
-        df = data.copy()
+        mask = self._filter_mask(data, column, filter_type, filter_value)
+        if mask is None:
+            # Nothing filtered, still hand back a copy the caller may modify
+            return self._own(data)
+        
+        # take() copies the selected rows into a new frame instead of a view
+        df = data.take(np.flatnonzero(mask))
+        
+        self.logger.info(f"Filtered data on column '{column}' using {filter_type}: {filter_value}")
+        self.logger.info(f"Filtered from {len(data)} to {len(df)} rows")
+        return df
+    
+    def _filter_mask(self, df, column, filter_type, filter_value):
+        """
+        Compute the rows a filter keeps without selecting them.
+        
+        Returns:
+            np.ndarray or None: Boolean mask, or None when the filter does not apply
+        """
+        mask = None
         
         try:
             if filter_type == "Contains":
                 mask = df[column].astype(str).str.contains(filter_value, case=False, na=False)
-                df = df[mask]
                 
             elif filter_type == "Equals":
                 # Try to match type with column
                 if pd.api.types.is_numeric_dtype(df[column]):
                     try:
                         value = float(filter_value)
-                        df = df[df[column] == value]
+                        mask = df[column] == value
                     except (ValueError, TypeError):
-                        df = df[df[column].astype(str) == filter_value]
+                        mask = df[column].astype(str) == filter_value
                 else:
-                    df = df[df[column].astype(str) == filter_value]
+                    mask = df[column].astype(str) == filter_value
                 
-            elif filter_type == "Greater Than":
+            elif filter_type in ("Greater Than", "Less Than"):
                 # Only works for numeric columns
                 if pd.api.types.is_numeric_dtype(df[column]):
-                    try:
-                        value = float(filter_value)
-                        df = df[df[column] > value]
-                    except (ValueError, TypeError):
-                        self.logger.warning(f"Cannot compare non-numeric value '{filter_value}' with 'Greater Than'")
+                    numeric_col = df[column]
+                    message = f"Cannot compare non-numeric value '{filter_value}' with '{filter_type}'"
                 else:
                     # Try to convert column to numeric
                     numeric_col = pd.to_numeric(df[column], errors='coerce')
-                    try:
-                        value = float(filter_value)
-                        df = df[numeric_col > value]
-                    except (ValueError, TypeError):
-                        self.logger.warning(f"Column '{column}' contains non-numeric data, cannot use 'Greater Than'")
-                
-            elif filter_type == "Less Than":
-                # Only works for numeric columns
-                if pd.api.types.is_numeric_dtype(df[column]):
-                    try:
-                        value = float(filter_value)
-                        df = df[df[column] < value]
-                    except (ValueError, TypeError):
-                        self.logger.warning(f"Cannot compare non-numeric value '{filter_value}' with 'Less Than'")
-                else:
-                    # Try to convert column to numeric
-                    numeric_col = pd.to_numeric(df[column], errors='coerce')
-                    try:
-                        value = float(filter_value)
-                        df = df[numeric_col < value]
-                    except (ValueError, TypeError):
-                        self.logger.warning(f"Column '{column}' contains non-numeric data, cannot use 'Less Than'")
+                    message = f"Column '{column}' contains non-numeric data, cannot use '{filter_type}'"
+                try:
+                    value = float(filter_value)
+                    mask = numeric_col > value if filter_type == "Greater Than" else numeric_col < value
+                except (ValueError, TypeError):
+                    self.logger.warning(message)
             
-            self.logger.info(f"Filtered data on column '{column}' using {filter_type}: {filter_value}")
-            self.logger.info(f"Filtered from {len(data)} to {len(df)} rows")
+            if mask is not None:
+                # Missing comparison results count as not matching
+                mask = mask.to_numpy(dtype=bool, na_value=False)
             
         except Exception as e:
             self.logger.error(f"Error filtering data: {str(e)}")
+            mask = None
             
-        return df
+        return mask
     
-    def clean_text(self, data, column, clean_options):
+    @_with_copy_on_write
+    def clean_text(self, data, column, clean_options, workers=None, inplace=False):
         """
         Clean text in specified column.
         
@@ -292,9 +409,12 @@ class DataProcessor:
             data (pd.DataFrame): Input DataFrame
             column (str): Column to clean
             clean_options (list): Text cleaning options
+            workers (int, optional): Processes to clean large columns with,
+                defaults to the processor's setting
+            inplace (bool): Replace the column in the input DataFrame instead of a copy
             
         Returns:
-            pd.DataFrame: DataFrame with cleaned text
+            pd.DataFrame: DataFrame with cleaned text, the input itself when inplace
         """
         if not isinstance(data, pd.DataFrame):
             self.logger.warning("Data is not a DataFrame, cannot clean text")
@@ -304,40 +424,24 @@ class DataProcessor:
             self.logger.warning(f"Column '{column}' not found in data")
             return data
             
-        # Create a copy to avoid modifying the original
-        df = data.copy()
-        
+        return self._clean_column(self._own(data, inplace), column, clean_options, workers)
+    
+    def _clean_column(self, df, column, clean_options, workers=None):
+        """Clean a text column of a DataFrame the caller owns, returning the result"""
         try:
             # Convert column to string if it's not already
-            df[column] = df[column].astype(str)
-            
-            # Apply selected cleaning options
-            for option in clean_options:
-                if option == "Remove HTML":
-                    df[column] = df[column].apply(lambda x: BeautifulSoup(x, "html.parser").get_text())
-                    
-                elif option == "Remove URLs":
-                    url_pattern = r'https?://\S+|www\.\S+'
-                    df[column] = df[column].apply(lambda x: re.sub(url_pattern, '', x))
-                    
-                elif option == "Remove Special Characters":
-                    df[column] = df[column].apply(lambda x: re.sub(r'[^\w\s]', '', x))
-                    
-                elif option == "Lowercase":
-                    df[column] = df[column].str.lower()
-                    
-                elif option == "Remove Extra Spaces":
-                    df[column] = df[column].apply(lambda x: re.sub(r'\s+', ' ', x).strip())
-                    
-                elif option == "Remove Stopwords":
-                    stop_words = set(stopwords.words('english'))
-                    
-                    def remove_stopwords(text):
-                        tokens = word_tokenize(text)
-                        filtered_tokens = [word for word in tokens if word.lower() not in stop_words]
-                        return ' '.join(filtered_tokens)
-                    
-                    df[column] = df[column].apply(remove_stopwords)
+            values = df[column].astype(str)
+            
+            # All options are fused into one pass over the column, split
+            # across worker processes for large columns
+            cleaned = parallel_map(
+                clean_values,
+                values.tolist(),
+                workers=self._workers(workers),
+                clean_options=clean_options,
+                stopword_filter=self._stopword_filter(clean_options),
+            )
+            df[column] = pd.Series(cleaned, index=df.index, dtype=object)
             
             self.logger.info(f"Cleaned text in column '{column}' with options: {', '.join(clean_options)}")
             
@@ -363,29 +467,9 @@ class DataProcessor:
         processed_text = text
         
         try:
-            # Apply selected cleaning options
-            for option in clean_options:
-                if option == "Remove HTML":
-                    processed_text = BeautifulSoup(processed_text, "html.parser").get_text()
-                    
-                elif option == "Remove URLs":
-                    url_pattern = r'https?://\S+|www\.\S+'
-                    processed_text = re.sub(url_pattern, '', processed_text)
-                    
-                elif option == "Remove Special Characters":
-                    processed_text = re.sub(r'[^\w\s]', '', processed_text)
-                    
-                elif option == "Lowercase":
-                    processed_text = processed_text.lower()
-                    
-                elif option == "Remove Extra Spaces":
-                    processed_text = re.sub(r'\s+', ' ', processed_text).strip()
-                    
-                elif option == "Remove Stopwords":
-                    stop_words = set(stopwords.words('english'))
-                    tokens = word_tokenize(processed_text)
-                    filtered_tokens = [word for word in tokens if word.lower() not in stop_words]
-                    processed_text = ' '.join(filtered_tokens)
+            cleaner = build_cleaner(clean_options, self._stopword_filter(clean_options))
+            if cleaner is not None:
+                processed_text = cleaner(processed_text)
             
             self.logger.info(f"Processed text with options: {', '.join(clean_options)}")
             
@@ -394,6 +478,37 @@ class DataProcessor:
             
         return processed_text
     
+    def _stopword_filter(self, clean_options):
+        """Return a picklable stopword remover when "Remove Stopwords" is selected"""
+        if "Remove Stopwords" not in clean_options:
+            return None
+        
+        return partial(remove_stopwords, stop_words=get_stopwords('english'), nltk_compatible=self.nltk_tokenize)
+    
+    def _cow_scope(self):
+        """Context turning on pandas Copy-on-Write for this processor's work only"""
+        if self.copy_on_write:
+            return pd.option_context('mode.copy_on_write', True)
+        return nullcontext()
+    
+    def _own(self, data, inplace=False):
+        """
+        Return a DataFrame a method may modify without touching the caller's data.
+        
+        With pandas Copy-on-Write on, a shallow copy is enough: its columns are
+        shared with the input until written, so only modified columns are
+        materialized. Otherwise every column is copied up front.
+        """
+        if inplace:
+            return data
+        if pd.options.mode.copy_on_write is True:
+            return data.copy(deep=False)
+        return data.copy()
+    
+    def _workers(self, workers):
+        """Resolve a per-call workers setting against the processor's and the global default"""
+        return workers if workers is not None else self.workers
+    
     def export_to_csv(self, data):
         """
         Export DataFrame to CSV.
@@ -413,7 +528,7 @@ class DataProcessor:
         
         try:
             csv_buffer = StringIO()
-            data.to_csv(csv_buffer, index=False)
+            write_csv(data, csv_buffer)
             csv_data = csv_buffer.getvalue()
             
             self.logger.info(f"Exported data to CSV, size: {len(csv_data)} bytes")
@@ -441,15 +556,10 @@ class DataProcessor:
                 data = pd.DataFrame({'content': [str(data)]})
         
         try:
-            # Handle non-serializable objects (like dates)
-            def json_serial(obj):
-                if isinstance(obj, (datetime.datetime, datetime.date)):
-                    return obj.isoformat()
-                raise TypeError(f"Type {type(obj)} not serializable")
-            
-            # Convert to records format and handle NaN values
-            records = data.replace({np.nan: None}).to_dict(orient='records')
-            json_data = json.dumps(records, default=json_serial, indent=2)
+            # Records are converted and serialized a chunk at a time
+            json_buffer = StringIO()
+            write_json(data, json_buffer, indent=2)
+            json_data = json_buffer.getvalue()
             
             self.logger.info(f"Exported data to JSON, size: {len(json_data)} bytes")
             return json_data
@@ -458,6 +568,71 @@ class DataProcessor:
             self.logger.error(f"Error exporting to JSON: {str(e)}")
             return json.dumps({"error": f"Failed to export data to JSON: {str(e)}"})
     
+    def stream_csv(self, data, sink, chunk_rows=DEFAULT_EXPORT_ROWS):
+        """
+        Write DataFrame as CSV to a file-like object, one chunk at a time.
+        
+        Unlike export_to_csv, the output is never held in memory as a whole,
+        so large frames can be written straight to a file, socket or response.
+        
+        Args:
+            data (pd.DataFrame): DataFrame to export
+            sink (file-like): Text or binary file-like object to write to
+            chunk_rows (int): Rows serialized at a time
+            
+        Returns:
+            int: Number of rows written
+        """
+        return self._stream(write_csv, "CSV", data, sink, chunk_rows=chunk_rows)
+    
+    def stream_json(self, data, sink, chunk_rows=DEFAULT_EXPORT_ROWS, indent=2):
+        """
+        Write DataFrame as a JSON array of records to a file-like object, one chunk at a time.
+        
+        Args:
+            data (pd.DataFrame): DataFrame to export
+            sink (file-like): Text or binary file-like object to write to
+            chunk_rows (int): Rows serialized at a time
+            indent (int, optional): Indent of the records, None for compact output
+            
+        Returns:
+            int: Number of rows written
+        """
+        return self._stream(write_json, "JSON", data, sink, chunk_rows=chunk_rows, indent=indent)
+    
+    def stream_ndjson(self, data, sink, chunk_rows=DEFAULT_EXPORT_ROWS):
+        """
+        Write DataFrame as newline-delimited JSON to a file-like object, one chunk at a time.
+        
+        Args:
+            data (pd.DataFrame): DataFrame to export
+            sink (file-like): Text or binary file-like object to write to
+            chunk_rows (int): Rows serialized at a time
+            
+        Returns:
+            int: Number of rows written
+        """
+        return self._stream(write_ndjson, "NDJSON", data, sink, chunk_rows=chunk_rows)
+    
+    def _stream(self, writer, label, data, sink, **options):
+        """Run a streaming writer, converting non-DataFrame data like the exports do"""
+        if not isinstance(data, pd.DataFrame):
+            self.logger.warning(f"Data is not a DataFrame, converting for {label} export")
+            try:
+                data = pd.DataFrame([data])
+            except:
+                data = pd.DataFrame({'content': [str(data)]})
+        
+        try:
+            writer(data, sink, **options)
+        except Exception as e:
+            # Part of the output may already be written, so the caller must know
+            self.logger.error(f"Error streaming {label}: {str(e)}")
+            raise
+        
+        self.logger.info(f"Streamed {len(data)} rows as {label}")
+        return len(data)
+    
     def export_to_excel(self, data):
         """
         Export DataFrame to Excel.
@@ -498,6 +673,99 @@ class DataProcessor:
             self.logger.error(f"Error exporting to Excel: {str(e)}")
             return b"Error: Failed to export data to Excel"
     
+    def export_to_parquet(self, data, compression='zstd', dictionary=True):
+        """
+        Export DataFrame to Parquet.
+        
+        Args:
+            data (pd.DataFrame): DataFrame to export
+            compression (str): Codec, e.g. "zstd", "snappy", "gzip" or "none"
+            dictionary (bool or list): Dictionary-encode all columns, none, or the named ones
+            
+        Returns:
+            bytes: Parquet data as bytes
+        """
+        if not isinstance(data, pd.DataFrame):
+            self.logger.warning("Data is not a DataFrame, converting for Parquet export")
+            try:
+                data = pd.DataFrame([data])
+            except:
+                data = pd.DataFrame({'content': [str(data)]})
+        
+        try:
+            parquet_buffer = BytesIO()
+            write_parquet(data, parquet_buffer, compression=compression, dictionary=dictionary)
+            parquet_data = parquet_buffer.getvalue()
+            
+            self.logger.info(f"Exported data to Parquet, size: {len(parquet_data)} bytes")
+            return parquet_data
+            
+        except Exception as e:
+            self.logger.error(f"Error exporting to Parquet: {str(e)}")
+            return b"Error: Failed to export data to Parquet"
+    
+    def export_to_arrow(self, data, compression='lz4', dictionary=True):
+        """
+        Export DataFrame to an Arrow IPC file, which Feather readers also accept.
+        
+        Args:
+            data (pd.DataFrame): DataFrame to export
+            compression (str, optional): "lz4", "zstd" or None
+            dictionary (bool or list): Dictionary-encode repetitive string columns,
+                none, or the named ones
+            
+        Returns:
+            bytes: Arrow IPC data as bytes
+        """
+        if not isinstance(data, pd.DataFrame):
+            self.logger.warning("Data is not a DataFrame, converting for Arrow export")
+            try:
+                data = pd.DataFrame([data])
+            except:
+                data = pd.DataFrame({'content': [str(data)]})
+        
+        try:
+            arrow_buffer = BytesIO()
+            write_arrow(data, arrow_buffer, compression=compression, dictionary=dictionary)
+            arrow_data = arrow_buffer.getvalue()
+            
+            self.logger.info(f"Exported data to Arrow IPC, size: {len(arrow_data)} bytes")
+            return arrow_data
+            
+        except Exception as e:
+            self.logger.error(f"Error exporting to Arrow IPC: {str(e)}")
+            return b"Error: Failed to export data to Arrow IPC"
+    
+    def import_from_parquet(self, source, columns=None):
+        """
+        Load a DataFrame from Parquet.
+        
+        Args:
+            source (str, bytes or file-like): Parquet file, e.g. an uploaded file
+            columns (list, optional): Columns to read, all by default
+            
+        Returns:
+            pd.DataFrame: Loaded DataFrame
+        """
+        data = read_parquet(source, columns=columns)
+        self.logger.info(f"Imported {len(data)} rows from Parquet")
+        return data
+    
+    def import_from_arrow(self, source, columns=None):
+        """
+        Load a DataFrame from an Arrow IPC file or stream, including Feather files.
+        
+        Args:
+            source (str, bytes or file-like): Arrow file, e.g. an uploaded file
+            columns (list, optional): Columns to read, all by default
+            
+        Returns:
+            pd.DataFrame: Loaded DataFrame
+        """
+        data = read_arrow(source, columns=columns)
+        self.logger.info(f"Imported {len(data)} rows from Arrow IPC")
+        return data
+    
     def export_to_html(self, data):
         """
         Export DataFrame to HTML.
@@ -614,8 +882,11 @@ class DataProcessor:
             # Map pandas dtypes to SQL types
             type_map = {
                 'int64': 'INTEGER',
+                'Int64': 'INTEGER',
                 'float64': 'REAL',
+                'Float64': 'REAL',
                 'bool': 'BOOLEAN',
+                'boolean': 'BOOLEAN',
                 'datetime64[ns]': 'TIMESTAMP',
                 'object': 'TEXT'
             }
@@ -0,0 +1,261 @@
+import os
+import re
+import hashlib
+import logging
+import sqlite3
+import numpy as np
+import pandas as pd
+from collections import defaultdict
+from datetime import datetime
+from functools import lru_cache
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+DEFAULT_INDEX_PATH = os.path.join(os.path.expanduser("~"), ".dataminer", "dedup_index.sqlite")
+
+# Columns searched, in order, for an item's link and text
+URL_COLUMNS = ['url', 'link', 'permalink', 'hn_link']
+TEXT_COLUMNS = ['title', 'video_title', 'content', 'selftext', 'body', 'text']
+
+# Query parameters that only track the referrer and never change the content
+TRACKING_PARAMS = {'fbclid', 'gclid', 'ref', 'ref_src', 'source', 'igshid', 'si'}
+
+MINHASH_PERMUTATIONS = 32
+MINHASH_BANDS = 8
+BAND_ROWS = MINHASH_PERMUTATIONS // MINHASH_BANDS
+MIN_TOKENS = 4
+
+TOKEN_PATTERN = re.compile(r'\w+')
+
+# Odd multipliers and offsets of the multiply-add hash family used as permutations
+_rng = np.random.default_rng(20240601)
+PERMUTATION_MULTIPLIERS = _rng.integers(1, 2 ** 63, size=MINHASH_PERMUTATIONS, dtype=np.uint64) * np.uint64(2) + np.uint64(1)
+PERMUTATION_OFFSETS = _rng.integers(0, 2 ** 63, size=MINHASH_PERMUTATIONS, dtype=np.uint64)
+
+
+def normalize_url(url):
+    """
+    Reduce a URL to a canonical key.
+
+    The scheme, "www." prefix, fragment, trailing slash, tracking parameters
+    and query parameter order are ignored, so the same story linked from
+    different sources maps to the same key.
+    """
+    if not isinstance(url, str) or not url.strip():
+        return None
+
+    parts = urlsplit(url.strip())
+    if not parts.netloc:
+        return None
+
+    host = parts.netloc.lower()
+    if host.startswith('www.'):
+        host = host[4:]
+
+    query = [
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if key.lower() not in TRACKING_PARAMS and not key.lower().startswith('utm_')
+    ]
+    path = parts.path.rstrip('/') or '/'
+
+    return urlunsplit(('', host, path, urlencode(sorted(query)), ''))[2:]
+
+
+@lru_cache(maxsize=200000)
+def _token_hash(token):
+    return int.from_bytes(hashlib.blake2b(token.encode('utf-8'), digest_size=8).digest(), 'little')
+
+
+def minhash(text):
+    """
+    Compute the MinHash signature of a text's word set.
+
+    The fraction of equal positions in two signatures estimates the Jaccard
+    similarity of the texts. Returns None for texts too short to fingerprint
+    reliably.
+    """
+    if not isinstance(text, str):
+        return None
+
+    tokens = set(TOKEN_PATTERN.findall(text.lower()))
+    if len(tokens) < MIN_TOKENS:
+        return None
+
+    hashes = np.fromiter((_token_hash(token) for token in tokens), dtype=np.uint64, count=len(tokens))
+    with np.errstate(over='ignore'):
+        permuted = hashes[:, None] * PERMUTATION_MULTIPLIERS + PERMUTATION_OFFSETS
+
+    return permuted.min(axis=0)
+
+
+def _bands(signature):
+    """Split a signature into MINHASH_BANDS hashable bands"""
+    return [signature[band * BAND_ROWS:(band + 1) * BAND_ROWS].tobytes() for band in range(MINHASH_BANDS)]
+
+
+class DedupIndex:
+    """
+    Content-fingerprint index for collapsing the same item seen from several sources.
+
+    Each item is keyed by its normalized URL and the MinHash signature of its
+    text. Signatures are bucketed by band (locality-sensitive hashing), so a
+    lookup only compares against items sharing a whole band, which keeps
+    deduplication near-linear. Pass a path to persist the index in a local
+    SQLite file across runs.
+    """
+
+    def __init__(self, path=None, threshold=0.7):
+        logging.basicConfig(level=logging.INFO)
+        self.logger = logging.getLogger(__name__)
+        self.path = path
+        self.threshold = threshold
+
+        self._urls = {}
+        self._signatures = []
+        self._bands = [defaultdict(list) for _ in range(MINHASH_BANDS)]
+        self._saved = 0
+
+        if self.path:
+            self._load()
+
+    def __len__(self):
+        return len(self._signatures)
+
+    def lookup(self, url_key, signature):
+        """
+        Find an indexed item matching a URL key or a near-identical text signature.
+
+        Returns:
+            int or None: Entry number of the match
+        """
+        if url_key is not None and url_key in self._urls:
+            return self._urls[url_key]
+
+        if signature is None:
+            return None
+
+        checked = set()
+        for band, value in enumerate(_bands(signature)):
+            for entry in self._bands[band].get(value, ()):
+                if entry in checked:
+                    continue
+                checked.add(entry)
+                if np.mean(self._signatures[entry][1] == signature) >= self.threshold:
+                    return entry
+
+        return None
+
+    def add(self, url_key, signature):
+        """Add an item and return its entry number"""
+        entry = len(self._signatures)
+        self._signatures.append((url_key, signature))
+
+        if url_key is not None:
+            self._urls.setdefault(url_key, entry)
+        if signature is not None:
+            for band, value in enumerate(_bands(signature)):
+                self._bands[band][value].append(entry)
+
+        return entry
+
+    def deduplicate(self, data, url_columns=None, text_columns=None, drop_seen=False, known_before=None):
+        """
+        Remove rows describing the same item.
+
+        Args:
+            data (pd.DataFrame): Input DataFrame, e.g. combined social and web results
+            url_columns (list, optional): Columns holding the item link, first non-empty wins
+            text_columns (list, optional): Columns whose text is fingerprinted
+            drop_seen (bool): Also drop rows already indexed by an earlier run
+            known_before (int, optional): Number of entries indexed by earlier runs,
+                when part of the current run was deduplicated by earlier calls
+
+        Returns:
+            pd.DataFrame: DataFrame keeping the first row of every item
+        """
+        url_columns = [col for col in (url_columns or URL_COLUMNS) if col in data.columns]
+        text_columns = [col for col in (text_columns or TEXT_COLUMNS) if col in data.columns]
+
+        if not url_columns and not text_columns:
+            self.logger.warning("No URL or text columns found, nothing to deduplicate")
+            return data
+
+        urls = self._first_non_empty(data, url_columns)
+        texts = self._joined_text(data, text_columns)
+
+        if known_before is None:
+            known_before = len(self._signatures)
+        keep = np.ones(len(data), dtype=bool)
+
+        for position, (url, text) in enumerate(zip(urls, texts)):
+            url_key = normalize_url(url)
+            signature = minhash(text)
+            if url_key is None and signature is None:
+                continue
+
+            match = self.lookup(url_key, signature)
+            if match is None:
+                self.add(url_key, signature)
+            elif match >= known_before or drop_seen:
+                keep[position] = False
+
+        if self.path:
+            self.save()
+
+        self.logger.info(f"Removed {int((~keep).sum())} cross-source duplicate rows")
+        return data[keep]
+
+    def save(self):
+        """Append entries added since the last save to the SQLite file"""
+        new_entries = self._signatures[self._saved:]
+        if not new_entries:
+            return
+
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            with sqlite3.connect(self.path) as connection:
+                connection.execute(
+                    "CREATE TABLE IF NOT EXISTS fingerprints (url_key TEXT, signature BLOB, first_seen TEXT)"
+                )
+                now = datetime.now().isoformat()
+                connection.executemany(
+                    "INSERT INTO fingerprints (url_key, signature, first_seen) VALUES (?, ?, ?)",
+                    [
+                        (url_key, None if signature is None else signature.tobytes(), now)
+                        for url_key, signature in new_entries
+                    ],
+                )
+            self._saved = len(self._signatures)
+        except (OSError, sqlite3.Error) as e:
+            self.logger.warning(f"Could not write dedup index: {str(e)}")
+
+    def _load(self):
+        """Rebuild the in-memory buckets from the SQLite file, ignoring it if missing or corrupt"""
+        if not os.path.exists(self.path):
+            return
+
+        try:
+            with sqlite3.connect(self.path) as connection:
+                rows = connection.execute("SELECT url_key, signature FROM fingerprints ORDER BY rowid").fetchall()
+        except sqlite3.Error as e:
+            self.logger.warning(f"Could not read dedup index: {str(e)}")
+            return
+
+        for url_key, signature in rows:
+            self.add(url_key, None if signature is None else np.frombuffer(signature, dtype=np.uint64))
+
+        self._saved = len(self._signatures)
+
+    def _first_non_empty(self, data, columns):
+        """Return the first non-empty value across columns for each row"""
+        result = pd.Series([None] * len(data), index=data.index, dtype=object)
+        for col in reversed(columns):
+            values = data[col].astype(object)
+            present = values.notna() & (values.astype(str).str.strip() != '')
+            result = result.where(~present, values)
+        return result
+
+    def _joined_text(self, data, columns):
+        """Concatenate the text columns of each row"""
+        if not columns:
+            return pd.Series([None] * len(data), index=data.index, dtype=object)
+        return data[columns].astype(object).fillna('').astype(str).agg(' '.join, axis=1)
@@ -0,0 +1,483 @@
+import io
+import os
+import bz2
+import gzip
+import json
+import lzma
+import logging
+import numpy as np
+import pandas as pd
+from datetime import date, datetime
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.parquet as pq
+    ARROW_AVAILABLE = True
+except ImportError:
+    ARROW_AVAILABLE = False
+
+# Rows read and processed at a time by out-of-core runs
+DEFAULT_CHUNK_ROWS = 100000
+
+# File extensions of each supported format, compressed CSV included
+FORMAT_EXTENSIONS = {
+    'csv': ('.csv', '.csv.gz', '.csv.bz2', '.csv.xz'),
+    'parquet': ('.parquet', '.pq'),
+    'arrow': ('.arrow', '.feather', '.ipc'),
+}
+
+# String columns with at most this share of distinct values are
+# dictionary-encoded in Arrow IPC output
+DICTIONARY_MAX_RATIO = 0.5
+
+# Rows serialized at a time by the streaming CSV and JSON writers
+DEFAULT_EXPORT_ROWS = 50000
+
+# Openers of compressed CSV output by extension
+CSV_OPENERS = {'.gz': gzip.open, '.bz2': bz2.open, '.xz': lzma.open}
+
+logger = logging.getLogger(__name__)
+
+
+def detect_format(path, format=None):
+    """
+    Return the format of a file, from its extension when not given.
+
+    Raises:
+        ValueError: If the format is not supported or cannot be told from the path
+    """
+    if format:
+        format = format.lower()
+        if format not in FORMAT_EXTENSIONS:
+            raise ValueError(f"Unsupported format: {format}")
+        return format
+
+    lowered = str(path).lower()
+    for name, extensions in FORMAT_EXTENSIONS.items():
+        if lowered.endswith(extensions):
+            return name
+    raise ValueError(f"Cannot tell the format of '{path}', pass it explicitly")
+
+
+def _require_arrow(purpose):
+    if not ARROW_AVAILABLE:
+        raise ImportError(f"{purpose} requires pyarrow. Install it with `pip install pyarrow`.")
+
+
+def _arrow_source(source):
+    """Open a path, bytes or file-like object for reading with pyarrow"""
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return pa.BufferReader(source)
+    if isinstance(source, (str, os.PathLike)):
+        return pa.memory_map(os.fspath(source))
+    return source
+
+
+def _to_table(data):
+    return pa.Table.from_pandas(data, preserve_index=False)
+
+
+def dictionary_encode(table, columns=True):
+    """
+    Dictionary-encode string columns of an Arrow table.
+
+    Args:
+        table (pa.Table): Table to encode
+        columns (bool or list): True encodes every string column with at most
+            DICTIONARY_MAX_RATIO distinct values, a list the named columns
+
+    Returns:
+        pa.Table: Table sharing one dictionary per encoded column
+    """
+    if not columns:
+        return table
+
+    for position, field in enumerate(table.schema):
+        if not (pa.types.is_string(field.type) or pa.types.is_large_string(field.type)):
+            continue
+        if columns is not True and field.name not in columns:
+            continue
+
+        column = table.column(position)
+        if columns is True and len(column) and pc.count_distinct(column).as_py() > DICTIONARY_MAX_RATIO * len(column):
+            continue
+        table = table.set_column(position, field.name, column.dictionary_encode())
+
+    return table.unify_dictionaries()
+
+
+def _decode_dictionaries(table):
+    """
+    Turn dictionary columns written by dictionary_encode back into strings.
+
+    Columns that were categorical in pandas stay dictionaries and are read as
+    categoricals; files without pandas metadata are left untouched.
+    """
+    metadata = table.schema.pandas_metadata
+    if not metadata:
+        return table
+
+    categorical = {column['name'] for column in metadata.get('columns', []) if column.get('pandas_type') == 'categorical'}
+    for position, field in enumerate(table.schema):
+        if pa.types.is_dictionary(field.type) and field.name not in categorical:
+            table = table.set_column(position, field.name, table.column(position).cast(field.type.value_type))
+    return table
+
+
+def write_parquet(data, sink, compression='zstd', dictionary=True):
+    """
+    Write a DataFrame as Parquet.
+
+    Args:
+        data (pd.DataFrame): DataFrame to write, without its index
+        sink (str or file-like): Destination path or binary file object
+        compression (str): Codec, e.g. "zstd", "snappy", "gzip" or "none"
+        dictionary (bool or list): Dictionary-encode all columns, none, or the named ones
+    """
+    _require_arrow("Parquet output")
+    pq.write_table(_to_table(data), sink, compression=compression, use_dictionary=dictionary)
+
+
+def write_arrow(data, sink, compression='lz4', dictionary=True):
+    """
+    Write a DataFrame as an Arrow IPC file, readable as Feather (version 2).
+
+    Args:
+        data (pd.DataFrame): DataFrame to write, without its index
+        sink (str or file-like): Destination path or binary file object
+        compression (str, optional): "lz4", "zstd" or None
+        dictionary (bool or list): See dictionary_encode
+    """
+    _require_arrow("Arrow output")
+    table = dictionary_encode(_to_table(data), dictionary)
+    options = pa.ipc.IpcWriteOptions(compression=compression)
+    with pa.ipc.new_file(sink, table.schema, options=options) as writer:
+        writer.write_table(table)
+
+
+def read_parquet(source, columns=None):
+    """Read a Parquet path, bytes or file-like object into a DataFrame"""
+    _require_arrow("Parquet input")
+    return pq.read_table(_arrow_source(source), columns=columns).to_pandas()
+
+
+def read_arrow(source, columns=None):
+    """Read an Arrow IPC file or stream (including Feather) into a DataFrame"""
+    _require_arrow("Arrow input")
+    source = _arrow_source(source)
+
+    try:
+        table = pa.ipc.open_file(source).read_all()
+    except pa.ArrowInvalid:
+        # Not the file format, try the stream format from the start
+        source.seek(0)
+        table = pa.ipc.open_stream(source).read_all()
+
+    if columns is not None:
+        table = table.select(columns)
+    return _decode_dictionaries(table).to_pandas()
+
+
+def json_default(value):
+    """Serialize the values json cannot: dates as ISO 8601, numpy scalars as Python ones"""
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, pd.Timedelta):
+        return str(value)
+    raise TypeError(f"Type {type(value)} not serializable")
+
+
+class _EncodingWriter:
+    """Lets text be written to a binary file-like object, e.g. a socket file or response body"""
+
+    def __init__(self, sink, encoding='utf-8'):
+        self.sink = sink
+        self.encoding = encoding
+
+    def write(self, text):
+        self.sink.write(text.encode(self.encoding))
+        return len(text)
+
+
+def _text_sink(sink):
+    """Return something text can be written to, for text and binary sinks alike"""
+    return sink if isinstance(sink, io.TextIOBase) else _EncodingWriter(sink)
+
+
+def _iter_chunks(data, chunk_rows):
+    for start in range(0, len(data), chunk_rows):
+        yield data.iloc[start:start + chunk_rows]
+
+
+def _records(chunk):
+    """Convert a chunk to a list of dicts, missing values of any dtype as None"""
+    return chunk.astype(object).where(chunk.notna(), None).to_dict(orient='records')
+
+
+def write_csv(data, sink, chunk_rows=DEFAULT_EXPORT_ROWS, **to_csv_options):
+    """
+    Write a DataFrame as CSV, chunk by chunk, to a text or binary file-like object.
+
+    Only one chunk is serialized at a time, so the extra memory is bounded
+    by chunk_rows whatever the size of the frame.
+
+    Args:
+        data (pd.DataFrame): DataFrame to write, without its index
+        sink (file-like): Open file, socket file, buffer or response stream
+        chunk_rows (int): Rows serialized at a time
+        to_csv_options: Extra arguments for DataFrame.to_csv, e.g. sep
+    """
+    out = _text_sink(sink)
+    data.iloc[:0].to_csv(out, index=False, **to_csv_options)
+    for chunk in _iter_chunks(data, chunk_rows):
+        chunk.to_csv(out, header=False, index=False, **to_csv_options)
+
+
+def write_json(data, sink, chunk_rows=DEFAULT_EXPORT_ROWS, indent=None):
+    """
+    Write a DataFrame as a JSON array of records, chunk by chunk.
+
+    The output is the same as json.dumps() of all records with the same
+    indent, without ever holding all records or the whole text in memory.
+
+    Args:
+        data (pd.DataFrame): DataFrame to write, without its index
+        sink (file-like): Text or binary file-like object
+        chunk_rows (int): Rows converted to records at a time
+        indent (int, optional): Pretty-print with this indent, compact by default
+    """
+    out = _text_sink(sink)
+    encoder = json.JSONEncoder(default=json_default, indent=indent)
+    # A chunk encoded as an array is "[" + records + "]", with a newline after
+    # "[" and before "]" when indented, so its inner text is already laid out
+    # as it would be inside the full array
+    trim = 1 if indent is None else 2
+    separator = ', ' if indent is None else ',\n'
+
+    written = False
+    out.write('[')
+    for chunk in _iter_chunks(data, chunk_rows):
+        text = encoder.encode(_records(chunk))
+        out.write((separator if written else text[1:trim]) + text[trim:-trim])
+        written = True
+    out.write((text[-trim:-1] if written else '') + ']')
+
+
+def write_ndjson(data, sink, chunk_rows=DEFAULT_EXPORT_ROWS):
+    """
+    Write a DataFrame as newline-delimited JSON, one record per line, chunk by chunk.
+
+    Args:
+        data (pd.DataFrame): DataFrame to write, without its index
+        sink (file-like): Text or binary file-like object
+        chunk_rows (int): Rows converted to records at a time
+    """
+    out = _text_sink(sink)
+    encode = json.JSONEncoder(default=json_default, ensure_ascii=False).encode
+    for chunk in _iter_chunks(data, chunk_rows):
+        out.write(''.join(encode(record) + '\n' for record in _records(chunk)))
+
+
+def iter_frames(path, chunksize=DEFAULT_CHUNK_ROWS, format=None, **read_options):
+    """
+    Read a CSV, Parquet or Arrow IPC file as DataFrames of at most chunksize rows.
+
+    Only one chunk is held in memory at a time. Parquet files are read a
+    record batch at a time, with pandas index columns stored in them
+    skipped; Arrow files are memory-mapped and sliced.
+
+    Args:
+        path (str): Input file
+        chunksize (int): Rows per chunk
+        format (str, optional): "csv", "parquet" or "arrow", from the extension by default
+        read_options: Extra arguments for pd.read_csv, e.g. dtype or usecols
+
+    Yields:
+        pd.DataFrame: Consecutive chunks of the file
+    """
+    format = detect_format(path, format)
+
+    if format == 'csv':
+        with pd.read_csv(path, chunksize=chunksize, **read_options) as reader:
+            yield from reader
+        return
+
+    if format == 'arrow':
+        _require_arrow("Arrow input")
+        reader = pa.ipc.open_file(pa.memory_map(os.fspath(path)))
+        for index in range(reader.num_record_batches):
+            batch = reader.get_batch(index)
+            for start in range(0, batch.num_rows, chunksize):
+                table = pa.Table.from_batches([batch.slice(start, chunksize)])
+                yield _decode_dictionaries(table).to_pandas()
+        return
+
+    _require_arrow("Parquet input")
+    parquet = pq.ParquetFile(path)
+    columns = [name for name in parquet.schema_arrow.names if not name.startswith('__index_level_')]
+    for batch in parquet.iter_batches(batch_size=chunksize, columns=columns):
+        yield batch.to_pandas()
+
+
+def open_writer(path, format=None, **kwargs):
+    """
+    Create a writer appending DataFrames to a CSV, Parquet or Arrow IPC file.
+
+    Args:
+        path (str): Output file
+        format (str, optional): "csv", "parquet" or "arrow", from the extension by default
+
+    Returns:
+        CSVFrameWriter, ParquetFrameWriter or ArrowFrameWriter: Open writer
+    """
+    format = detect_format(path, format)
+    if format == 'csv':
+        return CSVFrameWriter(path, **kwargs)
+    if format == 'arrow':
+        return ArrowFrameWriter(path, **kwargs)
+    return ParquetFrameWriter(path, **kwargs)
+
+
+class _FrameWriter:
+    """
+    Base of writers that build an output file from consecutive DataFrames.
+
+    Output goes to a temporary file next to the target, which replaces the
+    target only when the writer is closed without error, so an interrupted
+    run never leaves a truncated file under the final name.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.tmp_path = f"{path}.tmp"
+        self.rows = 0
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+    def write(self, frame):
+        self._write(frame)
+        self.rows += len(frame)
+
+    def close(self):
+        """Finish the file and move it into place"""
+        self._close()
+        if os.path.exists(self.tmp_path):
+            os.replace(self.tmp_path, self.path)
+
+    def abort(self):
+        """Stop writing and remove the partial output"""
+        try:
+            self._close()
+        finally:
+            if os.path.exists(self.tmp_path):
+                os.remove(self.tmp_path)
+
+
+class CSVFrameWriter(_FrameWriter):
+    """
+    Appends DataFrames to a CSV file, writing the header with the first one.
+
+    Paths ending in .gz, .bz2 or .xz are compressed as they are written.
+    """
+
+    def __init__(self, path, **to_csv_options):
+        super().__init__(path)
+        self.to_csv_options = to_csv_options
+
+        extension = os.path.splitext(path.lower())[1]
+        opener = CSV_OPENERS.get(extension, open)
+        self._file = opener(self.tmp_path, 'wt', encoding='utf-8', newline='')
+        self._started = False
+
+    def _write(self, frame):
+        frame.to_csv(self._file, header=not self._started, index=False, **self.to_csv_options)
+        self._started = True
+
+    def _close(self):
+        if not self._file.closed:
+            self._file.close()
+
+
+class _TableWriter(_FrameWriter):
+    """
+    Base of writers storing DataFrames as Arrow tables with one fixed schema.
+
+    The first frame fixes the schema. Later frames are cast to it, since
+    chunks of a CSV file may infer different types for the same column;
+    columns with only missing values in the first frame are stored as strings.
+    """
+
+    def __init__(self, path):
+        super().__init__(path)
+        self.schema = None
+        self._writer = None
+
+    def _write(self, frame):
+        table = _to_table(frame)
+
+        if self._writer is None:
+            fields = [
+                pa.field(field.name, pa.string()) if pa.types.is_null(field.type) else field
+                for field in table.schema
+            ]
+            self.schema = pa.schema(fields, metadata=table.schema.metadata)
+            self._writer = self._open(self.schema)
+
+        if not table.schema.equals(self.schema, check_metadata=False):
+            try:
+                table = table.select(self.schema.names).cast(self.schema)
+            except (pa.ArrowInvalid, pa.ArrowNotImplementedError, KeyError) as e:
+                raise ValueError(
+                    f"Chunk does not match the output schema, pass explicit dtypes when reading: {str(e)}"
+                ) from e
+
+        if table.num_rows:
+            self._writer.write_table(table)
+
+    def _close(self):
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+
+class ParquetFrameWriter(_TableWriter):
+    """Appends DataFrames to a Parquet file, one row group each"""
+
+    def __init__(self, path, compression='snappy'):
+        _require_arrow("Parquet output")
+        super().__init__(path)
+        self.compression = compression
+
+    def _open(self, schema):
+        return pq.ParquetWriter(self.tmp_path, schema, compression=self.compression)
+
+
+class ArrowFrameWriter(_TableWriter):
+    """
+    Appends DataFrames to an Arrow IPC (Feather version 2) file, one record batch each.
+
+    Strings are not dictionary-encoded, as the file format allows only one
+    dictionary per column and chunks each have their own values.
+    """
+
+    def __init__(self, path, compression='lz4'):
+        _require_arrow("Arrow output")
+        super().__init__(path)
+        self.compression = compression
+
+    def _open(self, schema):
+        options = pa.ipc.IpcWriteOptions(compression=self.compression)
+        return pa.ipc.new_file(self.tmp_path, schema, options=options)
@@ -0,0 +1,444 @@
+import time
+import asyncio
+import logging
+import threading
+import weakref
+import requests
+from collections import OrderedDict
+from urllib.parse import urlsplit
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from .metrics import get_default_metrics
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+# Browser-like headers sent by every scraper unless a request overrides them
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.5',
+    'Connection': 'keep-alive',
+}
+
+# Requests per second allowed to a host, shared by every scraper in the process
+DEFAULT_HOST_RATES = {
+    'hacker-news.firebaseio.com': 20,
+}
+
+# Status codes worth retrying after a backoff
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+# Network-level failures of either client, e.g. for marking a mirror as down
+TRANSPORT_ERRORS = (requests.exceptions.ConnectionError, requests.exceptions.Timeout)
+if httpx is not None:
+    TRANSPORT_ERRORS += (httpx.TransportError,)
+
+logger = logging.getLogger(__name__)
+
+
+class HostRateLimiter:
+    """
+    Spaces requests to the same host at least ``1 / rate`` seconds apart.
+
+    Each caller reserves the next free slot for its host under a lock and
+    sleeps outside it, so concurrent workers queue up instead of bursting.
+    """
+
+    def __init__(self, rates=None, default_rate=None):
+        self.rates = dict(rates or {})
+        self.default_rate = default_rate
+        self._next_slot = {}
+        self._lock = threading.Lock()
+
+    def set_rate(self, host, rate):
+        """Set the requests per second allowed to a host; None removes the limit"""
+        with self._lock:
+            if rate is None:
+                self.rates.pop(host, None)
+            else:
+                self.rates[host] = rate
+
+    def reserve(self, host):
+        """Claim the next slot for host and return how many seconds to wait for it"""
+        rate = self.rates.get(host, self.default_rate)
+        if not rate:
+            return 0.0
+
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(host, 0.0))
+            self._next_slot[host] = slot + 1.0 / rate
+
+        return slot - now
+
+    def wait(self, host):
+        """Block until a request to host may be sent"""
+        delay = self.reserve(host)
+        if delay > 0:
+            time.sleep(delay)
+
+    async def async_wait(self, host):
+        """Wait without blocking the event loop until a request to host may be sent"""
+        delay = self.reserve(host)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+class ResponseCache:
+    """Bounded in-memory LRU cache of successful GET responses with a TTL"""
+
+    def __init__(self, ttl=60, maxsize=256):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            stored_at, response = entry
+            if time.monotonic() - stored_at > self.ttl:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return response
+
+    def put(self, key, response):
+        with self._lock:
+            self._entries[key] = (time.monotonic(), response)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+class HttpClient(requests.Session):
+    """
+    Shared HTTP transport for all scrapers.
+
+    A drop-in requests.Session with:
+    - pooled keep-alive connections and automatic retries with backoff for
+      connection errors and 429/5xx responses
+    - a per-host rate limiter shared by every thread using the client
+    - an opt-in short-lived cache of successful GET responses (cache_ttl
+      seconds, off by default); responses served from it have
+      ``from_cache`` set to True
+    - metrics hooks called once per request with method, URL, host, status,
+      elapsed time, cache hit, error and phase timings (ttfb, download)
+
+    Use get_default_client() to share one instance across the process.
+    """
+
+    def __init__(self, pool_maxsize=32, retries=2, backoff_factor=0.3, cache_ttl=0,
+                 cache_size=256, host_rates=None, default_rate=None, headers=None):
+        super().__init__()
+        self.headers.update(headers or DEFAULT_HEADERS)
+
+        retry = Retry(
+            total=retries,
+            connect=retries,
+            read=retries,
+            backoff_factor=backoff_factor,
+            status_forcelist=RETRY_STATUSES,
+            allowed_methods=frozenset({'GET', 'HEAD'}),
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_connections=pool_maxsize, pool_maxsize=pool_maxsize, max_retries=retry)
+        self.mount('http://', adapter)
+        self.mount('https://', adapter)
+
+        self.rate_limiter = HostRateLimiter(
+            DEFAULT_HOST_RATES if host_rates is None else host_rates,
+            default_rate,
+        )
+        self.cache = ResponseCache(cache_ttl, cache_size) if cache_ttl else None
+        self.metrics_hooks = []
+
+    def add_metrics_hook(self, hook):
+        """Register a callable receiving one dict of request metrics per request"""
+        self.metrics_hooks.append(hook)
+
+    def remove_metrics_hook(self, hook):
+        if hook in self.metrics_hooks:
+            self.metrics_hooks.remove(hook)
+
+    def request(self, method, url, *args, **kwargs):
+        host = urlsplit(url).hostname or ''
+        cache_key = self._cache_key(method, url, kwargs)
+
+        if cache_key is not None:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                cached.from_cache = True
+                self._emit(method, url, host, cached.status_code, 0.0, True, None)
+                return cached
+
+        self.rate_limiter.wait(host)
+
+        start = time.perf_counter()
+        try:
+            response = super().request(method, url, *args, **kwargs)
+        except requests.exceptions.RequestException as e:
+            self._emit(method, url, host, None, time.perf_counter() - start, False, e)
+            raise
+
+        response.from_cache = False
+        elapsed = time.perf_counter() - start
+        # requests only reports the time until the response headers were parsed,
+        # so connect and TLS setup are folded into ttfb
+        ttfb = min(response.elapsed.total_seconds(), elapsed)
+        self._emit(method, url, host, response.status_code, elapsed, False, None,
+                   {'ttfb': ttfb, 'download': elapsed - ttfb})
+
+        if cache_key is not None and response.status_code == 200 and self._cacheable(response):
+            self.cache.put(cache_key, response)
+
+        return response
+
+    def _cache_key(self, method, url, kwargs):
+        """Return the cache key of a request, or None if it must not be cached"""
+        if self.cache is None or method.upper() != 'GET' or kwargs.get('stream'):
+            return None
+
+        cache_control = (kwargs.get('headers') or {}).get('Cache-Control', '')
+        if 'no-cache' in cache_control or 'max-age=0' in cache_control:
+            return None
+
+        params = kwargs.get('params')
+        if params:
+            url = requests.Request('GET', url, params=params).prepare().url
+        return url
+
+    def _cacheable(self, response):
+        return 'no-store' not in response.headers.get('Cache-Control', '')
+
+    def _emit(self, method, url, host, status, elapsed, from_cache, error, phases=None):
+        _emit_metrics(self.metrics_hooks, method, url, host, status, elapsed, from_cache, error, phases)
+
+
+class AsyncHttpClient:
+    """
+    Asyncio counterpart of HttpClient built on httpx.AsyncClient.
+
+    Requests share one connection pool and never hold a thread while in
+    flight, so a single event loop can drive many concurrent scrapes. The
+    rate limiter and metrics hooks can be shared with an HttpClient so
+    per-host limits hold across sync and async callers. Responses expose
+    the same status_code/text/json()/raise_for_status() interface the
+    scrapers use on requests responses. As with HttpClient, GET responses
+    are only cached when cache_ttl is set.
+
+    An AsyncClient is bound to the event loop it was first used on; use
+    get_default_async_client() to get the shared client of the running loop.
+    """
+
+    def __init__(self, max_connections=100, retries=2, backoff_factor=0.3, cache_ttl=0,
+                 cache_size=256, rate_limiter=None, metrics_hooks=None, headers=None,
+                 timeout=30, transport=None):
+        if httpx is None:
+            raise ImportError("Async scraping requires httpx. Install it with `pip install httpx`.")
+
+        self.retries = retries
+        self.backoff_factor = backoff_factor
+        self.rate_limiter = rate_limiter or HostRateLimiter(DEFAULT_HOST_RATES)
+        self.cache = ResponseCache(cache_ttl, cache_size) if cache_ttl else None
+        self.metrics_hooks = metrics_hooks if metrics_hooks is not None else []
+
+        limits = httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections)
+        self._client = httpx.AsyncClient(
+            headers=headers or DEFAULT_HEADERS,
+            timeout=timeout,
+            limits=limits,
+            follow_redirects=True,
+            transport=transport or httpx.AsyncHTTPTransport(retries=retries, limits=limits),
+        )
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+
+    async def aclose(self):
+        await self._client.aclose()
+
+    def add_metrics_hook(self, hook):
+        """Register a callable receiving one dict of request metrics per request"""
+        self.metrics_hooks.append(hook)
+
+    async def get(self, url, params=None, headers=None, timeout=None):
+        """
+        Send a GET request, retrying 429/5xx responses with backoff.
+
+        Returns:
+            httpx.Response: Response of the last attempt
+        """
+        request = self._client.build_request('GET', url, params=params, headers=headers,
+                                             timeout=timeout if timeout is not None else httpx.USE_CLIENT_DEFAULT)
+        request_url = str(request.url)
+        host = request.url.host or ''
+
+        cache_key = None
+        if self.cache is not None and not self._bypass_cache(headers):
+            cache_key = request_url
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                cached.from_cache = True
+                _emit_metrics(self.metrics_hooks, 'GET', request_url, host, cached.status_code, 0.0, True, None)
+                return cached
+
+        for attempt in range(self.retries + 1):
+            await self.rate_limiter.async_wait(host)
+
+            tracer = _PhaseTracer()
+            request.extensions['trace'] = tracer
+            start = time.perf_counter()
+            try:
+                response = await self._client.send(request)
+                await response.aread()
+            except httpx.HTTPError as e:
+                _emit_metrics(self.metrics_hooks, 'GET', request_url, host, None,
+                              time.perf_counter() - start, False, e, tracer.phases())
+                raise
+
+            _emit_metrics(self.metrics_hooks, 'GET', request_url, host, response.status_code,
+                          time.perf_counter() - start, False, None, tracer.phases())
+
+            response.from_cache = False
+            if response.status_code not in RETRY_STATUSES or attempt == self.retries:
+                break
+            await asyncio.sleep(self._retry_delay(response, attempt))
+
+        if cache_key is not None and response.status_code == 200 and \
+                'no-store' not in response.headers.get('Cache-Control', ''):
+            self.cache.put(cache_key, response)
+
+        return response
+
+    def _bypass_cache(self, headers):
+        cache_control = (headers or {}).get('Cache-Control', '')
+        return 'no-cache' in cache_control or 'max-age=0' in cache_control
+
+    def _retry_delay(self, response, attempt):
+        """Honour Retry-After when present, otherwise back off exponentially"""
+        try:
+            return float(response.headers.get('Retry-After'))
+        except (TypeError, ValueError):
+            return self.backoff_factor * (2 ** attempt)
+
+
+class _PhaseTracer:
+    """
+    httpcore trace callback recording the phases of one request.
+
+    connect covers DNS resolution and the TCP handshake (httpcore does not
+    report them separately), tls the TLS handshake, ttfb the time from
+    sending the request until the response headers arrived and download
+    the time spent reading the body. Phases that did not happen, e.g.
+    connect on a reused keep-alive connection, are left out.
+    """
+
+    # httpcore trace events opening and closing each phase, across HTTP/1.1 and HTTP/2
+    STARTS = {
+        'connection.connect_tcp.started': 'connect',
+        'connection.connect_unix_socket.started': 'connect',
+        'connection.start_tls.started': 'tls',
+        'http11.send_request_headers.started': 'ttfb',
+        'http2.send_request_headers.started': 'ttfb',
+        'http11.receive_response_body.started': 'download',
+        'http2.receive_response_body.started': 'download',
+    }
+    ENDS = {
+        'connection.connect_tcp.complete': 'connect',
+        'connection.connect_unix_socket.complete': 'connect',
+        'connection.start_tls.complete': 'tls',
+        'http11.receive_response_headers.complete': 'ttfb',
+        'http2.receive_response_headers.complete': 'ttfb',
+        'http11.receive_response_body.complete': 'download',
+        'http2.receive_response_body.complete': 'download',
+    }
+
+    def __init__(self):
+        self._started = {}
+        self._durations = {}
+
+    async def __call__(self, event_name, info):
+        if event_name in self.STARTS:
+            self._started.setdefault(self.STARTS[event_name], time.perf_counter())
+        elif event_name in self.ENDS and self.ENDS[event_name] in self._started:
+            phase = self.ENDS[event_name]
+            self._durations[phase] = time.perf_counter() - self._started[phase]
+
+    def phases(self):
+        return dict(self._durations)
+
+
+def _emit_metrics(hooks, method, url, host, status, elapsed, from_cache, error, phases=None):
+    """Call the metrics hooks, never letting a hook failure break a request"""
+    if not hooks:
+        return
+
+    event = {
+        'method': method.upper(),
+        'url': url,
+        'host': host,
+        'status': status,
+        'elapsed': elapsed,
+        'from_cache': from_cache,
+        'error': error,
+        'phases': phases or {},
+    }
+    for hook in list(hooks):
+        try:
+            hook(event)
+        except Exception as e:
+            logger.warning(f"Metrics hook failed: {str(e)}")
+
+
+_default_client = None
+_default_client_lock = threading.Lock()
+
+
+def get_default_client():
+    """
+    Return the HttpClient shared by every scraper in this process.
+
+    Its requests are recorded in the default ScrapeMetrics collector.
+    """
+    global _default_client
+    with _default_client_lock:
+        if _default_client is None:
+            _default_client = HttpClient()
+            _default_client.add_metrics_hook(get_default_metrics().request_hook)
+        return _default_client
+
+
+_default_async_clients = weakref.WeakKeyDictionary()
+
+
+def get_default_async_client():
+    """
+    Return the AsyncHttpClient shared by every scraper on the running event loop.
+
+    It shares the per-host rate limiter and metrics hooks of the default
+    HttpClient, so limits hold across sync and async scrapes.
+    """
+    loop = asyncio.get_running_loop()
+    client = _default_async_clients.get(loop)
+    if client is None:
+        sync_client = get_default_client()
+        client = AsyncHttpClient(
+            rate_limiter=sync_client.rate_limiter,
+            metrics_hooks=sync_client.metrics_hooks,
+        )
+        _default_async_clients[loop] = client
+    return client
@@ -0,0 +1,118 @@
+import os
+import json
+import time
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+DEFAULT_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".dataminer", "instance_health.json")
+
+
+class InstanceHealthRegistry:
+    """
+    Liveness and latency cache for mirror front-ends such as Nitter and Invidious.
+
+    Candidates are probed in parallel and the results are kept on local disk
+    for ``ttl`` seconds, so the cost of finding a working mirror is paid once
+    per TTL instead of on every scrape.
+    """
+
+    def __init__(self, session, headers=None, cache_path=None, ttl=900, timeout=5):
+        logging.basicConfig(level=logging.INFO)
+        self.logger = logging.getLogger(__name__)
+        self.session = session
+        self.headers = headers or {}
+        self.cache_path = cache_path or DEFAULT_CACHE_PATH
+        self.ttl = ttl
+        self.timeout = timeout
+
+        self._lock = threading.Lock()
+        self._cache = self._load()
+
+    def ranked(self, kind, candidates, probe_path=""):
+        """
+        Return the healthy candidates ordered from fastest to slowest.
+
+        Args:
+            kind (str): Name of the mirror family, e.g. "nitter"
+            candidates (list): Base URLs of the instances to consider
+            probe_path (str): Path appended to the base URL when probing
+
+        Returns:
+            list: Healthy instance base URLs, fastest first
+        """
+        now = time.time()
+        with self._lock:
+            entries = self._cache.setdefault(kind, {})
+            stale = [
+                instance for instance in candidates
+                if instance not in entries or now - entries[instance]['checked_at'] > self.ttl
+            ]
+
+        if stale:
+            self.logger.info(f"Probing {len(stale)} {kind} instance(s)")
+            with ThreadPoolExecutor(max_workers=len(stale)) as executor:
+                results = list(executor.map(lambda instance: self._probe(instance, probe_path), stale))
+
+            with self._lock:
+                for instance, result in zip(stale, results):
+                    entries[instance] = result
+                self._save()
+
+        with self._lock:
+            healthy = [
+                instance for instance in candidates
+                if entries.get(instance, {}).get('healthy')
+            ]
+            return sorted(healthy, key=lambda instance: entries[instance]['latency'])
+
+    def pick(self, kind, candidates, probe_path=""):
+        """Return the fastest healthy instance, or None if none respond"""
+        healthy = self.ranked(kind, candidates, probe_path)
+        return healthy[0] if healthy else None
+
+    def mark_failed(self, kind, instance):
+        """Record that an instance failed outside of a probe so it is skipped until the TTL expires"""
+        with self._lock:
+            self._cache.setdefault(kind, {})[instance] = {
+                'healthy': False,
+                'latency': None,
+                'checked_at': time.time(),
+            }
+            self._save()
+
+    def _probe(self, instance, probe_path):
+        """Send a single probe request and time it"""
+        url = f"{instance.rstrip('/')}/{probe_path.lstrip('/')}" if probe_path else instance
+        start = time.monotonic()
+        try:
+            response = self.session.get(url, headers=self.headers, timeout=self.timeout)
+            healthy = response.status_code == 200
+        except Exception:
+            healthy = False
+
+        return {
+            'healthy': healthy,
+            'latency': time.monotonic() - start if healthy else None,
+            'checked_at': time.time(),
+        }
+
+    def _load(self):
+        """Read the cache file, ignoring it if missing or corrupt"""
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                cache = json.load(f)
+            return cache if isinstance(cache, dict) else {}
+        except (OSError, ValueError):
+            return {}
+
+    def _save(self):
+        """Atomically write the cache file; callers must hold the lock"""
+        try:
+            os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
+            tmp_path = f"{self.cache_path}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self._cache, f)
+            os.replace(tmp_path, self.cache_path)
+        except OSError as e:
+            self.logger.warning(f"Could not write instance health cache: {str(e)}")
@@ -0,0 +1,256 @@
+import time
+import bisect
+import inspect
+import logging
+import functools
+import threading
+import pandas as pd
+from contextlib import contextmanager, nullcontext
+
+# Upper bounds (seconds) of the latency histogram buckets
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+METRIC_PREFIX = "dataminer"
+
+logger = logging.getLogger(__name__)
+
+
+class Histogram:
+    """Fixed-bucket latency histogram, cheap enough to update on every request"""
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+        self.max = max(self.max, value)
+
+    def quantile(self, q):
+        """Estimate a quantile by interpolating inside the bucket that contains it"""
+        if not self.count:
+            return None
+
+        rank = q * self.count
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            if seen + bucket_count >= rank and bucket_count:
+                lower = self.buckets[index - 1] if index > 0 else 0.0
+                upper = min(self.buckets[index], self.max) if index < len(self.buckets) else self.max
+                lower = min(lower, upper)
+                return lower + (upper - lower) * (rank - seen) / bucket_count
+            seen += bucket_count
+
+        return self.max
+
+
+class ScrapeMetrics:
+    """
+    Collects per-request and per-stage timings of the scrapers.
+
+    Two metrics are recorded, each as one histogram per label set:
+    - request: HTTP requests by host and phase (total, plus connect, tls,
+      ttfb and download where the client reports them)
+    - stage: scraper work by source and stage (e.g. parse, extract, build)
+
+    Every observation is also passed to the registered callbacks, and the
+    histograms can be read back with summary() or exported with
+    to_prometheus().
+    """
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self._histograms = {}
+        self._counters = {}
+        self._callbacks = []
+        self._lock = threading.Lock()
+
+    def add_callback(self, callback):
+        """Register a callable receiving a dict for every observation"""
+        self._callbacks.append(callback)
+
+    def remove_callback(self, callback):
+        if callback in self._callbacks:
+            self._callbacks.remove(callback)
+
+    def observe(self, metric, seconds, **labels):
+        """Record one timing of a metric under the given labels"""
+        key = (metric, tuple(sorted(labels.items())))
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = Histogram(self.buckets)
+            histogram.observe(seconds)
+
+        self._notify({'metric': metric, 'seconds': seconds, **labels})
+
+    def increment(self, metric, **labels):
+        """Count one occurrence of an event, such as a cache hit or a failed request"""
+        key = (metric, tuple(sorted(labels.items())))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + 1
+
+        self._notify({'metric': metric, 'count': 1, **labels})
+
+    @contextmanager
+    def stage(self, stage, source):
+        """Time the enclosed block as one stage of a scrape"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe('stage', time.perf_counter() - start, source=source, stage=stage)
+
+    def request_hook(self, event):
+        """
+        Metrics hook for HttpClient and AsyncHttpClient.
+
+        Records the total time of every request that reached the network,
+        plus any phase timings the client reported, labelled by host.
+        """
+        host = event.get('host') or ''
+        if event.get('from_cache'):
+            self.increment('cache_hits', host=host)
+            return
+        if event.get('error') is not None:
+            self.increment('request_errors', host=host)
+
+        self.observe('request', event['elapsed'], host=host, phase='total')
+        for phase, seconds in (event.get('phases') or {}).items():
+            self.observe('request', seconds, host=host, phase=phase)
+
+    def summary(self):
+        """
+        Summarize every histogram.
+
+        Returns:
+            pd.DataFrame: One row per metric and label set with count, total,
+                mean, p50, p95, p99 and max seconds, slowest total first
+        """
+        with self._lock:
+            items = list(self._histograms.items())
+
+        rows = []
+        for (metric, labels), histogram in items:
+            labels = dict(labels)
+            rows.append({
+                'metric': metric,
+                'source': labels.get('host', labels.get('source', '')),
+                'stage': labels.get('phase', labels.get('stage', '')),
+                'count': histogram.count,
+                'total_seconds': round(histogram.sum, 6),
+                'mean_seconds': round(histogram.sum / histogram.count, 6),
+                'p50_seconds': round(histogram.quantile(0.5), 6),
+                'p95_seconds': round(histogram.quantile(0.95), 6),
+                'p99_seconds': round(histogram.quantile(0.99), 6),
+                'max_seconds': round(histogram.max, 6),
+            })
+
+        if not rows:
+            return pd.DataFrame(columns=['metric', 'source', 'stage', 'count', 'total_seconds', 'mean_seconds',
+                                         'p50_seconds', 'p95_seconds', 'p99_seconds', 'max_seconds'])
+
+        return pd.DataFrame(rows).sort_values('total_seconds', ascending=False, ignore_index=True)
+
+    def to_prometheus(self):
+        """
+        Export the metrics in the Prometheus text exposition format.
+
+        Returns:
+            str: dataminer_<metric>_seconds histograms and dataminer_<metric>_total counters
+        """
+        with self._lock:
+            histograms = sorted(self._histograms.items())
+            counters = sorted(self._counters.items())
+
+        lines = []
+        declared = set()
+        for (metric, labels), histogram in histograms:
+            name = f"{METRIC_PREFIX}_{metric}_seconds"
+            if name not in declared:
+                lines.append(f"# HELP {name} Time spent per {metric} in seconds")
+                lines.append(f"# TYPE {name} histogram")
+                declared.add(name)
+
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets, histogram.counts):
+                cumulative += bucket_count
+                lines.append(f"{name}_bucket{self._labels(labels, le=repr(float(bound)))} {cumulative}")
+            lines.append(f"{name}_bucket{self._labels(labels, le='+Inf')} {histogram.count}")
+            lines.append(f"{name}_sum{self._labels(labels)} {histogram.sum}")
+            lines.append(f"{name}_count{self._labels(labels)} {histogram.count}")
+
+        for (metric, labels), count in counters:
+            name = f"{METRIC_PREFIX}_{metric}_total"
+            if name not in declared:
+                lines.append(f"# TYPE {name} counter")
+                declared.add(name)
+            lines.append(f"{name}{self._labels(labels)} {count}")
+
+        return "\n".join(lines) + "\n"
+
+    def reset(self):
+        """Drop all recorded observations"""
+        with self._lock:
+            self._histograms.clear()
+            self._counters.clear()
+
+    def _labels(self, labels, **extra):
+        pairs = list(labels) + list(extra.items())
+        if not pairs:
+            return ""
+        escaped = (
+            f'{key}="{str(value).replace(chr(92), chr(92) * 2).replace(chr(34), chr(92) + chr(34))}"'
+            for key, value in pairs
+        )
+        return "{" + ",".join(escaped) + "}"
+
+    def _notify(self, observation):
+        for callback in list(self._callbacks):
+            try:
+                callback(observation)
+            except Exception as e:
+                logger.warning(f"Metrics callback failed: {str(e)}")
+
+
+def timed_stage(stage, source=None):
+    """
+    Decorate a scraper method so each call is recorded as a stage.
+
+    Works on both plain and async methods. The instance's ``metrics``
+    attribute receives the timing; when source is omitted the instance's
+    ``metrics_source`` attribute labels it.
+    """
+    def decorator(method):
+        def stage_context(self):
+            metrics = getattr(self, 'metrics', None)
+            if metrics is None:
+                return nullcontext()
+            return metrics.stage(stage, source or getattr(self, 'metrics_source', type(self).__name__))
+
+        if inspect.iscoroutinefunction(method):
+            @functools.wraps(method)
+            async def async_wrapper(self, *args, **kwargs):
+                with stage_context(self):
+                    return await method(self, *args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            with stage_context(self):
+                return method(self, *args, **kwargs)
+        return wrapper
+    return decorator
+
+
+_default_metrics = ScrapeMetrics()
+
+
+def get_default_metrics():
+    """Return the ScrapeMetrics collector shared by every scraper in this process"""
+    return _default_metrics
@@ -0,0 +1,174 @@
+import os
+import atexit
+import logging
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+try:
+    import pyarrow as pa
+    ARROW_AVAILABLE = True
+except ImportError:
+    ARROW_AVAILABLE = False
+
+# Columns shorter than this are processed in the calling process, where
+# the cost of shipping chunks to workers would outweigh the speedup
+DEFAULT_MIN_ROWS = 20000
+
+# Chunks per worker, so a slow chunk does not leave the other workers idle
+CHUNKS_PER_WORKER = 4
+
+logger = logging.getLogger(__name__)
+
+_default_workers = int(os.environ.get('DATAMINER_WORKERS', '1') or 1)
+# Process pools by worker count, so no pool is ever replaced under a caller using it
+_pools = {}
+_pool_lock = threading.Lock()
+
+
+def set_default_workers(workers):
+    """
+    Set how many processes row-wise operations use when a call does not say.
+
+    Args:
+        workers (int): 1 runs everything in the calling process, 0 or a
+            negative number uses every core
+    """
+    global _default_workers
+    _default_workers = workers
+
+
+def get_default_workers():
+    return _default_workers
+
+
+def resolve_workers(workers=None):
+    """Turn a workers setting into a process count, using the default for None"""
+    if workers is None:
+        workers = _default_workers
+    if workers is None or workers <= 0:
+        workers = os.cpu_count() or 1
+    return workers
+
+
+def parallel_map(function, values, workers=None, min_rows=DEFAULT_MIN_ROWS, **kwargs):
+    """
+    Apply a chunk function to a list of values, in a process pool when worthwhile.
+
+    The values are split into contiguous chunks and ``function(chunk, **kwargs)``
+    must return one result per value of its chunk. Both the function and
+    kwargs must be picklable, i.e. module-level functions or partials of them.
+
+    When every value is a string (or None) and pyarrow is available, the
+    column is written once to shared memory as an Arrow buffer and each
+    worker reads its slice from there, instead of every chunk being pickled
+    to the workers.
+
+    Args:
+        function (callable): Function mapping a list of values to a list of results
+        values (list): Values to process
+        workers (int, optional): Processes to use, see set_default_workers
+        min_rows (int): Run serially below this many values
+
+    Returns:
+        list: Results in the order of the values
+    """
+    workers = resolve_workers(workers)
+    if workers <= 1 or len(values) < max(min_rows, 2):
+        return function(values, **kwargs)
+
+    chunk_size = -(-len(values) // (workers * CHUNKS_PER_WORKER))
+    bounds = [(start, min(start + chunk_size, len(values))) for start in range(0, len(values), chunk_size)]
+    pool = _get_pool(workers)
+
+    try:
+        shared = _share_strings(values)
+    except (OSError, ValueError) as e:
+        logger.warning(f"Could not place column in shared memory, sending chunks instead: {str(e)}")
+        shared = None
+
+    try:
+        if shared is None:
+            futures = [pool.submit(function, values[start:stop], **kwargs) for start, stop in bounds]
+        else:
+            futures = [
+                pool.submit(_run_shared_chunk, shared.name, start, stop, function, kwargs)
+                for start, stop in bounds
+            ]
+
+        results = []
+        for future in futures:
+            results.extend(future.result())
+        return results
+
+    finally:
+        if shared is not None:
+            shared.close()
+            shared.unlink()
+
+
+def shutdown():
+    """Stop the worker processes; a later parallel call starts new ones"""
+    with _pool_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.shutdown(cancel_futures=True)
+
+
+atexit.register(shutdown)
+
+
+def _get_pool(workers):
+    """
+    Return the shared process pool of the given size, starting it on first use.
+
+    Pools of other sizes are kept rather than shut down, since another
+    thread may still be submitting to them; worker processes are only
+    started as work arrives.
+    """
+    with _pool_lock:
+        pool = _pools.get(workers)
+        if pool is None:
+            pool = _pools[workers] = ProcessPoolExecutor(max_workers=workers)
+        return pool
+
+
+def _share_strings(values):
+    """
+    Write a string column to shared memory as an Arrow IPC stream.
+
+    Returns:
+        SharedMemory or None: The segment, or None if the values are not all strings
+    """
+    if not ARROW_AVAILABLE:
+        return None
+
+    try:
+        array = pa.array(values, type=pa.large_string())
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        return None
+
+    batch = pa.record_batch([array], names=['value'])
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, batch.schema) as writer:
+        writer.write_batch(batch)
+    buffer = sink.getvalue()
+
+    shared = shared_memory.SharedMemory(create=True, size=max(buffer.size, 1))
+    shared.buf[:buffer.size] = memoryview(buffer).cast('B')
+    return shared
+
+
+def _run_shared_chunk(name, start, stop, function, kwargs):
+    """Worker side of parallel_map: read a slice of a shared column and process it"""
+    shared = shared_memory.SharedMemory(name=name)
+    try:
+        reader = pa.ipc.open_stream(pa.py_buffer(shared.buf))
+        values = reader.read_next_batch().column(0).slice(start, stop - start).to_pylist()
+        # Arrow must drop its view of the segment before it can be closed
+        del reader
+    finally:
+        shared.close()
+
+    return function(values, **kwargs)
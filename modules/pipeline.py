@@ -0,0 +1,469 @@
+import json
+import hashlib
+import logging
+import argparse
+import threading
+from collections import OrderedDict
+import numpy as np
+import pandas as pd
+from .dedup_index import DedupIndex
+from .frame_io import DEFAULT_CHUNK_ROWS, detect_format, iter_frames, open_writer
+
+logger = logging.getLogger(__name__)
+
+# Memory the step outputs of a StepCache may hold by default
+DEFAULT_CACHE_BYTES = 512 * 1024 * 1024
+
+# Steps a pipeline accepts, with the DataProcessor arguments each takes
+STEP_ARGUMENTS = {
+    'remove_duplicates': (),
+    'remove_empty_rows': (),
+    'remove_cross_source_duplicates': ('url_columns', 'text_columns', 'index_path', 'drop_seen'),
+    'fill_missing_values': ('method', 'fill_value'),
+    'convert_data_type': ('column', 'target_type', 'workers'),
+    'filter_data': ('column', 'filter_type', 'filter_value'),
+    'clean_text': ('column', 'clean_options', 'workers'),
+}
+
+# Steps that only drop rows, judging each row on its own values
+ROW_FILTERS = {'remove_empty_rows', 'filter_data'}
+
+# Steps that rewrite a single column value by value
+COLUMN_STEPS = {'convert_data_type', 'clean_text'}
+
+# Fill methods that only look at the row itself or the rows before it, and
+# so can run over a file chunk by chunk
+STREAMING_FILL_METHODS = {"Custom Value", "Forward Fill"}
+
+
+def _commutes(filter_step, step):
+    """
+    Whether a row filter gives the same result when run before a preceding step.
+
+    Dropping duplicates keeps the first of identical rows, which a filter
+    keeps or drops together. clean_text does not affect a filter on another
+    column and always yields an object column, but turns missing values
+    into strings, so remove_empty_rows stays behind it. The dtype a type
+    conversion or a fill produces depends on which rows are present (e.g.
+    Boolean gives bool without NaN rows, object with them), filling also
+    uses other rows and the cross-source index has side effects, so
+    filters never move past any of them.
+    """
+    if step['step'] == 'remove_duplicates':
+        return True
+    if step['step'] == 'clean_text' and filter_step['step'] == 'filter_data':
+        return step.get('column') != filter_step.get('column')
+    return False
+
+
+def plan_steps(steps):
+    """
+    Turn a list of steps into the order they are executed in.
+
+    Row filters are moved ahead of the steps they commute with, so later
+    steps process fewer rows. Repeats of remove_duplicates or
+    remove_empty_rows are dropped and consecutive clean_text steps on the
+    same column are merged into a single pass.
+
+    Args:
+        steps (list): Step dicts, e.g. {"step": "filter_data", "column": "score",
+            "filter_type": "Greater Than", "filter_value": "10"}
+
+    Returns:
+        list: Planned step dicts
+    """
+    planned = []
+    for step in steps:
+        name = step.get('step')
+        if name not in STEP_ARGUMENTS:
+            raise ValueError(f"Unknown pipeline step: {name}")
+        unknown = set(step) - {'step'} - set(STEP_ARGUMENTS[name])
+        if unknown:
+            raise ValueError(f"Unknown arguments for {name}: {', '.join(sorted(unknown))}")
+        step = dict(step)
+
+        if name == 'clean_text' and not step.get('clean_options'):
+            continue
+
+        position = len(planned)
+        if name in ROW_FILTERS:
+            while position > 0 and _commutes(step, planned[position - 1]):
+                position -= 1
+
+        previous = planned[position - 1] if position > 0 else None
+        if previous is not None and name in ('remove_duplicates', 'remove_empty_rows') and previous['step'] == name:
+            continue
+        if (previous is not None and name == 'clean_text' and previous['step'] == 'clean_text'
+                and previous.get('column') == step.get('column')
+                and previous.get('workers') == step.get('workers')):
+            previous['clean_options'] = list(previous['clean_options']) + list(step['clean_options'])
+            continue
+
+        planned.insert(position, step)
+    return planned
+
+
+def _column_hashes(column):
+    """Hash every value of a Series, by string form when pandas cannot hash them"""
+    try:
+        hashes = pd.util.hash_pandas_object(column, index=False, categorize=False)
+    except (TypeError, ValueError):
+        hashes = pd.util.hash_pandas_object(column.astype(str), index=False, categorize=False)
+    return hashes.to_numpy()
+
+
+def _row_hashes(data):
+    """Hash every row of a DataFrame from the values of all its columns"""
+    columns = {position: _column_hashes(data.iloc[:, position]) for position in range(data.shape[1])}
+    return pd.util.hash_pandas_object(pd.DataFrame(columns, index=data.index), index=False).to_numpy()
+
+
+def _first_seen(hashes, seen):
+    """Mask of the hashes not in seen nor earlier in hashes, adding them to seen"""
+    keep = np.zeros(len(hashes), dtype=bool)
+    for position, value in enumerate(hashes.tolist()):
+        if value not in seen:
+            seen.add(value)
+            keep[position] = True
+    return keep
+
+
+def frame_fingerprint(data):
+    """
+    Hash the index, columns, dtypes and values of a DataFrame.
+
+    Frames with equal content get equal fingerprints. Values that pandas
+    cannot hash, such as lists, are hashed by their string form.
+
+    Returns:
+        str: Hex digest
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(repr((list(data.columns), [str(dtype) for dtype in data.dtypes])).encode('utf-8'))
+    digest.update(pd.util.hash_pandas_object(data.index, categorize=False).to_numpy().tobytes())
+
+    for position in range(data.shape[1]):
+        digest.update(_column_hashes(data.iloc[:, position]).tobytes())
+
+    return digest.hexdigest()
+
+
+class StepCache:
+    """
+    Bounded in-memory LRU cache of pipeline step outputs.
+
+    Entries are keyed by the fingerprint of the pipeline input and the
+    planned steps up to that point, so rerunning a pipeline whose last step
+    changed resumes from the output of the unchanged steps before it. The
+    least recently used outputs are evicted once their total size exceeds
+    max_bytes.
+    """
+
+    def __init__(self, max_bytes=DEFAULT_CACHE_BYTES):
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def put(self, key, frame):
+        """Store a step output, which must not be modified afterwards"""
+        size = int(frame.memory_usage(index=True, deep=True).sum())
+        if size > self.max_bytes:
+            return
+
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.nbytes -= previous[0]
+            self._entries[key] = (size, frame)
+            self.nbytes += size
+            while self.nbytes > self.max_bytes:
+                _, (evicted, _) = self._entries.popitem(last=False)
+                self.nbytes -= evicted
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.nbytes = 0
+
+
+class Pipeline:
+    """
+    Runs a list of DataProcessor steps as one planned pass over a DataFrame.
+
+    Calling the DataProcessor methods one after another copies the whole
+    frame at every step. A pipeline copies it at most once, before the
+    first step that modifies values, and none at all when a filter comes
+    first; with pandas Copy-on-Write on, that copy is shallow. Consecutive
+    row filters are combined into one mask, so the surviving rows are
+    selected once.
+
+    When the processor has a StepCache, the output after every step but a
+    row filter followed by more steps is stored, and a run starts from the
+    longest planned prefix already cached for the same input.
+    """
+
+    def __init__(self, steps, processor):
+        self.steps = list(steps)
+        self.processor = processor
+        self.plan = plan_steps(self.steps)
+
+    def describe(self):
+        """Return the planned steps as a DataFrame, one row per step"""
+        return pd.DataFrame([
+            {'step': step['step'], 'arguments': {k: v for k, v in step.items() if k != 'step'}}
+            for step in self.plan
+        ], columns=['step', 'arguments'])
+
+    def run(self, data):
+        """
+        Apply the planned steps to a DataFrame.
+
+        Args:
+            data (pd.DataFrame): Input DataFrame, which is never modified
+
+        Returns:
+            pd.DataFrame: Processed DataFrame
+        """
+        with self.processor._cow_scope():
+            return self._run(data)
+
+    def _run(self, data):
+        if not isinstance(data, pd.DataFrame):
+            logger.warning("Data is not a DataFrame, cannot run pipeline")
+            return data
+
+        processor = self.processor
+        cache = processor.step_cache
+        df = data
+        # Whether df is a frame of our own that steps may modify in place
+        owned = False
+        mask = None
+        start = 0
+
+        fingerprint = frame_fingerprint(data) if cache is not None and self.plan else None
+        if fingerprint is not None:
+            for end in range(len(self.plan), 0, -1):
+                cached = cache.get(self._cache_key(fingerprint, end))
+                if cached is not None:
+                    logger.info(f"Reusing cached output of the first {end} of {len(self.plan)} steps")
+                    df, start = cached, end
+                    break
+
+        for position in range(start, len(self.plan)):
+            step = self.plan[position]
+            name = step['step']
+            kwargs = {k: v for k, v in step.items() if k != 'step'}
+
+            if name in ROW_FILTERS:
+                step_mask = self._row_mask(df, name, kwargs)
+                if step_mask is not None:
+                    mask = step_mask if mask is None else mask & step_mask
+                if position < len(self.plan) - 1:
+                    continue
+
+            if mask is not None:
+                df, owned = self._select(df, mask, owned)
+                mask = None
+
+            if name not in ROW_FILTERS:
+                df, owned = self._apply(df, owned, name, kwargs)
+
+            # An unchanged input is not cached, the caller may still modify it
+            if fingerprint is not None and df is not data:
+                cache.put(self._cache_key(fingerprint, position + 1), df)
+                # The cached frame is shared from now on, later steps work on a copy
+                owned = False
+
+        logger.info(f"Pipeline ran {len(self.plan) - start} steps, {len(data)} rows in, {len(df)} rows out")
+        # Never hand back the caller's own frame or a cached one
+        return df if owned else processor._own(df)
+
+    def run_chunked(self, source, destination, chunksize=DEFAULT_CHUNK_ROWS, source_format=None,
+                    destination_format=None, compression=None, **read_options):
+        """
+        Apply the planned steps to a file too large for memory, one chunk at a time.
+
+        Each chunk is read, processed and appended to the output before the
+        next is read. Row-wise steps need no state; remove_duplicates keeps
+        a 64-bit hash of every distinct row, remove_cross_source_duplicates
+        one index for the whole run and forward fill the last value of each
+        column. Mean, Median, Mode and Backward Fill need the whole dataset
+        and are rejected.
+
+        Args:
+            source (str): CSV, Parquet or Arrow IPC input file
+            destination (str): CSV, Parquet or Arrow IPC output file, written
+                under a temporary name and moved into place when complete
+            chunksize (int): Rows per chunk
+            source_format (str, optional): Input format, from the extension by default
+            destination_format (str, optional): Output format, from the extension by default
+            compression (str, optional): Parquet or Arrow codec, e.g. "zstd"; CSV
+                output is compressed when the destination ends in .gz, .bz2 or .xz
+            read_options: Extra arguments for pd.read_csv, e.g. dtype
+
+        Returns:
+            dict: Rows read and written, and the number of chunks
+        """
+        for step in self.plan:
+            method = step.get('method', "Mean")
+            if step['step'] == 'fill_missing_values' and method not in STREAMING_FILL_METHODS:
+                raise ValueError(f"Filling with '{method}' needs the whole dataset and cannot run out of core")
+
+        writer_options = {}
+        if compression is not None and detect_format(destination, destination_format) in ('parquet', 'arrow'):
+            writer_options['compression'] = compression
+
+        # State of the steps that look beyond the current chunk, by plan position
+        state = {}
+        rows_in = 0
+        chunks = 0
+
+        with open_writer(destination, destination_format, **writer_options) as writer:
+            for chunk in iter_frames(source, chunksize, source_format, **read_options):
+                rows_in += len(chunk)
+                chunks += 1
+                with self.processor._cow_scope():
+                    processed = self._run_chunk(chunk, state)
+                writer.write(processed)
+
+        logger.info(f"Processed {rows_in} rows in {chunks} chunks, wrote {writer.rows} rows to {destination}")
+        return {'rows_in': rows_in, 'rows_out': writer.rows, 'chunks': chunks}
+
+    def _run_chunk(self, df, state):
+        """Apply the planned steps to one chunk of a chunked run"""
+        # A freshly read chunk belongs to nobody else
+        owned = True
+        mask = None
+
+        for position, step in enumerate(self.plan):
+            name = step['step']
+            kwargs = {k: v for k, v in step.items() if k != 'step'}
+
+            if name in ROW_FILTERS:
+                step_mask = self._row_mask(df, name, kwargs)
+                if step_mask is not None:
+                    mask = step_mask if mask is None else mask & step_mask
+                continue
+
+            if mask is not None:
+                df, owned = self._select(df, mask, owned)
+                mask = None
+
+            if name == 'remove_duplicates':
+                seen = state.setdefault(position, set())
+                df, owned = self._select(df, _first_seen(_row_hashes(df), seen), owned, "duplicate")
+
+            elif name == 'remove_cross_source_duplicates':
+                if position not in state:
+                    index = DedupIndex(path=kwargs.get('index_path'))
+                    state[position] = (index, len(index))
+                index, known_before = state[position]
+                df = index.deduplicate(
+                    df,
+                    url_columns=kwargs.get('url_columns'),
+                    text_columns=kwargs.get('text_columns'),
+                    drop_seen=kwargs.get('drop_seen', False),
+                    known_before=known_before,
+                )
+                owned = False
+
+            elif name == 'fill_missing_values' and kwargs.get('method') == "Forward Fill":
+                if not owned:
+                    df = self.processor._own(df)
+                    owned = True
+                df.ffill(inplace=True)
+                # Leading gaps take the last value of the previous chunks
+                if state.get(position):
+                    df.fillna(state[position], inplace=True)
+                if len(df):
+                    state[position] = df.iloc[-1].dropna().to_dict()
+
+            else:
+                df, owned = self._apply(df, owned, name, kwargs)
+
+        if mask is not None:
+            df, owned = self._select(df, mask, owned)
+        return df
+
+    def _apply(self, df, owned, name, kwargs):
+        """Run a step that is not a row filter, returning the new frame and whether we own it"""
+        processor = self.processor
+
+        if name == 'remove_duplicates':
+            return self._select(df, ~df.duplicated().to_numpy(), owned, "duplicate")
+
+        if name == 'remove_cross_source_duplicates':
+            return processor.remove_cross_source_duplicates(df, **kwargs), False
+
+        if name in COLUMN_STEPS and kwargs.get('column') not in df.columns:
+            logger.warning(f"Column '{kwargs.get('column')}' not found in data")
+            return df, owned
+
+        if not owned:
+            df = processor._own(df)
+
+        if name == 'fill_missing_values':
+            df = processor._fill_missing(df, kwargs.get('method', "Mean"), kwargs.get('fill_value'))
+        elif name == 'convert_data_type':
+            df = processor._convert_column(df, kwargs['column'], kwargs['target_type'], kwargs.get('workers'))
+        elif name == 'clean_text':
+            df = processor._clean_column(df, kwargs['column'], kwargs['clean_options'], kwargs.get('workers'))
+        return df, True
+
+    def _cache_key(self, fingerprint, end):
+        """Key of the output after the first end planned steps"""
+        settings = {'nltk_tokenize': self.processor.nltk_tokenize}
+        return fingerprint + json.dumps([settings] + self.plan[:end], sort_keys=True, default=str)
+
+    def _row_mask(self, df, name, kwargs):
+        """Rows a filter step keeps, or None when it keeps all of them"""
+        if name == 'remove_empty_rows':
+            return df.notna().any(axis=1).to_numpy()
+
+        column = kwargs.get('column')
+        if column not in df.columns:
+            logger.warning(f"Column '{column}' not found in data")
+            return None
+        return self.processor._filter_mask(df, column, kwargs.get('filter_type'), kwargs.get('filter_value'))
+
+    def _select(self, df, mask, owned, label="filtered"):
+        """Keep the rows of a mask, copying them only when some are dropped"""
+        removed = len(mask) - int(np.count_nonzero(mask))
+        if removed:
+            logger.info(f"Removed {removed} {label} rows")
+            # take() builds a new frame of the kept rows, which we then own
+            return df.take(np.flatnonzero(mask)), True
+        return df, owned
+
+
+if __name__ == "__main__":
+    from .data_processor import DataProcessor
+
+    parser = argparse.ArgumentParser(description="Process a CSV, Parquet or Arrow IPC file too large for memory in chunks")
+    parser.add_argument('source', help="Input CSV, Parquet or Arrow IPC file")
+    parser.add_argument('destination', help="Output CSV, Parquet or Arrow IPC file")
+    parser.add_argument('--steps', required=True, help="JSON file with the list of pipeline steps")
+    parser.add_argument('--chunksize', type=int, default=DEFAULT_CHUNK_ROWS, help="Rows per chunk")
+    parser.add_argument('--compression', help="Parquet or Arrow compression codec, e.g. zstd")
+    parser.add_argument('--workers', type=int, help="Processes for row-wise steps, 0 for every core")
+    args = parser.parse_args()
+
+    with open(args.steps, 'r', encoding='utf-8') as f:
+        steps = json.load(f)
+
+    result = DataProcessor(workers=args.workers).process_file(
+        args.source, args.destination, steps, chunksize=args.chunksize, compression=args.compression,
+    )
+    print(json.dumps(result))
@@ -0,0 +1,562 @@
+import os
+import json
+import time
+import asyncio
+import random
+import logging
+import tempfile
+import argparse
+import threading
+import pandas as pd
+import requests
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit, parse_qsl, urlencode
+from requests.adapters import BaseAdapter, HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+logger = logging.getLogger(__name__)
+
+# Query used for each platform when benchmarking, matching the synthetic cassettes
+BENCHMARK_JOBS = {
+    "Twitter/X": ("Username", "nasa"),
+    "Reddit": ("Subreddit", "python"),
+    "YouTube Comments": (None, "https://www.youtube.com/watch?v=dQw4w9WgXcQ"),
+    "HackerNews": ("New Stories", ""),
+}
+
+
+def _normalize_url(method, url):
+    """Build a lookup key that ignores query parameter order"""
+    parts = urlsplit(url)
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return f"{method.upper()} {parts.scheme}://{parts.netloc}{parts.path}?{query}"
+
+
+class Cassette:
+    """
+    A set of recorded HTTP interactions.
+
+    Each interaction stores the request method and URL together with the
+    response status, headers and body text, and is persisted as JSON so real
+    responses can be replayed without network access.
+    """
+
+    def __init__(self, interactions=None):
+        self._lock = threading.Lock()
+        self.interactions = {}
+        for interaction in interactions or []:
+            self.interactions[_normalize_url(interaction['method'], interaction['url'])] = interaction
+
+    @classmethod
+    def load(cls, path):
+        """Load a cassette from a JSON file"""
+        with open(path, 'r', encoding='utf-8') as f:
+            return cls(json.load(f))
+
+    def save(self, path):
+        """Write the cassette to a JSON file"""
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(list(self.interactions.values()), f, indent=2)
+
+    def add(self, method, url, status, headers, body):
+        """Record a response; a later response for the same request replaces it"""
+        with self._lock:
+            self.interactions[_normalize_url(method, url)] = {
+                'method': method.upper(),
+                'url': url,
+                'status': status,
+                'headers': dict(headers),
+                'body': body,
+            }
+
+    def find(self, method, url):
+        """Return the interaction recorded for a request, or None"""
+        return self.interactions.get(_normalize_url(method, url))
+
+    def __len__(self):
+        return len(self.interactions)
+
+
+class RecordingSession(requests.Session):
+    """requests.Session that records every response it receives into a cassette"""
+
+    def __init__(self, cassette):
+        super().__init__()
+        self.cassette = cassette
+
+    def request(self, method, url, *args, **kwargs):
+        response = super().request(method, url, *args, **kwargs)
+        self.cassette.add(method, response.request.url, response.status_code,
+                          response.headers, response.text)
+        return response
+
+
+class ReplayAdapter(BaseAdapter):
+    """
+    Transport adapter answering requests from a cassette in-process.
+
+    Requests without a recorded response fail with a ConnectionError, the
+    same way an unreachable host would.
+    """
+
+    def __init__(self, cassette, latency=0.0):
+        super().__init__()
+        self.cassette = cassette
+        self.latency = latency
+
+    def send(self, request, **kwargs):
+        if self.latency:
+            time.sleep(self.latency)
+
+        interaction = self.cassette.find(request.method, request.url)
+        if interaction is None:
+            raise requests.exceptions.ConnectionError(f"No recorded response for {request.method} {request.url}")
+
+        response = requests.Response()
+        response.status_code = interaction['status']
+        response.headers = CaseInsensitiveDict(interaction.get('headers', {}))
+        response._content = interaction.get('body', '').encode('utf-8')
+        response.encoding = 'utf-8'
+        response.url = request.url
+        response.request = request
+        return response
+
+    def close(self):
+        pass
+
+
+def replay_session(cassette, latency=0.0):
+    """Create a session that serves every request from a cassette"""
+    session = requests.Session()
+    adapter = ReplayAdapter(cassette, latency)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+def async_replay_session(cassette, latency=0.0):
+    """Create an AsyncHttpClient that serves every request from a cassette"""
+    from .http_client import AsyncHttpClient, HostRateLimiter, httpx
+
+    if httpx is None:
+        raise ImportError("Async replay requires httpx. Install it with `pip install httpx`.")
+
+    async def handle(request):
+        if latency:
+            await asyncio.sleep(latency)
+
+        interaction = cassette.find(request.method, str(request.url))
+        if interaction is None:
+            raise httpx.ConnectError(f"No recorded response for {request.method} {request.url}", request=request)
+
+        # The body is stored decoded, so drop headers describing the wire encoding
+        headers = {
+            key: value for key, value in interaction.get('headers', {}).items()
+            if key.lower() not in ('content-encoding', 'content-length', 'transfer-encoding')
+        }
+        return httpx.Response(interaction['status'], headers=headers,
+                              content=interaction.get('body', '').encode('utf-8'))
+
+    return AsyncHttpClient(transport=httpx.MockTransport(handle), cache_ttl=0, rate_limiter=HostRateLimiter())
+
+
+class LocalServerAdapter(HTTPAdapter):
+    """Rewrites absolute URLs so they are sent to a ReplayServer instead"""
+
+    def __init__(self, base_url, **kwargs):
+        super().__init__(**kwargs)
+        self.base_url = base_url.rstrip('/')
+
+    def send(self, request, **kwargs):
+        parts = urlsplit(request.url)
+        request.url = f"{self.base_url}/{parts.scheme}/{parts.netloc}{parts.path}"
+        if parts.query:
+            request.url += f"?{parts.query}"
+        return super().send(request, **kwargs)
+
+
+class ReplayServer:
+    """
+    Local stand-in HTTP server serving recorded responses.
+
+    Requests are addressed as ``/<scheme>/<host>/<path>`` so one server can
+    impersonate every host in a cassette; use ``session()`` to get a client
+    that rewrites URLs accordingly. Each response is delayed by ``latency``
+    seconds to simulate network round trips over a real socket.
+    """
+
+    def __init__(self, cassette, latency=0.0, host='127.0.0.1', port=0):
+        self.cassette = cassette
+        self.latency = latency
+
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                server._handle(self)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._httpd = ThreadingHTTPServer((host, port), Handler)
+        self._httpd.daemon_threads = True
+        self._thread = None
+
+    @property
+    def base_url(self):
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        """Start serving in a background thread"""
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Shut the server down"""
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def session(self, pool_maxsize=32):
+        """Create a session whose requests are routed to this server"""
+        session = requests.Session()
+        adapter = LocalServerAdapter(self.base_url, pool_maxsize=pool_maxsize)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        return session
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def _handle(self, handler):
+        """Answer one request from the cassette"""
+        if self.latency:
+            time.sleep(self.latency)
+
+        scheme, _, rest = handler.path.lstrip('/').partition('/')
+        interaction = self.cassette.find('GET', f"{scheme}://{rest}")
+
+        if interaction is None:
+            handler.send_response(404)
+            handler.send_header('Content-Length', '0')
+            handler.end_headers()
+            return
+
+        body = interaction.get('body', '').encode('utf-8')
+        handler.send_response(interaction['status'])
+        for name, value in interaction.get('headers', {}).items():
+            if name.lower() not in ('content-length', 'content-encoding', 'transfer-encoding', 'connection'):
+                handler.send_header(name, value)
+        handler.send_header('Content-Length', str(len(body)))
+        handler.end_headers()
+        handler.wfile.write(body)
+
+
+def record(platform, query_type, query, path, **scrape_kwargs):
+    """
+    Run a live scrape and save every response it received to a cassette.
+
+    Args:
+        platform (str): Platform name as accepted by SocialMediaScraper.scrape
+        query_type (str): Type of query
+        query (str): The search term
+        path (str): File to write the cassette to
+        **scrape_kwargs: Extra arguments for SocialMediaScraper.scrape
+
+    Returns:
+        Cassette: The recorded cassette
+    """
+    from .social_scraper import SocialMediaScraper
+
+    cassette = Cassette()
+    with tempfile.TemporaryDirectory() as tmp:
+        scraper = SocialMediaScraper(
+            session=RecordingSession(cassette),
+            instance_cache_path=os.path.join(tmp, 'instances.json'),
+            watermark_path=os.path.join(tmp, 'watermarks.json'),
+        )
+        scraper.scrape(platform, query_type, query, **scrape_kwargs)
+
+    cassette.save(path)
+    logger.info(f"Recorded {len(cassette)} responses to {path}")
+    return cassette
+
+
+def synthetic_cassettes(items=100, seed=0):
+    """
+    Build cassettes shaped like real responses from every supported platform.
+
+    They let the benchmark run without recorded fixtures; cassettes saved by
+    ``record`` can be used in their place for measurements on real pages.
+
+    Args:
+        items (int): Number of posts, tweets or comments per platform
+        seed (int): Seed for the generated text
+
+    Returns:
+        dict: Cassette per platform name
+    """
+    from .social_scraper import SocialMediaScraper
+
+    rng = random.Random(seed)
+    words = ("data python release update community thread video comment story "
+             "launch feature bug fix api model open source benchmark").split()
+    now = datetime.now()
+
+    def sentence(n=12):
+        return ' '.join(rng.choice(words) for _ in range(n))
+
+    json_headers = {'Content-Type': 'application/json; charset=utf-8'}
+    html_headers = {'Content-Type': 'text/html; charset=utf-8'}
+
+    # Twitter via Nitter
+    nitter = SocialMediaScraper.NITTER_INSTANCES[0]
+    twitter = Cassette()
+    twitter.add('GET', nitter, 200, html_headers, '<html><body>Nitter</body></html>')
+    tweets = []
+    for i in range(items):
+        posted = now - timedelta(minutes=5 * i)
+        posted_title = f"{posted:%b} {posted.day}, {posted.year} · {posted.hour % 12 or 12}:{posted:%M %p} UTC"
+        tweets.append(f"""
+        <div class="timeline-item">
+          <a class="tweet-link" href="/nasa/status/{10**15 + items - i}#m"></a>
+          <div class="tweet-header">
+            <a class="fullname" href="/nasa">NASA</a>
+            <a class="username" href="/nasa">@nasa</a>
+            <span class="tweet-date"><a href="/nasa/status/{10**15 + items - i}#m"
+              title="{posted_title}">{i * 5}m</a></span>
+          </div>
+          <div class="tweet-content media-body">{sentence()}</div>
+          <div class="tweet-stats">
+            <span class="tweet-stat"><div class="icon-container"><span class="icon-comment"></span> {rng.randint(0, 500)} replies</div></span>
+            <span class="tweet-stat"><div class="icon-container"><span class="icon-retweet"></span> {rng.randint(0, 900)} retweets</div></span>
+            <span class="tweet-stat"><div class="icon-container"><span class="icon-heart"></span> {rng.randint(0, 5000)} likes</div></span>
+          </div>
+        </div>""")
+    # Nitter serves 20 tweets per page, each page linking to the next with a cursor
+    page_size = 20
+    for page, start in enumerate(range(0, items, page_size)):
+        more = ''
+        if start + page_size < items:
+            more = f'<div class="show-more"><a href="?cursor=page{page + 1}">Load more</a></div>'
+        url = f"{nitter}nasa" + (f"?cursor=page{page}" if page else '')
+        twitter.add('GET', url, 200, html_headers,
+                    f'<html><body><div class="timeline">{"".join(tweets[start:start + page_size])}'
+                    f'{more}</div></body></html>')
+
+    # Reddit JSON API
+    reddit = Cassette()
+    rate_headers = dict(json_headers, **{
+        'X-Ratelimit-Remaining': '99', 'X-Ratelimit-Reset': '600', 'X-Ratelimit-Used': '1',
+    })
+    children = []
+    for i in range(min(items, 100)):
+        post_id = f"p{i:05d}"
+        permalink = f"/r/python/comments/{post_id}/post_{i}/"
+        children.append({'kind': 't3', 'data': {
+            'title': sentence(8), 'author': f"user{rng.randint(0, 50)}", 'subreddit': 'python',
+            'selftext': sentence(40), 'url': f"https://example.com/{post_id}", 'permalink': permalink,
+            'created_utc': (now - timedelta(minutes=7 * i)).timestamp(), 'score': rng.randint(0, 3000),
+            'upvote_ratio': round(rng.random(), 2), 'num_comments': 5, 'is_video': False,
+            'is_original_content': False, 'is_self': True,
+        }})
+        comments = [{'kind': 't1', 'data': {
+            'author': f"user{rng.randint(0, 50)}", 'body': sentence(20), 'score': rng.randint(0, 100),
+            'created_utc': (now - timedelta(minutes=7 * i - j)).timestamp(),
+        }} for j in range(5)]
+        reddit.add('GET', f"https://www.reddit.com{permalink}.json", 200, rate_headers,
+                   json.dumps([{'kind': 'Listing', 'data': {'children': children[-1:]}},
+                               {'kind': 'Listing', 'data': {'children': comments}}]))
+    reddit.add('GET', f"https://www.reddit.com/r/python.json?limit={min(items, 100)}", 200, rate_headers,
+               json.dumps({'kind': 'Listing', 'data': {'children': children}}))
+
+    # YouTube via Invidious
+    invidious = SocialMediaScraper.INVIDIOUS_INSTANCES[0]
+    video_id = 'dQw4w9WgXcQ'
+    youtube = Cassette()
+    youtube.add('GET', f"{invidious}/api/v1/stats", 200, json_headers, json.dumps({'version': '2.0'}))
+    youtube.add('GET', f"{invidious}/api/v1/videos/{video_id}", 200, json_headers, json.dumps({
+        'title': sentence(6), 'author': 'Channel', 'published': int(now.timestamp()) - 86400,
+        'description': sentence(60), 'viewCount': 1000000, 'likeCount': 50000,
+        'dislikeCount': 0, 'subCount': 100000, 'lengthSeconds': 212,
+    }))
+    page_size = 20
+    for page, start in enumerate(range(0, items, page_size)):
+        comments = [{
+            'author': f"viewer{rng.randint(0, 500)}", 'content': sentence(25),
+            'published': int((now - timedelta(minutes=start + j)).timestamp()),
+            'commentId': f"c{start + j:06d}", 'likeCount': rng.randint(0, 1000),
+            'authorIsChannelOwner': False, 'replies': {'replyCount': 0},
+        } for j in range(min(page_size, items - start))]
+        body = {'commentCount': items, 'videoId': video_id, 'comments': comments}
+        if start + page_size < items:
+            body['continuation'] = f"token{page + 1}"
+        url = f"{invidious}/api/v1/comments/{video_id}"
+        if page:
+            url += f"?continuation=token{page}"
+        youtube.add('GET', url, 200, json_headers, json.dumps(body))
+
+    # HackerNews Firebase API
+    api_base = "https://hacker-news.firebaseio.com/v0"
+    hackernews = Cassette()
+    story_ids = [40000000 - i * 10 for i in range(items)]
+    hackernews.add('GET', f"{api_base}/newstories.json", 200, json_headers, json.dumps(story_ids))
+    for i, story_id in enumerate(story_ids):
+        kids = [story_id + k for k in range(1, 6)]
+        created = int((now - timedelta(minutes=3 * i)).timestamp())
+        hackernews.add('GET', f"{api_base}/item/{story_id}.json", 200, json_headers, json.dumps({
+            'id': story_id, 'type': 'story', 'by': f"hn{rng.randint(0, 80)}", 'time': created,
+            'title': sentence(8), 'url': f"https://example.com/{story_id}", 'score': rng.randint(1, 900),
+            'descendants': len(kids), 'kids': kids,
+        }))
+        for kid in kids:
+            hackernews.add('GET', f"{api_base}/item/{kid}.json", 200, json_headers, json.dumps({
+                'id': kid, 'type': 'comment', 'by': f"hn{rng.randint(0, 80)}", 'parent': story_id,
+                'time': created + 60, 'text': sentence(30), 'kids': [],
+            }))
+
+    return {
+        "Twitter/X": twitter,
+        "Reddit": reddit,
+        "YouTube Comments": youtube,
+        "HackerNews": hackernews,
+    }
+
+
+def run_benchmark(cassettes=None, latency=0.05, limit=100, use_server=True, include_replies=True,
+                  use_async=False):
+    """
+    Measure parsing throughput of every platform against replayed responses.
+
+    Args:
+        cassettes (dict, optional): Cassette per platform; synthetic ones by default
+        latency (float): Simulated network delay per request in seconds
+        limit (int): Result limit passed to each scrape
+        use_server (bool): Serve responses over a local socket instead of in-process
+        include_replies (bool): Whether to fetch replies/comments
+        use_async (bool): Run ascrape on an in-process async transport instead of scrape
+
+    Returns:
+        pd.DataFrame: One row per platform with items, seconds and items_per_second
+    """
+    from .social_scraper import RateBudget, SocialMediaScraper
+
+    cassettes = cassettes or synthetic_cassettes(limit)
+    results = []
+
+    for platform, cassette in cassettes.items():
+        query_type, query = BENCHMARK_JOBS[platform]
+        server = ReplayServer(cassette, latency).start() if use_server and not use_async else None
+
+        try:
+            session = server.session() if server else replay_session(cassette, latency)
+            with tempfile.TemporaryDirectory() as tmp:
+                scraper = SocialMediaScraper(
+                    session=session,
+                    async_session=async_replay_session(cassette, latency) if use_async else None,
+                    instance_cache_path=os.path.join(tmp, 'instances.json'),
+                    watermark_path=os.path.join(tmp, 'watermarks.json'),
+                    # Replayed rate limit headers must not spend the process-wide quota
+                    reddit_budget=RateBudget(),
+                )
+                start = time.perf_counter()
+                if use_async:
+                    data = asyncio.run(scraper.ascrape(platform, query_type, query, limit=limit,
+                                                       date_range="All time", include_replies=include_replies))
+                else:
+                    data = scraper.scrape(platform, query_type, query, limit=limit,
+                                          date_range="All time", include_replies=include_replies)
+                elapsed = time.perf_counter() - start
+        finally:
+            if server:
+                server.stop()
+
+        items = 0 if 'message' in data.columns else len(data)
+        results.append({
+            'platform': platform,
+            'items': items,
+            'seconds': round(elapsed, 4),
+            'items_per_second': round(items / elapsed, 1) if elapsed else None,
+            'latency': latency,
+        })
+
+    return pd.DataFrame(results)
+
+
+def run_parser_benchmark(html=None, repeat=20, parsers=('html.parser', 'lxml')):
+    """
+    Measure the Nitter tweet extractor on a single timeline page.
+
+    Args:
+        html (str, optional): Recorded timeline page; a synthetic page by default
+        repeat (int): Number of times the page is parsed per parser
+        parsers (tuple): BeautifulSoup parser backends to compare
+
+    Returns:
+        pd.DataFrame: One row per parser with tweets per page and tweets_per_second
+    """
+    from .social_scraper import SocialMediaScraper
+
+    if html is None:
+        cassette = synthetic_cassettes(items=20)["Twitter/X"]
+        html = cassette.find('GET', f"{SocialMediaScraper.NITTER_INSTANCES[0]}nasa")['body']
+
+    with tempfile.TemporaryDirectory() as tmp:
+        scraper = SocialMediaScraper(
+            instance_cache_path=os.path.join(tmp, 'instances.json'),
+            watermark_path=os.path.join(tmp, 'watermarks.json'),
+        )
+
+        results = []
+        for parser in parsers:
+            try:
+                start = time.perf_counter()
+                for _ in range(repeat):
+                    records = scraper._parse_nitter_page(html, parser=parser)
+                    scraper._parse_nitter_times([record['timestamp'] for record in records])
+                elapsed = time.perf_counter() - start
+            except Exception as e:
+                logger.warning(f"Parser {parser} unavailable: {str(e)}")
+                continue
+
+            results.append({
+                'parser': parser,
+                'tweets': len(records),
+                'seconds_per_page': round(elapsed / repeat, 5),
+                'tweets_per_second': round(len(records) * repeat / elapsed, 1) if elapsed else None,
+            })
+
+    return pd.DataFrame(results)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark SocialMediaScraper against replayed responses")
+    parser.add_argument('--cassette-dir', help="Directory of <platform>.json cassettes saved by record()")
+    parser.add_argument('--latency', type=float, default=0.05, help="Simulated delay per request in seconds")
+    parser.add_argument('--limit', type=int, default=100, help="Result limit per platform")
+    parser.add_argument('--in-process', action='store_true', help="Replay without the local HTTP server")
+    parser.add_argument('--async', dest='use_async', action='store_true', help="Benchmark ascrape instead of scrape")
+    parser.add_argument('--nitter-page', help="Benchmark the tweet extractor on a saved Nitter page instead")
+    args = parser.parse_args()
+
+    if args.nitter_page:
+        with open(args.nitter_page, 'r', encoding='utf-8') as f:
+            print(run_parser_benchmark(f.read()).to_string(index=False))
+        raise SystemExit(0)
+
+    cassettes = None
+    if args.cassette_dir:
+        cassettes = {}
+        for platform in BENCHMARK_JOBS:
+            path = os.path.join(args.cassette_dir, f"{platform.replace('/', '_')}.json")
+            if os.path.exists(path):
+                cassettes[platform] = Cassette.load(path)
+
+    print(run_benchmark(cassettes, latency=args.latency, limit=args.limit,
+                        use_server=not args.in_process, use_async=args.use_async).to_string(index=False))
@@ -0,0 +1,250 @@
+import os
+import json
+import glob
+import logging
+import threading
+import numpy as np
+import pandas as pd
+from datetime import date, datetime
+from .social_schema import ColumnarFrameBuilder
+
+try:
+    import pyarrow  # noqa: F401
+    PARQUET_AVAILABLE = True
+except ImportError:
+    PARQUET_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+
+def _json_default(value):
+    """Serialize the non-JSON values found in social items"""
+    if value is pd.NaT or value is pd.NA:
+        return None
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, np.generic):
+        return value.item()
+    return str(value)
+
+
+def open_sink(path, format=None, **kwargs):
+    """
+    Create a sink for a path, picking the format from the extension when not given.
+
+    Args:
+        path (str): NDJSON file, or directory of Parquet parts for ".parquet" paths
+        format (str, optional): "ndjson" or "parquet"
+
+    Returns:
+        NDJSONSink or ParquetSink: Open sink
+    """
+    format = (format or ('parquet' if path.lower().endswith('.parquet') else 'ndjson')).lower()
+    if format == 'ndjson':
+        return NDJSONSink(path, **kwargs)
+    if format == 'parquet':
+        return ParquetSink(path, **kwargs)
+    raise ValueError(f"Unsupported sink format: {format}")
+
+
+class NDJSONSink:
+    """
+    Writes social items to a newline-delimited JSON file as they arrive.
+
+    Every item is flushed as soon as it is appended, so a crashed scrape
+    leaves all items collected up to that point on disk. Exposes the same
+    append/len/build interface as ColumnarFrameBuilder.
+    """
+
+    def __init__(self, path, append=False):
+        self.path = path
+        self.length = 0
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self._file = open(path, 'a' if append else 'w', encoding='utf-8')
+
+    def __len__(self):
+        return self.length
+
+    def append(self, item):
+        """Write one item as a JSON line"""
+        line = json.dumps(item, default=_json_default, ensure_ascii=False)
+        with self._lock:
+            self._file.write(line + '\n')
+            self._file.flush()
+            self.length += 1
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        with self._lock:
+            if not self._file.closed:
+                self._file.close()
+
+    def build(self):
+        """
+        Return a lazy handle to the items written so far.
+
+        The sink stays open for further items until close() is called.
+
+        Returns:
+            StreamedResult: Handle reading the items back on demand
+        """
+        return StreamedResult(self.path, 'ndjson')
+
+
+class ParquetSink:
+    """
+    Writes social items to a directory of Parquet files, one per row group.
+
+    Items are buffered in a ColumnarFrameBuilder and written out every
+    ``row_group_size`` items. Each part is written to a temporary name and
+    renamed into place, so completed parts stay readable after a crash and
+    parts may differ in columns (posts vs comments) without a shared schema.
+
+    A directory that already holds files is refused unless overwrite=True,
+    in which case the part files of the earlier results are removed.
+    """
+
+    def __init__(self, path, row_group_size=1000, compression='snappy', overwrite=False):
+        if not PARQUET_AVAILABLE:
+            raise ImportError("Parquet output requires pyarrow. Install it with `pip install pyarrow`.")
+
+        self.path = path
+        self.row_group_size = row_group_size
+        self.compression = compression
+        self.length = 0
+        self._parts = 0
+        self._buffer = ColumnarFrameBuilder()
+        self._lock = threading.Lock()
+
+        if os.path.isdir(path) and os.listdir(path):
+            if not overwrite:
+                raise FileExistsError(f"Parquet sink directory is not empty: {path}; pass overwrite=True to replace it")
+            for stale in glob.glob(os.path.join(path, 'part-*.parquet*')):
+                os.remove(stale)
+        os.makedirs(path, exist_ok=True)
+
+    def __len__(self):
+        return self.length
+
+    def append(self, item):
+        """Buffer one item, writing a part file when the row group is full"""
+        with self._lock:
+            self._buffer.append(item)
+            self.length += 1
+            if len(self._buffer) >= self.row_group_size:
+                self._flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        with self._lock:
+            self._flush()
+
+    def build(self):
+        """
+        Write any buffered items and return a lazy handle to the parts.
+
+        The sink stays open for further items; close() writes the last part.
+
+        Returns:
+            StreamedResult: Handle reading the items back on demand
+        """
+        with self._lock:
+            self._flush()
+        return StreamedResult(self.path, 'parquet')
+
+    def _flush(self):
+        """Write the buffered items as the next part; callers must hold the lock"""
+        if not len(self._buffer):
+            return
+
+        part_path = os.path.join(self.path, f"part-{self._parts:05d}.parquet")
+        tmp_path = f"{part_path}.tmp"
+        self._buffer.build().to_parquet(tmp_path, index=False, compression=self.compression)
+        os.replace(tmp_path, part_path)
+
+        self._parts += 1
+        self._buffer = ColumnarFrameBuilder()
+
+
+class StreamedResult:
+    """
+    Lazy handle to scrape results written by a sink.
+
+    Nothing is loaded until requested; iter_frames reads the results in
+    bounded batches, to_dataframe loads them all.
+    """
+
+    def __init__(self, path, format):
+        self.path = path
+        self.format = format
+
+    def __repr__(self):
+        return f"StreamedResult(path={self.path!r}, format={self.format!r})"
+
+    def __len__(self):
+        if self.format == 'ndjson':
+            with open(self.path, 'r', encoding='utf-8') as f:
+                return sum(1 for line in f if line.strip())
+
+        import pyarrow.parquet as pq
+        return sum(pq.ParquetFile(part).metadata.num_rows for part in self._parts())
+
+    def iter_frames(self, batch_size=1000):
+        """
+        Yield the results as typed DataFrames of at most ``batch_size`` rows.
+
+        Parquet results are yielded one part file at a time.
+        """
+        if self.format == 'parquet':
+            for part in self._parts():
+                yield pd.read_parquet(part)
+            return
+
+        batch = ColumnarFrameBuilder()
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    batch.append(json.loads(line))
+                except ValueError:
+                    # A crash can leave a truncated last line
+                    logger.warning(f"Skipping malformed line in {self.path}")
+                    continue
+                if len(batch) >= batch_size:
+                    yield batch.build()
+                    batch = ColumnarFrameBuilder()
+
+        if len(batch):
+            yield batch.build()
+
+    def head(self, n=5):
+        """Return the first n rows without reading the rest"""
+        for frame in self.iter_frames(batch_size=n):
+            return frame.head(n)
+        return pd.DataFrame()
+
+    def to_dataframe(self):
+        """Load all results into a single DataFrame"""
+        frames = list(self.iter_frames(batch_size=10000))
+        if not frames:
+            return pd.DataFrame()
+        if len(frames) == 1:
+            return frames[0]
+        return pd.concat(frames, ignore_index=True)
+
+    def _parts(self):
+        return sorted(glob.glob(os.path.join(self.path, 'part-*.parquet')))
@@ -0,0 +1,142 @@
+import logging
+import pandas as pd
+
+try:
+    import pyarrow  # noqa: F401
+    STRING_DTYPE = "string[pyarrow]"
+except ImportError:
+    STRING_DTYPE = "string"
+
+logger = logging.getLogger(__name__)
+
+# Logical type of every column produced by SocialMediaScraper. Posts and
+# comments share column names, so one table covers both item types.
+SOCIAL_SCHEMA = {
+    # Row structure
+    'item_type': 'category',
+    'parent_id': 'string',
+
+    # Timestamps
+    'timestamp': 'datetime',
+    'created_utc': 'datetime',
+    'time': 'datetime',
+    'published': 'datetime',
+    'video_published': 'datetime',
+
+    # Low-cardinality labels
+    'author': 'category',
+    'username': 'category',
+    'by': 'category',
+    'subreddit': 'category',
+    'type': 'category',
+    'video_author': 'category',
+    'video_type': 'category',
+
+    # Free text and links
+    'fullname': 'string',
+    'content': 'string',
+    'title': 'string',
+    'selftext': 'string',
+    'body': 'string',
+    'text': 'string',
+    'description': 'string',
+    'video_title': 'string',
+    'url': 'string',
+    'link': 'string',
+    'permalink': 'string',
+    'hn_link': 'string',
+    'comment_id': 'string',
+
+    # Counters
+    'score': 'int',
+    'num_comments': 'int',
+    'descendants': 'int',
+    'replies': 'int',
+    'reply_count': 'int',
+    'retweets': 'int',
+    'likes': 'int',
+    'view_count': 'int',
+    'like_count': 'int',
+    'dislike_count': 'int',
+    'subscriber_count': 'int',
+    'length_seconds': 'int',
+
+    # Other metadata
+    'upvote_ratio': 'float',
+    'is_video': 'bool',
+    'is_original_content': 'bool',
+    'is_self': 'bool',
+    'is_owner': 'bool',
+}
+
+
+class ColumnarFrameBuilder:
+    """
+    Accumulates social items column by column and builds a typed DataFrame.
+
+    Values are appended straight into per-column lists, so no intermediate
+    list of row dicts is kept, and each column is converted once with a
+    vectorized cast according to SOCIAL_SCHEMA. Columns not in the schema
+    fall back to pandas type inference.
+    """
+
+    def __init__(self, schema=None):
+        self.schema = schema or SOCIAL_SCHEMA
+        self.columns = {}
+        self.length = 0
+
+    def __len__(self):
+        return self.length
+
+    def append(self, item):
+        """
+        Add one item.
+
+        Args:
+            item (dict): Column values for the item; missing columns become null
+        """
+        for name, value in item.items():
+            column = self.columns.get(name)
+            if column is None:
+                column = self.columns[name] = [None] * self.length
+            column.append(value)
+
+        self.length += 1
+        for column in self.columns.values():
+            if len(column) < self.length:
+                column.append(None)
+
+    def build(self):
+        """
+        Convert the accumulated columns into a DataFrame.
+
+        Returns:
+            pd.DataFrame: Typed frame with one row per appended item
+        """
+        data = {}
+        for name, values in self.columns.items():
+            data[name] = self._convert(name, values)
+
+        return pd.DataFrame(data, index=pd.RangeIndex(self.length))
+
+    def _convert(self, name, values):
+        """Cast a single column to the dtype declared for it"""
+        kind = self.schema.get(name)
+
+        try:
+            if kind == 'datetime':
+                return pd.to_datetime(pd.Series(values, dtype=object), errors='coerce')
+            if kind == 'int':
+                return pd.to_numeric(pd.Series(values, dtype=object), errors='coerce').astype('Int64')
+            if kind == 'float':
+                return pd.to_numeric(pd.Series(values, dtype=object), errors='coerce').astype('Float64')
+            if kind == 'bool':
+                return pd.Series(values, dtype='boolean')
+            if kind == 'category':
+                return pd.Series(values, dtype='category')
+            if kind == 'string':
+                return pd.Series(values, dtype=STRING_DTYPE)
+        except (TypeError, ValueError) as e:
+            logger.warning(f"Could not convert column '{name}' to {kind}: {str(e)}")
+
+        return pd.Series(values)
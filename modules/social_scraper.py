@@ -1,29 +1,288 @@
 import os
 import logging
 import pandas as pd
-import requests
 import time
 import re
+import asyncio
+import threading
+import itertools
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from bs4 import BeautifulSoup
-from urllib.parse import quote_plus
+import soupsieve
+from bs4 import BeautifulSoup, SoupStrainer, Tag
+from html import unescape
+from urllib.parse import quote_plus, urljoin
+from .instance_health import InstanceHealthRegistry
+from .watermark_store import WatermarkStore
+from .social_schema import ColumnarFrameBuilder
+from .result_sink import open_sink
+from .http_client import DEFAULT_HEADERS, TRANSPORT_ERRORS, get_default_client, get_default_async_client
+from .metrics import get_default_metrics, timed_stage
+
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+
+# "Load more" link at the bottom of a Nitter timeline page
+NITTER_CURSOR_PATTERN = re.compile(r'class="show-more"[^>]*>\s*<a href="([^"]*cursor=[^"]*)"')
+
+# Precompiled pieces of the Nitter tweet extractor
+TIMELINE_STRAINER = SoupStrainer(class_='timeline-item')
+TIMELINE_ITEM_SELECTOR = soupsieve.compile('.timeline-item:not(.show-more)')
+TWEET_ID_PATTERN = re.compile(r'/status/(\d+)')
+NITTER_TEXT_FIELDS = {
+    'tweet-content': 'content',
+    'username': 'username',
+    'fullname': 'fullname',
+}
+NITTER_TIME_FORMAT = '%b %d, %Y · %I:%M %p'
+
+HN_API_BASE = "https://hacker-news.firebaseio.com/v0"
+
+
+class RateBudget:
+    """
+    Request budget shared by concurrent workers hitting the same API.
+    
+    The budget is driven by the ``X-Ratelimit-Remaining`` and
+    ``X-Ratelimit-Reset`` headers that Reddit returns on every response, so
+    workers only wait when the real quota is exhausted instead of sleeping
+    a fixed amount after every request.
+    
+    While the quota is unknown (before the first response or once a window
+    has expired) a single probe request is let through and the other
+    workers wait for its update(). If responses carry no rate limit headers
+    every request becomes such a probe, so requests are serialized rather
+    than unlimited.
+    """
+    
+    # Seconds before waiting workers give up on a probe that never reported back
+    PROBE_TIMEOUT = 30
+    
+    # Polling interval of async_acquire, which cannot wait on the condition
+    POLL_INTERVAL = 0.05
+    
+    def __init__(self, reserve=1):
+        self.reserve = reserve
+        self.remaining = None
+        self.reset_at = 0.0
+        self._probe_started = None
+        self._condition = threading.Condition()
+    
+    def _take(self):
+        """Consume one unit of budget; return None if granted, else the seconds to wait"""
+        now = time.monotonic()
+        if self.remaining is not None and now < self.reset_at:
+            if self.remaining > self.reserve:
+                self.remaining -= 1
+                return None
+            return self.reset_at - now
+        
+        # Unknown or expired window: one request probes for the real quota
+        if self._probe_started is None or now - self._probe_started >= self.PROBE_TIMEOUT:
+            self.remaining = None
+            self._probe_started = now
+            return None
+        return self._probe_started + self.PROBE_TIMEOUT - now
+    
+    def acquire(self):
+        """Block until a request may be sent, then consume one unit of budget"""
+        with self._condition:
+            while True:
+                delay = self._take()
+                if delay is None:
+                    return
+                self._condition.wait(delay)
+    
+    async def async_acquire(self):
+        """Wait without blocking the event loop until a request may be sent"""
+        while True:
+            with self._condition:
+                delay = self._take()
+            if delay is None:
+                return
+            await asyncio.sleep(min(delay, self.POLL_INTERVAL))
+    
+    def update(self, headers=None):
+        """
+        Refresh the budget from the rate limit headers of a response.
+        
+        Must follow every acquire(), with headers=None when the request
+        failed or its headers cannot be trusted, so a pending probe is
+        always released.
+        """
+        headers = headers or {}
+        remaining = headers.get('X-Ratelimit-Remaining')
+        reset = headers.get('X-Ratelimit-Reset')
+        retry_after = headers.get('Retry-After')
+        
+        with self._condition:
+            self._probe_started = None
+            try:
+                if remaining is not None and reset is not None:
+                    self.remaining = float(remaining)
+                    self.reset_at = time.monotonic() + float(reset)
+                elif retry_after is not None:
+                    self.remaining = 0
+                    self.reset_at = time.monotonic() + float(retry_after)
+            except ValueError:
+                pass
+            self._condition.notify_all()
+
+
+_default_reddit_budget = None
+_default_reddit_budget_lock = threading.Lock()
+
+
+def get_default_reddit_budget():
+    """
+    Return the Reddit RateBudget shared by every scraper in this process.
+
+    Reddit counts requests per client, so a scraper rebuilt on every app
+    rerun must keep drawing from the quota its predecessors learned.
+    """
+    global _default_reddit_budget
+    with _default_reddit_budget_lock:
+        if _default_reddit_budget is None:
+            _default_reddit_budget = RateBudget()
+        return _default_reddit_budget
+
+
+class IncrementalSink:
+    """
+    Applies a watermark to items on their way into a streaming sink.
+    
+    Streamed results are never held as one DataFrame, so this does per item
+    what _apply_watermark does on a finished frame: items at or before the
+    watermark are dropped, comments follow their parent post, and the
+    newest timestamp seen is tracked for the next run.
+    """
+    
+    def __init__(self, sink, time_col, id_col, watermark=None):
+        self.sink = sink
+        self.time_col = time_col
+        self.id_col = id_col
+        self.watermark = watermark
+        self.newest = None
+        self.newest_ids = set()
+        self._kept_ids = set()
+    
+    def __len__(self):
+        return len(self.sink)
+    
+    def append(self, item):
+        """Forward an item to the sink unless the watermark already covers it"""
+        if item.get('item_type') == 'comment':
+            if item.get('parent_id') in self._kept_ids:
+                self.sink.append(item)
+            return
+        
+        timestamp = item.get(self.time_col)
+        item_id = str(item.get(self.id_col, ''))
+        if timestamp is not None and self.watermark:
+            if timestamp < self.watermark['timestamp']:
+                return
+            if timestamp == self.watermark['timestamp'] and item_id in self.watermark['ids']:
+                return
+        
+        self._kept_ids.add(item_id)
+        self.sink.append(item)
+        
+        if timestamp is not None:
+            if self.newest is None or timestamp > self.newest:
+                self.newest = timestamp
+                self.newest_ids = {item_id}
+            elif timestamp == self.newest:
+                self.newest_ids.add(item_id)
+    
+    def close(self):
+        self.sink.close()
+    
+    def build(self):
+        return self.sink.build()
+
 
 class SocialMediaScraper:
-    def __init__(self):
+    NITTER_INSTANCES = [
+        "https://nitter.net/",
+        "https://nitter.unixfox.eu/", 
+        "https://nitter.kavin.rocks/",
+        "https://nitter.1d4.us/",
+    ]
+    
+    INVIDIOUS_INSTANCES = [
+        "https://invidious.snopyta.org",
+        "https://invidious.kavin.rocks",
+        "https://invidio.us",
+    ]
+    
+    # Maximum number of jobs per platform that scrape_batch runs at once
+    BATCH_CONCURRENCY = {
+        "Twitter/X": 2,
+        "Reddit": 2,
+        "YouTube Comments": 4,
+        "Instagram (Public)": 1,
+        "HackerNews": 4,
+    }
+    
+    # Columns holding each item's timestamp and unique ID, used for watermarks
+    ITEM_KEYS = {
+        "Twitter/X": ('timestamp', 'link'),
+        "Reddit": ('created_utc', 'permalink'),
+        "YouTube Comments": ('published', 'comment_id'),
+        "HackerNews": ('time', 'hn_link'),
+    }
+    
+    # Feeds listed newest first, where the first item older than date_from
+    # means every remaining item is older too (pinned items excepted)
+    CHRONOLOGICAL_FEEDS = {
+        ("Twitter/X", "Username"),
+        ("Twitter/X", "Hashtag"),
+        ("Twitter/X", "Keyword"),
+        ("Reddit", "User"),
+        ("HackerNews", "New Stories"),
+    }
+    
+    # Upper bound on Nitter timeline pages followed in one scrape
+    NITTER_MAX_PAGES = 50
+    
+    def __init__(self, max_workers=8, instance_cache_path=None, instance_ttl=900,
+                 watermark_path=None, session=None, async_session=None, metrics=None,
+                 reddit_budget=None):
         logging.basicConfig(level=logging.INFO)
         self.logger = logging.getLogger(__name__)
-        self.session = requests.Session()
+        # Shared with the other scrapers so pooling and per-host limits are process-wide
+        self.session = session or get_default_client()
+        
+        # Stage timings (parse, extract, build, total) are recorded here per platform
+        self.metrics = metrics or get_default_metrics()
+        
+        # Used by ascrape; defaults to the shared client of the running event loop
+        self.async_session = async_session
+        self.max_workers = max_workers
+        
+        # Shared process-wide so scrapes and app reruns respect the same quota
+        self.reddit_budget = reddit_budget or get_default_reddit_budget()
         
         # Set default headers
-        self.default_headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.5',
-            'Connection': 'keep-alive',
-        }
+        self.default_headers = dict(DEFAULT_HEADERS)
+        
+        # Mirror health is cached on disk so probing is paid once per TTL
+        self.instance_registry = InstanceHealthRegistry(
+            self.session,
+            headers=self.default_headers,
+            cache_path=instance_cache_path,
+            ttl=instance_ttl,
+        )
+        
+        # Newest item seen per query, for incremental "since last run" scrapes
+        self.watermarks = WatermarkStore(watermark_path)
         
     def scrape(self, platform, query_type=None, query="", limit=100, 
-               date_range="Last week", include_metadata=True, include_replies=True):
+               date_range="Last week", include_metadata=True, include_replies=True,
+               incremental=False, sink=None):
         """
         Scrape data from social media platforms.
         
@@ -35,30 +294,278 @@ class SocialMediaScraper:
             date_range (str): Time period for data
             include_metadata (bool): Whether to include additional metadata
             include_replies (bool): Whether to include replies/comments
+            incremental (bool): Only return items newer than the previous
+                incremental run of the same query; date_range bounds the first run
+            sink (str or sink, optional): Stream items to this NDJSON file or
+                Parquet directory (see result_sink.open_sink) as they arrive
+                instead of building a DataFrame; a non-empty Parquet directory
+                must be opened with open_sink(path, overwrite=True)
             
         Returns:
-            DataFrame: Scraped social media data
+            DataFrame or StreamedResult: Scraped social media data, or a lazy
+                handle to the written results when a sink is given
         """
-        # Convert date range to datetime objects
-        date_from = self._parse_date_range(date_range)
+        date_from, watermark = self._scrape_window(platform, query_type, query, date_range, incremental)
+        sink, target = self._stream_target(platform, sink, incremental, watermark)
+        started = time.perf_counter()
+        
+        try:
+            if platform == "Twitter/X":
+                result = self._scrape_twitter(query_type, query, limit, date_from, include_metadata, include_replies, target)
+            elif platform == "Reddit":
+                result = self._scrape_reddit(query_type, query, limit, date_from, include_metadata, include_replies, target)
+            elif platform == "YouTube Comments":
+                result = self._scrape_youtube_comments(query, limit, date_from, include_metadata, target)
+            elif platform == "Instagram (Public)":
+                result = self._scrape_instagram(query_type, query, limit, date_from, include_metadata)
+            elif platform == "HackerNews":
+                result = self._scrape_hackernews(query_type, query, limit, date_from, include_metadata, include_replies, target)
+            else:
+                raise ValueError(f"Unsupported platform: {platform}")
+            
+            return self._finish_scrape(platform, query_type, query, result, incremental, watermark, sink, target)
+        
+        except Exception as e:
+            self.logger.error(f"Error scraping {platform}: {str(e)}")
+            if sink is not None:
+                # Keep whatever was written before the failure readable
+                sink.close()
+            raise RuntimeError(f"Failed to scrape data from {platform}: {str(e)}")
+        
+        finally:
+            self.metrics.observe('stage', time.perf_counter() - started, source=platform, stage='total')
+    
+    async def ascrape(self, platform, query_type=None, query="", limit=100,
+                      date_range="Last week", include_metadata=True, include_replies=True,
+                      incremental=False, sink=None):
+        """
+        Asynchronous version of scrape.
+        
+        Requests go through an httpx-based AsyncHttpClient instead of worker
+        threads, so many scrapes can run concurrently on one event loop.
+        Arguments and results are the same as for scrape.
+        """
+        date_from, watermark = self._scrape_window(platform, query_type, query, date_range, incremental)
+        sink, target = self._stream_target(platform, sink, incremental, watermark)
+        started = time.perf_counter()
         
         try:
             if platform == "Twitter/X":
-                return self._scrape_twitter(query_type, query, limit, date_from, include_metadata, include_replies)
+                result = await self._ascrape_twitter(query_type, query, limit, date_from, include_metadata, target)
             elif platform == "Reddit":
-                return self._scrape_reddit(query_type, query, limit, date_from, include_metadata, include_replies)
+                result = await self._ascrape_reddit(query_type, query, limit, date_from, include_metadata, include_replies, target)
             elif platform == "YouTube Comments":
-                return self._scrape_youtube_comments(query, limit, date_from, include_metadata)
+                result = await self._ascrape_youtube_comments(query, limit, date_from, include_metadata, target)
             elif platform == "Instagram (Public)":
-                return self._scrape_instagram(query_type, query, limit, date_from, include_metadata)
+                result = self._scrape_instagram(query_type, query, limit, date_from, include_metadata)
             elif platform == "HackerNews":
-                return self._scrape_hackernews(query_type, query, limit, date_from, include_metadata)
+                result = await self._ascrape_hackernews(query_type, query, limit, date_from, include_metadata, include_replies, target)
             else:
                 raise ValueError(f"Unsupported platform: {platform}")
+            
+            return self._finish_scrape(platform, query_type, query, result, incremental, watermark, sink, target)
         
         except Exception as e:
             self.logger.error(f"Error scraping {platform}: {str(e)}")
+            if sink is not None:
+                sink.close()
             raise RuntimeError(f"Failed to scrape data from {platform}: {str(e)}")
+        
+        finally:
+            self.metrics.observe('stage', time.perf_counter() - started, source=platform, stage='total')
+    
+    def _scrape_window(self, platform, query_type, query, date_range, incremental):
+        """Return the oldest date to collect and, for incremental runs, the stored watermark"""
+        # Convert date range to datetime objects
+        date_from = self._parse_date_range(date_range)
+        
+        # Narrow the window to the watermark left by the previous run
+        watermark = None
+        if incremental:
+            watermark = self.watermarks.get(platform, query_type, query)
+            if watermark and watermark['timestamp'] > date_from:
+                date_from = watermark['timestamp']
+        
+        return date_from, watermark
+    
+    def _stream_target(self, platform, sink, incremental, watermark):
+        """Open a sink given as a path and wrap it to filter incremental runs"""
+        if isinstance(sink, str):
+            sink = open_sink(sink)
+        target = sink
+        
+        # Streamed items are filtered against the watermark as they arrive
+        if sink is not None and incremental:
+            time_col, id_col = self.ITEM_KEYS.get(platform, (None, None))
+            if time_col is not None:
+                target = IncrementalSink(sink, time_col, id_col, watermark)
+        
+        return sink, target
+    
+    def _finish_scrape(self, platform, query_type, query, result, incremental, watermark, sink, target):
+        """Apply the incremental watermark or close the stream of a finished scrape"""
+        if sink is not None:
+            return self._finish_stream(platform, query_type, query, sink, target, result)
+        
+        if incremental:
+            result = self._apply_watermark(platform, query_type, query, result, watermark)
+        
+        return result
+    
+    def scrape_batch(self, jobs, limit=100, date_range="Last week", include_metadata=True,
+                     include_replies=True, platform_concurrency=None, incremental=False):
+        """
+        Run several scrapes concurrently and combine the results.
+        
+        Jobs are scheduled on a shared thread pool while a per-platform
+        semaphore caps how many jobs hit the same platform at once. A job
+        that fails produces a single message row instead of aborting the batch.
+        
+        Args:
+            jobs (list): (platform, query_type, query) tuples
+            limit (int): Maximum number of items to retrieve per job
+            date_range (str): Time period for data
+            include_metadata (bool): Whether to include additional metadata
+            include_replies (bool): Whether to include replies/comments
+            platform_concurrency (dict, optional): Overrides for BATCH_CONCURRENCY
+            incremental (bool): Only return items newer than each job's watermark
+            
+        Returns:
+            DataFrame: Combined results with job_id, platform, query_type and query columns
+        """
+        if not jobs:
+            return pd.DataFrame(columns=['job_id', 'platform', 'query_type', 'query'])
+        
+        limits = dict(self.BATCH_CONCURRENCY)
+        if platform_concurrency:
+            limits.update(platform_concurrency)
+        
+        semaphores = {
+            platform: threading.Semaphore(max(1, limits.get(platform, 1)))
+            for platform in {job[0] for job in jobs}
+        }
+        
+        def run(job_id, job):
+            platform, query_type, query = job
+            with semaphores[platform]:
+                try:
+                    result = self.scrape(
+                        platform=platform,
+                        query_type=query_type,
+                        query=query,
+                        limit=limit,
+                        date_range=date_range,
+                        include_metadata=include_metadata,
+                        include_replies=include_replies,
+                        incremental=incremental,
+                    )
+                except Exception as e:
+                    result = pd.DataFrame([{"message": str(e)}])
+            
+            result = result.copy()
+            result.insert(0, 'query', query)
+            result.insert(0, 'query_type', query_type)
+            result.insert(0, 'platform', platform)
+            result.insert(0, 'job_id', job_id)
+            return result
+        
+        max_workers = max(1, sum(min(limits.get(platform, 1), len(jobs)) for platform in semaphores))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(run, range(len(jobs)), jobs))
+        
+        self.logger.info(f"Completed batch of {len(jobs)} social scrapes")
+        return pd.concat(results, ignore_index=True)
+    
+    def _finish_stream(self, platform, query_type, query, sink, target, result):
+        """
+        Close a streaming scrape and return the handle to its results.
+        
+        Platform methods return a plain DataFrame when they produce a message
+        or fallback instead of items; if nothing was streamed, those rows are
+        written to the sink so the handle is never empty.
+        """
+        if isinstance(result, pd.DataFrame):
+            if len(target) == 0:
+                for record in result.to_dict(orient='records'):
+                    sink.append(record)
+            else:
+                self.logger.warning(f"{platform} scrape ended early, keeping {len(target)} streamed items")
+        elif len(target) == 0:
+            self.logger.info(f"No new {platform} items since last run")
+            sink.append({"message": "No new items since the last run"})
+        
+        if isinstance(target, IncrementalSink) and target.newest is not None:
+            watermark = target.watermark
+            newest_ids = set(target.newest_ids)
+            if watermark and target.newest == watermark['timestamp']:
+                newest_ids |= set(watermark['ids'])
+            self.watermarks.set(platform, query_type, query, target.newest, newest_ids)
+        
+        result = sink.build()
+        sink.close()
+        return result
+    
+    def _async_client(self):
+        """Return the async HTTP client used by ascrape"""
+        return self.async_session or get_default_async_client()
+    
+    def _build(self, items, platform):
+        """Build the collected items into the result, timing it as the build stage"""
+        with self.metrics.stage('build', platform):
+            return items.build()
+    
+    def _item_builder(self, sink):
+        """Return the sink items should be written to, or a fresh in-memory builder"""
+        return sink if sink is not None else ColumnarFrameBuilder()
+    
+    def _apply_watermark(self, platform, query_type, query, data, watermark):
+        """
+        Drop items already covered by the watermark and advance it.
+        
+        Items without a timestamp (such as YouTube's video details row) are
+        always kept, and comment rows follow their parent post. Results that
+        are not item tables, like the fallback instruction frames, are
+        returned unchanged.
+        """
+        time_col, id_col = self.ITEM_KEYS.get(platform, (None, None))
+        if time_col is None or time_col not in data.columns:
+            return data
+        
+        if 'item_type' in data.columns:
+            is_comment = data['item_type'].eq('comment').fillna(False).astype(bool)
+        else:
+            is_comment = pd.Series(False, index=data.index)
+        
+        times = pd.to_datetime(data[time_col], errors='coerce').where(~is_comment)
+        ids = data[id_col].astype(str) if id_col in data.columns else pd.Series('', index=data.index)
+        
+        if watermark:
+            seen_ids = set(watermark['ids'])
+            is_new = (
+                times.isna()
+                | (times > watermark['timestamp'])
+                | ((times == watermark['timestamp']) & ~ids.isin(seen_ids))
+            )
+            if is_comment.any() and 'parent_id' in data.columns:
+                kept_ids = set(ids[is_new & ~is_comment])
+                is_new = is_new.where(~is_comment, data['parent_id'].isin(kept_ids))
+            
+            data = data[is_new]
+            times = times[is_new]
+            ids = ids[is_new]
+        
+        newest = times.max()
+        if pd.notna(newest):
+            newest_ids = set(ids[times == newest])
+            if watermark and newest == watermark['timestamp']:
+                newest_ids |= set(watermark['ids'])
+            self.watermarks.set(platform, query_type, query, newest.to_pydatetime(), newest_ids)
+        
+        if data.empty:
+            self.logger.info(f"No new {platform} items since last run")
+            return pd.DataFrame([{"message": "No new items since the last run"}])
+        
+        return data.reset_index(drop=True)
     
     def _parse_date_range(self, date_range):
         """Convert date range string to datetime object"""
@@ -73,7 +580,7 @@ class SocialMediaScraper:
         else:  # "All time"
             return now - timedelta(days=3650)  # ~10 years
     
-    def _scrape_twitter(self, query_type, query, limit, date_from, include_metadata, include_replies):
+    def _scrape_twitter(self, query_type, query, limit, date_from, include_metadata, include_replies, sink=None):
         """
         Extract data from Twitter/X using the search functionality on Nitter.
         This is a limited implementation as Twitter's official API requires authentication.
@@ -84,130 +591,296 @@ class SocialMediaScraper:
         
         # Due to Twitter API restrictions, we use a simplified approach with Nitter
         # Nitter is an alternative Twitter front-end that's more scraper-friendly
-        nitter_instances = [
-            "https://nitter.net/",
-            "https://nitter.unixfox.eu/", 
-            "https://nitter.kavin.rocks/",
-            "https://nitter.1d4.us/",
-        ]
-        
-        tweets = []
-        working_instance = None
-        
-        # Try to find a working Nitter instance
-        for instance in nitter_instances:
-            try:
-                response = self.session.get(instance, headers=self.default_headers, timeout=10)
-                if response.status_code == 200:
-                    working_instance = instance
-                    break
-            except:
-                continue
+        tweets = self._item_builder(sink)
+        
+        # Pick the fastest Nitter instance known to be healthy
+        working_instance = self.instance_registry.pick('nitter', self.NITTER_INSTANCES)
         
         if not working_instance:
             self.logger.error("No working Nitter instance found")
             # Fallback to basic search results scraping
             return self._twitter_search_fallback(query, limit)
         
-        # Construct the appropriate URL based on query_type
-        if query_type == "Username":
-            url = f"{working_instance}{query.strip('@')}"
-        elif query_type == "Hashtag":
-            url = f"{working_instance}search?f=tweets&q=%23{query.strip('#')}"
-        elif query_type == "Keyword":
-            url = f"{working_instance}search?f=tweets&q={quote_plus(query)}"
-        else:
-            raise ValueError(f"Unsupported Twitter query type: {query_type}")
+        url = self._nitter_url(working_instance, query_type, query)
         
         try:
-            response = self.session.get(url, headers=self.default_headers, timeout=15)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.text, 'html.parser')
+            chronological = ("Twitter/X", query_type) in self.CHRONOLOGICAL_FEEDS
+            seen_ids = set()
+            pages = 0
             
-            # Extract tweets
-            tweet_elements = soup.select('.timeline-item')
-            
-            for tweet in tweet_elements[:limit]:
-                try:
-                    # Extract tweet content
-                    content_elem = tweet.select_one('.tweet-content')
-                    content = content_elem.get_text(strip=True) if content_elem else ""
-                    
-                    # Extract username and full name
-                    username_elem = tweet.select_one('.username')
-                    username = username_elem.get_text(strip=True) if username_elem else ""
-                    
-                    fullname_elem = tweet.select_one('.fullname')
-                    fullname = fullname_elem.get_text(strip=True) if fullname_elem else ""
-                    
-                    # Extract timestamp
-                    time_elem = tweet.select_one('.tweet-date a')
-                    timestamp = time_elem['title'] if time_elem and 'title' in time_elem.attrs else ""
-                    
-                    # Try to parse the timestamp
-                    date_posted = None
-                    if timestamp:
-                        try:
-                            date_posted = datetime.strptime(timestamp, '%Y-%m-%d %H:%M:%S')
-                        except:
-                            pass
-                    
-                    # Skip tweets older than date_from
-                    if date_posted and date_posted < date_from:
-                        continue
-                    
-                    # Extract stats
-                    stats = {}
-                    if include_metadata:
-                        stats_container = tweet.select('.tweet-stats .icon-container')
-                        for stat in stats_container:
-                            stat_text = stat.get_text(strip=True)
-                            if 'reply' in stat_text.lower():
-                                stats['replies'] = self._extract_number(stat_text)
-                            elif 'retweet' in stat_text.lower():
-                                stats['retweets'] = self._extract_number(stat_text)
-                            elif 'like' in stat_text.lower():
-                                stats['likes'] = self._extract_number(stat_text)
-                    
-                    # Extract link to the tweet
-                    link = ""
-                    link_elem = tweet.select_one('.tweet-link')
-                    if link_elem:
-                        link = "https://twitter.com" + link_elem['href']
+            # The next page is fetched on a worker thread while the current one is parsed
+            executor = ThreadPoolExecutor(max_workers=1)
+            next_page = executor.submit(self._fetch_nitter_page, url)
+            try:
+                while next_page is not None:
+                    try:
+                        html = next_page.result()
+                    except Exception as e:
+                        if pages == 0:
+                            raise
+                        self.logger.warning(f"Error fetching Nitter page {pages + 1}: {str(e)}")
+                        break
                     
-                    tweet_data = {
-                        'username': username,
-                        'fullname': fullname,
-                        'content': content,
-                        'timestamp': timestamp,
-                        'link': link,
-                    }
+                    pages += 1
+                    next_page = None
+                    cursor = self._nitter_next_cursor(html)
+                    if cursor and pages < self.NITTER_MAX_PAGES:
+                        next_page = executor.submit(self._fetch_nitter_page, urljoin(url, cursor))
                     
-                    # Add metadata if requested
-                    if include_metadata:
-                        tweet_data.update(stats)
+                    if self._collect_nitter_page(html, tweets, seen_ids, limit, date_from,
+                                                 chronological, include_metadata):
+                        break
+            finally:
+                # A prefetch made unnecessary by the limit or the date cutoff is
+                # abandoned rather than waited for; its response is discarded
+                if next_page is not None:
+                    next_page.cancel()
+                executor.shutdown(wait=False, cancel_futures=True)
+            
+            if not tweets:
+                self.logger.warning("No tweets found")
+                return pd.DataFrame([{"message": "No tweets found for the given criteria"}])
+            
+            return self._build(tweets, "Twitter/X")
+            
+        except Exception as e:
+            self.logger.error(f"Error scraping Twitter: {str(e)}")
+            if isinstance(e, TRANSPORT_ERRORS):
+                self.instance_registry.mark_failed('nitter', working_instance)
+            # Fall back to alternative approach
+            return self._twitter_search_fallback(query, limit)
+    
+    async def _ascrape_twitter(self, query_type, query, limit, date_from, include_metadata, sink=None):
+        """Asynchronous version of _scrape_twitter"""
+        self.logger.info(f"Scraping Twitter for {query_type}: {query}")
+        
+        tweets = self._item_builder(sink)
+        
+        # Probing uses the blocking registry, so keep it off the event loop
+        working_instance = await asyncio.to_thread(self.instance_registry.pick, 'nitter', self.NITTER_INSTANCES)
+        
+        if not working_instance:
+            self.logger.error("No working Nitter instance found")
+            return self._twitter_search_fallback(query, limit)
+        
+        url = self._nitter_url(working_instance, query_type, query)
+        client = self._async_client()
+        
+        try:
+            chronological = ("Twitter/X", query_type) in self.CHRONOLOGICAL_FEEDS
+            seen_ids = set()
+            pages = 0
+            
+            # The next page is requested while the current one is parsed
+            next_page = asyncio.ensure_future(self._afetch_nitter_page(client, url))
+            try:
+                while next_page is not None:
+                    try:
+                        html = await next_page
+                    except Exception as e:
+                        if pages == 0:
+                            raise
+                        self.logger.warning(f"Error fetching Nitter page {pages + 1}: {str(e)}")
+                        break
                     
-                    tweets.append(tweet_data)
+                    pages += 1
+                    next_page = None
+                    cursor = self._nitter_next_cursor(html)
+                    if cursor and pages < self.NITTER_MAX_PAGES:
+                        next_page = asyncio.ensure_future(self._afetch_nitter_page(client, urljoin(url, cursor)))
                     
-                    # Break if we've reached the limit
-                    if len(tweets) >= limit:
+                    if self._collect_nitter_page(html, tweets, seen_ids, limit, date_from,
+                                                 chronological, include_metadata):
                         break
-                        
-                except Exception as e:
-                    self.logger.warning(f"Error parsing tweet: {str(e)}")
+            finally:
+                # A prefetch left behind by the limit, the date cutoff or an error
+                # is cancelled; one that already failed has its error retrieved so
+                # it is not reported as never retrieved
+                if next_page is not None and not next_page.cancel() and not next_page.cancelled():
+                    next_page.exception()
             
             if not tweets:
                 self.logger.warning("No tweets found")
                 return pd.DataFrame([{"message": "No tweets found for the given criteria"}])
             
-            return pd.DataFrame(tweets)
+            return self._build(tweets, "Twitter/X")
             
         except Exception as e:
             self.logger.error(f"Error scraping Twitter: {str(e)}")
-            # Fall back to alternative approach
+            if isinstance(e, TRANSPORT_ERRORS):
+                self.instance_registry.mark_failed('nitter', working_instance)
             return self._twitter_search_fallback(query, limit)
     
+    def _nitter_url(self, instance, query_type, query):
+        """Construct the Nitter timeline URL for a query"""
+        if query_type == "Username":
+            return f"{instance}{query.strip('@')}"
+        elif query_type == "Hashtag":
+            return f"{instance}search?f=tweets&q=%23{query.strip('#')}"
+        elif query_type == "Keyword":
+            return f"{instance}search?f=tweets&q={quote_plus(query)}"
+        else:
+            raise ValueError(f"Unsupported Twitter query type: {query_type}")
+    
+    def _collect_nitter_page(self, html, tweets, seen_ids, limit, date_from, chronological, include_metadata):
+        """
+        Add the new tweets of one timeline page to the builder.
+        
+        Returns:
+            bool: True when no further page is needed (limit or date_from
+                reached, or the page added nothing new)
+        """
+        # Extract tweets, then parse the page's timestamps in one vectorized call
+        page_tweets = []
+        for record in self._parse_nitter_page(html, include_metadata):
+            # Pages can overlap, so skip tweets already collected
+            tweet_id = self._tweet_id(record['link'])
+            if tweet_id and tweet_id in seen_ids:
+                continue
+            seen_ids.add(tweet_id)
+            page_tweets.append(record)
+        
+        reached_date_from = False
+        posted_times = self._parse_nitter_times([record['timestamp'] for record in page_tweets])
+        
+        for record, date_posted in zip(page_tweets, posted_times):
+            pinned = record.pop('pinned')
+            date_posted = None if pd.isna(date_posted) else date_posted.to_pydatetime()
+            
+            # Skip tweets older than date_from
+            if date_posted and date_posted < date_from:
+                if chronological and not pinned:
+                    # Everything after this tweet is older as well
+                    reached_date_from = True
+                    break
+                continue
+            
+            record['timestamp'] = date_posted
+            tweets.append(record)
+            
+            # Break if we've reached the limit
+            if len(tweets) >= limit:
+                break
+        
+        # Stop at the limit, at date_from, or when a page adds nothing new
+        return len(tweets) >= limit or reached_date_from or not page_tweets
+    
+    def _fetch_nitter_page(self, url):
+        """Fetch the HTML of one Nitter timeline page"""
+        response = self.session.get(url, headers=self.default_headers, timeout=15)
+        response.raise_for_status()
+        return response.text
+    
+    async def _afetch_nitter_page(self, client, url):
+        """Fetch the HTML of one Nitter timeline page asynchronously"""
+        response = await client.get(url, headers=self.default_headers, timeout=15)
+        response.raise_for_status()
+        return response.text
+    
+    def _nitter_next_cursor(self, html):
+        """
+        Find the "Load more" link of a Nitter timeline page.
+        
+        A regex over the raw HTML is enough here and lets the next page be
+        requested before the current one goes through BeautifulSoup.
+        """
+        matches = NITTER_CURSOR_PATTERN.findall(html)
+        return unescape(matches[-1]) if matches else None
+    
+    def _tweet_id(self, href):
+        """Extract the numeric status ID from a tweet link"""
+        match = TWEET_ID_PATTERN.search(href)
+        return match.group(1) if match else href
+    
+    @timed_stage('parse', "Twitter/X")
+    def _parse_nitter_page(self, html, include_metadata=True, parser=None):
+        """
+        Extract the raw fields of every tweet on a Nitter timeline page.
+        
+        Only ``.timeline-item`` subtrees are built into the parse tree and
+        each one is walked once; timestamps are returned as the raw title
+        strings so they can be parsed for the whole page at once.
+        
+        Args:
+            html (str): Timeline page HTML
+            include_metadata (bool): Whether to extract reply/retweet/like counts
+            parser (str, optional): BeautifulSoup parser, defaults to HTML_PARSER
+            
+        Returns:
+            list: One dict per tweet, including a 'pinned' flag
+        """
+        soup = BeautifulSoup(html, parser or HTML_PARSER, parse_only=TIMELINE_STRAINER)
+        return [self._extract_nitter_tweet(item, include_metadata) for item in TIMELINE_ITEM_SELECTOR.select(soup)]
+    
+    def _extract_nitter_tweet(self, item, include_metadata):
+        """Collect the fields of one .timeline-item in a single walk of its subtree"""
+        fields = {}
+        pinned = False
+        stats = {}
+        
+        for tag in item.descendants:
+            if not isinstance(tag, Tag):
+                continue
+            
+            for css_class in tag.get('class') or ():
+                # The first match in document order wins, as with select_one
+                if css_class in NITTER_TEXT_FIELDS:
+                    if NITTER_TEXT_FIELDS[css_class] not in fields:
+                        fields[NITTER_TEXT_FIELDS[css_class]] = tag.get_text(strip=True)
+                elif css_class == 'tweet-link':
+                    fields.setdefault('link', "https://twitter.com" + tag.get('href', ''))
+                elif css_class == 'tweet-date':
+                    date_link = tag.find('a')
+                    fields.setdefault('timestamp', date_link.get('title', '') if date_link else '')
+                elif css_class == 'pinned':
+                    pinned = True
+                elif css_class == 'tweet-stats' and include_metadata and not stats:
+                    for stat in tag.find_all(class_='icon-container'):
+                        stat_text = stat.get_text(strip=True).lower()
+                        if 'reply' in stat_text or 'replies' in stat_text:
+                            stats['replies'] = self._extract_number(stat_text)
+                        elif 'retweet' in stat_text:
+                            stats['retweets'] = self._extract_number(stat_text)
+                        elif 'like' in stat_text:
+                            stats['likes'] = self._extract_number(stat_text)
+        
+        tweet_data = {
+            'username': fields.get('username', ''),
+            'fullname': fields.get('fullname', ''),
+            'content': fields.get('content', ''),
+            'timestamp': fields.get('timestamp', ''),
+            'link': fields.get('link', ''),
+        }
+        
+        # Add metadata if requested
+        if include_metadata:
+            tweet_data.update(stats)
+        
+        tweet_data['pinned'] = pinned
+        return tweet_data
+    
+    def _parse_nitter_times(self, titles):
+        """
+        Parse Nitter timestamp titles into naive local datetimes.
+        
+        Nitter titles look like "Oct 18, 2026 · 10:00 AM UTC"; plain
+        "%Y-%m-%d %H:%M:%S" local timestamps are accepted as well.
+        """
+        titles = pd.Series(titles, dtype=object)
+        if titles.empty:
+            return pd.Series([], dtype='datetime64[ns]')
+        
+        utc_times = pd.to_datetime(titles.str.replace(' UTC', '', regex=False),
+                                   format=NITTER_TIME_FORMAT, errors='coerce')
+        local_zone = datetime.now().astimezone().tzinfo
+        times = utc_times.dt.tz_localize('UTC').dt.tz_convert(local_zone).dt.tz_localize(None)
+        
+        missing = times.isna()
+        if missing.any():
+            times[missing] = pd.to_datetime(titles[missing], format='%Y-%m-%d %H:%M:%S', errors='coerce')
+        
+        return times
+    
     def _twitter_search_fallback(self, query, limit):
         """Fallback method that returns a template with search instructions"""
         self.logger.info("Using Twitter fallback method")
@@ -225,6 +898,15 @@ class SocialMediaScraper:
         
         return pd.DataFrame(instructions)
     
+    def _from_timestamp(self, value):
+        """Convert a Unix timestamp to a datetime, passing through missing values"""
+        if value in (None, ''):
+            return None
+        try:
+            return datetime.fromtimestamp(float(value))
+        except (TypeError, ValueError, OverflowError, OSError):
+            return None
+    
     def _extract_number(self, text):
         """Extract a number from text like '10 replies' -> 10"""
         if not text:
@@ -235,234 +917,519 @@ class SocialMediaScraper:
             return int(matches[0])
         return 0
     
-    def _scrape_reddit(self, query_type, query, limit, date_from, include_metadata, include_replies):
+    def _scrape_reddit(self, query_type, query, limit, date_from, include_metadata, include_replies, sink=None):
         """
         Extract data from Reddit using their JSON API.
         This doesn't require authentication for basic browsing.
         """
         self.logger.info(f"Scraping Reddit for {query_type}: {query}")
         
-        posts = []
-        
         try:
-            # Construct the appropriate URL based on query_type
-            if query_type == "Subreddit":
-                url = f"https://www.reddit.com/r/{query.strip('r/').strip('/')}.json?limit={min(limit, 100)}"
-            elif query_type == "User":
-                url = f"https://www.reddit.com/user/{query.strip('u/').strip('/')}/submitted.json?limit={min(limit, 100)}"
-            elif query_type == "Search Term":
-                url = f"https://www.reddit.com/search.json?q={quote_plus(query)}&limit={min(limit, 100)}"
-            else:
-                raise ValueError(f"Unsupported Reddit query type: {query_type}")
+            url = self._reddit_listing_url(query_type, query, limit)
+            headers = self._reddit_headers()
             
-            # Use old.reddit.com as it's more scraper-friendly
-            headers = self.default_headers.copy()
-            headers['User-Agent'] = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            
-            response = self.session.get(url, headers=headers, timeout=15)
+            response = self._reddit_get(url, headers)
             response.raise_for_status()
             
-            data = response.json()
+            posts, commented_posts = self._reddit_posts(response.json(), query_type, limit, date_from, include_metadata)
+            if not posts:
+                return self._no_reddit_posts()
+            if not include_replies:
+                commented_posts = []
             
-            # Extract posts
-            if 'data' in data and 'children' in data['data']:
-                for post in data['data']['children'][:limit]:
-                    post_data = post['data']
-                    
-                    # Skip if post is older than date_from
-                    created_utc = post_data.get('created_utc', 0)
-                    post_date = datetime.fromtimestamp(created_utc)
-                    if post_date < date_from:
-                        continue
-                    
-                    # Basic post data
-                    post_info = {
-                        'title': post_data.get('title', ''),
-                        'author': post_data.get('author', ''),
-                        'subreddit': post_data.get('subreddit', ''),
-                        'selftext': post_data.get('selftext', ''),
-                        'url': post_data.get('url', ''),
-                        'permalink': f"https://www.reddit.com{post_data.get('permalink', '')}",
-                        'created_utc': post_date.strftime('%Y-%m-%d %H:%M:%S'),
-                    }
-                    
-                    # Add metadata if requested
-                    if include_metadata:
-                        post_info.update({
-                            'score': post_data.get('score', 0),
-                            'upvote_ratio': post_data.get('upvote_ratio', 0),
-                            'num_comments': post_data.get('num_comments', 0),
-                            'is_video': post_data.get('is_video', False),
-                            'is_original_content': post_data.get('is_original_content', False),
-                            'is_self': post_data.get('is_self', False),
-                        })
-                    
-                    # Fetch comments if requested
-                    if include_replies and post_data.get('num_comments', 0) > 0:
-                        try:
-                            comments_url = f"https://www.reddit.com{post_data.get('permalink', '')}.json"
-                            comments_response = self.session.get(comments_url, headers=headers, timeout=15)
-                            comments_data = comments_response.json()
-                            
-                            if len(comments_data) > 1 and 'data' in comments_data[1] and 'children' in comments_data[1]['data']:
-                                # Get top 5 comments
-                                top_comments = []
-                                for comment in comments_data[1]['data']['children'][:5]:
-                                    if comment['kind'] == 't1':  # Comment type
-                                        comment_data = comment['data']
-                                        top_comments.append({
-                                            'author': comment_data.get('author', ''),
-                                            'body': comment_data.get('body', ''),
-                                            'score': comment_data.get('score', 0),
-                                            'created_utc': datetime.fromtimestamp(
-                                                comment_data.get('created_utc', 0)
-                                            ).strftime('%Y-%m-%d %H:%M:%S'),
-                                        })
-                                
-                                post_info['top_comments'] = top_comments
-                            
-                            # Be respectful with API rate limits
-                            time.sleep(1)
-                            
-                        except Exception as e:
-                            self.logger.warning(f"Error fetching comments: {str(e)}")
-                    
-                    posts.append(post_info)
+            # Comments are fetched concurrently and each post is written as
+            # soon as its comments have arrived
+            items = self._item_builder(sink)
+            comments = self._fetch_reddit_comments(commented_posts, headers)
+            try:
+                waiting = iter(commented_posts)
+                next_commented = next(waiting, None)
+                for post_info in posts:
+                    items.append(post_info)
+                    if post_info is next_commented:
+                        for comment_info in next(comments) or []:
+                            items.append(comment_info)
+                        next_commented = next(waiting, None)
+            finally:
+                # Cancels the fetches not started yet if writing failed
+                comments.close()
+            
+            return self._build(items, "Reddit")
+            
+        except Exception as e:
+            self.logger.error(f"Error scraping Reddit: {str(e)}")
+            return self._reddit_instructions(e)
+    
+    async def _ascrape_reddit(self, query_type, query, limit, date_from, include_metadata, include_replies, sink=None):
+        """Asynchronous version of _scrape_reddit"""
+        self.logger.info(f"Scraping Reddit for {query_type}: {query}")
+        
+        client = self._async_client()
+        
+        try:
+            url = self._reddit_listing_url(query_type, query, limit)
+            headers = self._reddit_headers()
+            
+            response = await self._areddit_get(client, url, headers)
+            response.raise_for_status()
             
+            posts, commented_posts = self._reddit_posts(response.json(), query_type, limit, date_from, include_metadata)
             if not posts:
-                self.logger.warning("No Reddit posts found")
-                return pd.DataFrame([{"message": "No Reddit posts found for the given criteria"}])
+                return self._no_reddit_posts()
+            if not include_replies:
+                commented_posts = []
             
-            return pd.DataFrame(posts)
+            items = self._item_builder(sink)
+            comments = self._afetch_reddit_comments(client, commented_posts, headers)
+            try:
+                waiting = iter(commented_posts)
+                next_commented = next(waiting, None)
+                for post_info in posts:
+                    items.append(post_info)
+                    if post_info is next_commented:
+                        for comment_info in await anext(comments) or []:
+                            items.append(comment_info)
+                        next_commented = next(waiting, None)
+            finally:
+                await comments.aclose()
+            
+            return self._build(items, "Reddit")
             
         except Exception as e:
             self.logger.error(f"Error scraping Reddit: {str(e)}")
-            # Return a template with instructions
-            instructions = [{
-                'message': f"Reddit data could not be retrieved: {str(e)}",
-                'solution': "To scrape Reddit data, you can:",
-                'step1': "1. Use PRAW (Python Reddit API Wrapper)",
-                'step2': "2. Set up Reddit API credentials",
-                'code_example': "import praw\n\nreddit = praw.Reddit(client_id='YOUR_CLIENT_ID', client_secret='YOUR_CLIENT_SECRET', user_agent='YOUR_USER_AGENT')\n\nsubreddit = reddit.subreddit('python')\nfor post in subreddit.hot(limit=10):\n    print(post.title)",
-            }]
+            return self._reddit_instructions(e)
+    
+    def _reddit_listing_url(self, query_type, query, limit):
+        """Construct the JSON listing URL for a Reddit query"""
+        if query_type == "Subreddit":
+            return f"https://www.reddit.com/r/{query.strip('r/').strip('/')}.json?limit={min(limit, 100)}"
+        elif query_type == "User":
+            return f"https://www.reddit.com/user/{query.strip('u/').strip('/')}/submitted.json?limit={min(limit, 100)}"
+        elif query_type == "Search Term":
+            return f"https://www.reddit.com/search.json?q={quote_plus(query)}&limit={min(limit, 100)}"
+        else:
+            raise ValueError(f"Unsupported Reddit query type: {query_type}")
+    
+    def _reddit_headers(self):
+        # Use old.reddit.com as it's more scraper-friendly
+        headers = self.default_headers.copy()
+        headers['User-Agent'] = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+        return headers
+    
+    @timed_stage('extract', "Reddit")
+    def _reddit_posts(self, data, query_type, limit, date_from, include_metadata):
+        """
+        Build post rows from a Reddit listing.
+        
+        Returns:
+            tuple: (all post rows, post rows that have comments)
+        """
+        posts = []
+        commented_posts = []
+        
+        # Extract posts
+        if 'data' in data and 'children' in data['data']:
+            chronological = ("Reddit", query_type) in self.CHRONOLOGICAL_FEEDS
+            
+            for post in data['data']['children'][:limit]:
+                post_data = post['data']
+                
+                # Skip if post is older than date_from
+                created_utc = post_data.get('created_utc', 0)
+                post_date = datetime.fromtimestamp(created_utc)
+                if post_date < date_from:
+                    if chronological and not (post_data.get('stickied') or post_data.get('pinned')):
+                        # Listing is sorted by age, the rest is older too
+                        break
+                    continue
+                
+                # Basic post data
+                post_info = {
+                    'item_type': 'post',
+                    'title': post_data.get('title', ''),
+                    'author': post_data.get('author', ''),
+                    'subreddit': post_data.get('subreddit', ''),
+                    'selftext': post_data.get('selftext', ''),
+                    'url': post_data.get('url', ''),
+                    'permalink': f"https://www.reddit.com{post_data.get('permalink', '')}",
+                    'created_utc': post_date,
+                }
+                
+                # Add metadata if requested
+                if include_metadata:
+                    post_info.update({
+                        'score': post_data.get('score', 0),
+                        'upvote_ratio': post_data.get('upvote_ratio', 0),
+                        'num_comments': post_data.get('num_comments', 0),
+                        'is_video': post_data.get('is_video', False),
+                        'is_original_content': post_data.get('is_original_content', False),
+                        'is_self': post_data.get('is_self', False),
+                    })
+                
+                posts.append(post_info)
+                
+                if post_data.get('num_comments', 0) > 0:
+                    commented_posts.append(post_info)
+        
+        return posts, commented_posts
+    
+    def _no_reddit_posts(self):
+        self.logger.warning("No Reddit posts found")
+        return pd.DataFrame([{"message": "No Reddit posts found for the given criteria"}])
+    
+    def _reddit_instructions(self, error):
+        """Return a template with instructions when Reddit cannot be scraped"""
+        instructions = [{
+            'message': f"Reddit data could not be retrieved: {str(error)}",
+            'solution': "To scrape Reddit data, you can:",
+            'step1': "1. Use PRAW (Python Reddit API Wrapper)",
+            'step2': "2. Set up Reddit API credentials",
+            'code_example': "import praw\n\nreddit = praw.Reddit(client_id='YOUR_CLIENT_ID', client_secret='YOUR_CLIENT_SECRET', user_agent='YOUR_USER_AGENT')\n\nsubreddit = reddit.subreddit('python')\nfor post in subreddit.hot(limit=10):\n    print(post.title)",
+        }]
+        
+        return pd.DataFrame(instructions)
+    
+    def _fetch_reddit_comments(self, posts, headers):
+        """
+        Fetch the top comments of each post concurrently.
+        
+        All workers draw from the shared ``reddit_budget`` so throughput is
+        bounded by Reddit's actual rate limit rather than a fixed sleep.
+        
+        Args:
+            posts (list): Post dicts built by ``_scrape_reddit``
+            headers (dict): Request headers to send
             
-            return pd.DataFrame(instructions)
+        Yields:
+            list or None: Comment rows of each post, in the order of posts, as
+                soon as they and those of the posts before have been fetched
+        """
+        def fetch(post):
+            try:
+                return self._fetch_reddit_post_comments(post['permalink'], headers)
+            except Exception as e:
+                self.logger.warning(f"Error fetching comments: {str(e)}")
+                return None
+        
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            yield from executor.map(fetch, posts)
+    
+    async def _afetch_reddit_comments(self, client, posts, headers):
+        """Asynchronous version of _fetch_reddit_comments"""
+        # Same concurrency cap as the thread pool of the sync path
+        semaphore = asyncio.Semaphore(self.max_workers)
+        
+        async def fetch(post):
+            async with semaphore:
+                try:
+                    return await self._afetch_reddit_post_comments(client, post['permalink'], headers)
+                except Exception as e:
+                    self.logger.warning(f"Error fetching comments: {str(e)}")
+                    return None
+        
+        tasks = [asyncio.ensure_future(fetch(post)) for post in posts]
+        try:
+            for task in tasks:
+                yield await task
+        finally:
+            for task in tasks:
+                task.cancel()
+    
+    def _reddit_get(self, url, headers):
+        """Send a GET to Reddit under the shared budget"""
+        self.reddit_budget.acquire()
+        response = None
+        try:
+            response = self.session.get(url, headers=headers, timeout=15)
+        finally:
+            self._update_reddit_budget(response)
+        return response
+    
+    async def _areddit_get(self, client, url, headers):
+        """Asynchronous version of _reddit_get"""
+        await self.reddit_budget.async_acquire()
+        response = None
+        try:
+            response = await client.get(url, headers=headers, timeout=15)
+        finally:
+            self._update_reddit_budget(response)
+        return response
+    
+    def _update_reddit_budget(self, response):
+        """Refresh the Reddit budget from a response, unless it failed or was replayed from a cache"""
+        # A cached response carries the rate limit headers of an earlier window
+        if response is None or getattr(response, 'from_cache', False):
+            self.reddit_budget.update()
+        else:
+            self.reddit_budget.update(response.headers)
+    
+    def _fetch_reddit_post_comments(self, permalink, headers):
+        """Fetch the top 5 comments of a single Reddit post"""
+        comments_response = self._reddit_get(f"{permalink}.json", headers)
+        comments_response.raise_for_status()
+        return self._reddit_comment_rows(comments_response.json(), permalink)
+    
+    async def _afetch_reddit_post_comments(self, client, permalink, headers):
+        """Asynchronous version of _fetch_reddit_post_comments"""
+        comments_response = await self._areddit_get(client, f"{permalink}.json", headers)
+        comments_response.raise_for_status()
+        return self._reddit_comment_rows(comments_response.json(), permalink)
+    
+    @timed_stage('extract', "Reddit")
+    def _reddit_comment_rows(self, comments_data, permalink):
+        """Build rows for the top 5 comments of a post's comment listing"""
+        if not (len(comments_data) > 1 and 'data' in comments_data[1] and 'children' in comments_data[1]['data']):
+            return None
+        
+        top_comments = []
+        for comment in comments_data[1]['data']['children'][:5]:
+            if comment['kind'] == 't1':  # Comment type
+                comment_data = comment['data']
+                top_comments.append({
+                    'item_type': 'comment',
+                    'parent_id': permalink,
+                    'author': comment_data.get('author', ''),
+                    'body': comment_data.get('body', ''),
+                    'score': comment_data.get('score', 0),
+                    'created_utc': datetime.fromtimestamp(comment_data.get('created_utc', 0)),
+                })
+        
+        return top_comments
     
-    def _scrape_youtube_comments(self, video_url, limit, date_from, include_metadata):
+    def _scrape_youtube_comments(self, video_url, limit, date_from, include_metadata, sink=None):
         """
         Extract comments from a YouTube video.
         Note: This method uses a limited approach as YouTube's API requires authentication.
         """
         self.logger.info(f"Scraping YouTube comments for: {video_url}")
         
-        # Extract video ID from URL
-        video_id = None
-        if "youtube.com/watch" in video_url:
-            video_id = video_url.split("v=")[1].split("&")[0]
-        elif "youtu.be/" in video_url:
-            video_id = video_url.split("youtu.be/")[1].split("?")[0]
-        
+        video_id = self._youtube_video_id(video_url)
         if not video_id:
             raise ValueError("Invalid YouTube URL. Please provide a valid YouTube video URL.")
         
-        comments = []
-        
         try:
             # Use the Invidious API, which is a YouTube front-end that's more scraper-friendly
-            invidious_instances = [
-                "https://invidious.snopyta.org",
-                "https://invidious.kavin.rocks",
-                "https://invidio.us",
-            ]
-            
-            working_instance = None
+            # Try healthy Invidious instances from fastest to slowest
+            instances = self.instance_registry.ranked(
+                'invidious', self.INVIDIOUS_INSTANCES, probe_path='/api/v1/stats'
+            )
             
-            # Find a working Invidious instance
-            for instance in invidious_instances:
+            items = None
+            written = 0
+            for instance in instances:
                 try:
-                    response = self.session.get(f"{instance}/api/v1/videos/{video_id}", 
-                                                headers=self.default_headers, timeout=10)
-                    if response.status_code == 200:
-                        working_instance = instance
+                    # Video details and the first comment page are independent, so fetch them together
+                    with ThreadPoolExecutor(max_workers=1) as executor:
+                        video_future = executor.submit(self._fetch_invidious_video, instance, video_id)
+                        pages = self._iter_invidious_comments(instance, video_id, limit)
+                        first_page = next(pages, [])
+                        video_data = video_future.result()
+                    
+                    # Video details go in the first row, then each comment page as it arrives
+                    items = self._item_builder(sink)
+                    items.append(self._youtube_video_row(video_data, include_metadata))
+                    for page in itertools.chain([first_page], pages):
+                        for comment_info in self._youtube_comment_rows(page, include_metadata):
+                            items.append(comment_info)
+                            written += 1
+                    break
+                except TRANSPORT_ERRORS as e:
+                    self.logger.warning(f"Invidious instance {instance} failed: {str(e)}")
+                    if items is not None:
+                        # Keep the rows already written rather than mix in another mirror's
                         break
-                except:
-                    continue
+                    self.instance_registry.mark_failed('invidious', instance)
             
-            if not working_instance:
+            if items is None:
                 # Fallback to youtube-comment-downloader
                 return self._youtube_comments_fallback(video_url, limit)
             
-            # Get video details
-            video_response = self.session.get(f"{working_instance}/api/v1/videos/{video_id}", 
-                                             headers=self.default_headers, timeout=15)
-            video_response.raise_for_status()
-            video_data = video_response.json()
-            
-            # Get comments
-            comments_response = self.session.get(f"{working_instance}/api/v1/comments/{video_id}", 
-                                                headers=self.default_headers, timeout=15)
-            comments_response.raise_for_status()
-            comments_data = comments_response.json()
-            
-            if 'comments' in comments_data:
-                for comment in comments_data['comments'][:limit]:
-                    comment_info = {
-                        'author': comment.get('author', ''),
-                        'text': comment.get('content', ''),
-                        'published': comment.get('published', ''),
-                    }
-                    
-                    # Add metadata if requested
-                    if include_metadata:
-                        comment_info.update({
-                            'likes': comment.get('likeCount', 0),
-                            'is_owner': comment.get('authorIsChannelOwner', False),
-                            'replies': len(comment.get('replies', [])),
-                        })
+            return self._youtube_result(items, written)
+            
+        except Exception as e:
+            self.logger.error(f"Error scraping YouTube comments: {str(e)}")
+            return self._youtube_comments_fallback(video_url, limit)
+    
+    async def _ascrape_youtube_comments(self, video_url, limit, date_from, include_metadata, sink=None):
+        """Asynchronous version of _scrape_youtube_comments"""
+        self.logger.info(f"Scraping YouTube comments for: {video_url}")
+        
+        video_id = self._youtube_video_id(video_url)
+        if not video_id:
+            raise ValueError("Invalid YouTube URL. Please provide a valid YouTube video URL.")
+        
+        client = self._async_client()
+        
+        try:
+            instances = await asyncio.to_thread(
+                self.instance_registry.ranked, 'invidious', self.INVIDIOUS_INSTANCES, '/api/v1/stats'
+            )
+            
+            items = None
+            written = 0
+            for instance in instances:
+                video_task = asyncio.ensure_future(self._afetch_invidious_video(client, instance, video_id))
+                pages = self._aiter_invidious_comments(client, instance, video_id, limit)
+                try:
+                    first_page = await anext(pages, [])
+                    video_data = await video_task
                     
-                    comments.append(comment_info)
-            
-            # Add video details as the first row
-            video_info = {
-                'video_title': video_data.get('title', ''),
-                'video_author': video_data.get('author', ''),
-                'video_published': video_data.get('published', ''),
-                'description': video_data.get('description', ''),
+                    items = self._item_builder(sink)
+                    items.append(self._youtube_video_row(video_data, include_metadata))
+                    page = first_page
+                    while page is not None:
+                        for comment_info in self._youtube_comment_rows(page, include_metadata):
+                            items.append(comment_info)
+                            written += 1
+                        page = await anext(pages, None)
+                    break
+                except TRANSPORT_ERRORS as e:
+                    self.logger.warning(f"Invidious instance {instance} failed: {str(e)}")
+                    if items is not None:
+                        break
+                    self.instance_registry.mark_failed('invidious', instance)
+                finally:
+                    video_task.cancel()
+                    await pages.aclose()
+            
+            if items is None:
+                return self._youtube_comments_fallback(video_url, limit)
+            
+            return self._youtube_result(items, written)
+            
+        except Exception as e:
+            self.logger.error(f"Error scraping YouTube comments: {str(e)}")
+            return self._youtube_comments_fallback(video_url, limit)
+    
+    def _youtube_video_id(self, video_url):
+        """Extract the video ID from a YouTube URL"""
+        if "youtube.com/watch" in video_url:
+            return video_url.split("v=")[1].split("&")[0]
+        elif "youtu.be/" in video_url:
+            return video_url.split("youtu.be/")[1].split("?")[0]
+        return None
+    
+    def _youtube_video_row(self, video_data, include_metadata):
+        """Build the row of video details written ahead of the comments"""
+        video_info = {
+            'video_title': video_data.get('title', ''),
+            'video_author': video_data.get('author', ''),
+            'video_published': self._from_timestamp(video_data.get('published')),
+            'description': video_data.get('description', ''),
+        }
+        
+        # Add metadata if requested
+        if include_metadata:
+            video_info.update({
+                'view_count': video_data.get('viewCount', 0),
+                'like_count': video_data.get('likeCount', 0),
+                'dislike_count': video_data.get('dislikeCount', 0),
+                'subscriber_count': video_data.get('subCount', 0),
+                'length_seconds': video_data.get('lengthSeconds', 0),
+                'video_type': 'video_info'
+            })
+        
+        return video_info
+    
+    @timed_stage('extract', "YouTube Comments")
+    def _youtube_comment_rows(self, page, include_metadata):
+        """Build one row per comment of an Invidious comment page"""
+        rows = []
+        for comment in page:
+            comment_info = {
+                'author': comment.get('author', ''),
+                'text': comment.get('content', ''),
+                'published': self._from_timestamp(comment.get('published')),
+                'comment_id': comment.get('commentId', ''),
             }
             
             # Add metadata if requested
             if include_metadata:
-                video_info.update({
-                    'view_count': video_data.get('viewCount', 0),
-                    'like_count': video_data.get('likeCount', 0),
-                    'dislike_count': video_data.get('dislikeCount', 0),
-                    'subscriber_count': video_data.get('subCount', 0),
-                    'length_seconds': video_data.get('lengthSeconds', 0),
-                    'video_type': 'video_info'
+                comment_info.update({
+                    'likes': comment.get('likeCount', 0),
+                    'is_owner': comment.get('authorIsChannelOwner', False),
+                    'replies': len(comment.get('replies', [])),
                 })
             
-            comments.insert(0, video_info)
+            rows.append(comment_info)
+        
+        return rows
+    
+    def _youtube_result(self, items, comment_count):
+        """Finish a YouTube scrape whose rows have been written to items"""
+        if not comment_count:
+            self.logger.warning("No comments found")
+            items.append({"text": "No comments found for this video"})
+        
+        return self._build(items, "YouTube Comments")
+    
+    def _fetch_invidious_video(self, instance, video_id):
+        """Fetch video details from an Invidious instance"""
+        response = self.session.get(f"{instance}/api/v1/videos/{video_id}", 
+                                    headers=self.default_headers, timeout=15)
+        response.raise_for_status()
+        return response.json()
+    
+    async def _afetch_invidious_video(self, client, instance, video_id):
+        """Asynchronous version of _fetch_invidious_video"""
+        response = await client.get(f"{instance}/api/v1/videos/{video_id}",
+                                    headers=self.default_headers, timeout=15)
+        response.raise_for_status()
+        return response.json()
+    
+    def _iter_invidious_comments(self, instance, video_id, limit):
+        """
+        Yield pages of top-level comments from an Invidious instance, up to ``limit`` in all.
+        
+        Invidious returns one page of comments per request along with a
+        continuation token, which is followed until enough comments have
+        been collected or the thread is exhausted.
+        """
+        remaining = limit
+        continuation = None
+        
+        while remaining > 0:
+            params = {'continuation': continuation} if continuation else None
+            response = self.session.get(f"{instance}/api/v1/comments/{video_id}", params=params,
+                                        headers=self.default_headers, timeout=15)
+            response.raise_for_status()
+            page = response.json()
+            
+            page_comments = page.get('comments', [])[:remaining]
+            if page_comments:
+                yield page_comments
+            remaining -= len(page_comments)
             
-            if len(comments) <= 1:
-                self.logger.warning("No comments found")
-                comments.append({"text": "No comments found for this video"})
+            continuation = page.get('continuation')
+            if not continuation or not page_comments:
+                break
+    
+    async def _aiter_invidious_comments(self, client, instance, video_id, limit):
+        """Asynchronous version of _iter_invidious_comments"""
+        remaining = limit
+        continuation = None
+        
+        while remaining > 0:
+            params = {'continuation': continuation} if continuation else None
+            response = await client.get(f"{instance}/api/v1/comments/{video_id}", params=params,
+                                        headers=self.default_headers, timeout=15)
+            response.raise_for_status()
+            page = response.json()
             
-            return pd.DataFrame(comments)
+            page_comments = page.get('comments', [])[:remaining]
+            if page_comments:
+                yield page_comments
+            remaining -= len(page_comments)
             
-        except Exception as e:
-            self.logger.error(f"Error scraping YouTube comments: {str(e)}")
-            return self._youtube_comments_fallback(video_url, limit)
+            continuation = page.get('continuation')
+            if not continuation or not page_comments:
+                break
     
     def _youtube_comments_fallback(self, video_url, limit):
         """Fallback method that returns a template with instructions for YouTube comments"""
         self.logger.info("Using YouTube comments fallback method")
         
-        # Extract video ID from URL
-        video_id = None
-        if "youtube.com/watch" in video_url:
-            video_id = video_url.split("v=")[1].split("&")[0]
-        elif "youtu.be/" in video_url:
-            video_id = video_url.split("youtu.be/")[1].split("?")[0]
+        video_id = self._youtube_video_id(video_url)
         
         # Create a dataframe with instructions
         instructions = [{
@@ -502,129 +1469,232 @@ class SocialMediaScraper:
         
         return pd.DataFrame(instructions)
     
-    def _scrape_hackernews(self, query_type, query, limit, date_from, include_metadata):
+    def _scrape_hackernews(self, query_type, query, limit, date_from, include_metadata, include_replies, sink=None):
         """
         Extract data from Hacker News using their API.
         This method doesn't require authentication.
         """
         self.logger.info(f"Scraping HackerNews for {query_type}: {query}")
         
-        stories = []
+        stories = self._item_builder(sink)
         
         try:
-            # Base API URL
-            api_base = "https://hacker-news.firebaseio.com/v0"
-            
-            # Determine which stories to fetch based on query_type
-            if query_type == "Top Stories":
-                stories_url = f"{api_base}/topstories.json"
-            elif query_type == "New Stories":
-                stories_url = f"{api_base}/newstories.json"
-            elif query_type == "Ask HN":
-                stories_url = f"{api_base}/askstories.json"
-            elif query_type == "Show HN":
-                stories_url = f"{api_base}/showstories.json"
-            else:
-                raise ValueError(f"Unsupported HackerNews query type: {query_type}")
-            
             # Get list of story IDs
-            response = self.session.get(stories_url, headers=self.default_headers, timeout=15)
+            response = self.session.get(self._hn_stories_url(query_type), headers=self.default_headers, timeout=15)
             response.raise_for_status()
             story_ids = response.json()
             
+            chronological = ("HackerNews", query_type) in self.CHRONOLOGICAL_FEEDS
+            
             # Process each story up to the limit
             for story_id in story_ids[:limit]:
                 # Get story details
-                story_url = f"{api_base}/item/{story_id}.json"
+                story_url = f"{HN_API_BASE}/item/{story_id}.json"
                 story_response = self.session.get(story_url, headers=self.default_headers, timeout=15)
                 story_response.raise_for_status()
                 story_data = story_response.json()
                 
-                # Skip if no data or if it's older than date_from
-                if not story_data or 'time' not in story_data:
+                story_date = self._hn_story_date(story_data, date_from, query)
+                if story_date is None:
                     continue
-                    
-                story_date = datetime.fromtimestamp(story_data.get('time', 0))
                 if story_date < date_from:
+                    if chronological:
+                        # Story IDs are listed newest first, so no later story can match
+                        break
                     continue
                 
-                # Check if the story matches the query (if provided)
-                if query and not self._matches_query(story_data, query):
-                    continue
-                
-                # Basic story data
-                story_info = {
-                    'title': story_data.get('title', ''),
-                    'by': story_data.get('by', ''),
-                    'time': story_date.strftime('%Y-%m-%d %H:%M:%S'),
-                    'url': story_data.get('url', ''),
-                    'text': story_data.get('text', ''),
-                    'type': story_data.get('type', ''),
-                }
-                
-                # Add HN link
-                story_info['hn_link'] = f"https://news.ycombinator.com/item?id={story_id}"
-                
-                # Add metadata if requested
-                if include_metadata:
-                    story_info.update({
-                        'score': story_data.get('score', 0),
-                        'descendants': story_data.get('descendants', 0),  # Comment count
-                    })
+                story_info = self._hn_story_row(story_id, story_data, story_date, include_metadata)
+                stories.append(story_info)
                 
                 # Fetch top-level comments if requested and if there are any
                 if include_replies and story_data.get('kids', []):
-                    top_comments = []
-                    
                     # Get up to 5 top-level comments
                     for kid_id in story_data.get('kids', [])[:5]:
                         try:
-                            comment_url = f"{api_base}/item/{kid_id}.json"
+                            comment_url = f"{HN_API_BASE}/item/{kid_id}.json"
                             comment_response = self.session.get(comment_url, headers=self.default_headers, timeout=15)
-                            comment_data = comment_response.json()
+                            comment_info = self._hn_comment_row(comment_response.json(), story_info, include_metadata)
                             
-                            if comment_data and comment_data.get('type') == 'comment':
-                                comment_info = {
-                                    'by': comment_data.get('by', ''),
-                                    'text': comment_data.get('text', ''),
-                                    'time': datetime.fromtimestamp(
-                                        comment_data.get('time', 0)
-                                    ).strftime('%Y-%m-%d %H:%M:%S'),
-                                }
-                                
-                                if include_metadata:
-                                    comment_info['reply_count'] = len(comment_data.get('kids', []))
-                                
-                                top_comments.append(comment_info)
-                            
-                            # Be respectful with rate limits
-                            time.sleep(0.1)
+                            if comment_info:
+                                # Comments follow their story, linked through parent_id
+                                stories.append(comment_info)
                             
                         except Exception as e:
                             self.logger.warning(f"Error fetching comment {kid_id}: {str(e)}")
-                    
-                    story_info['top_comments'] = top_comments
-                
-                stories.append(story_info)
             
             if not stories:
                 self.logger.warning("No HackerNews stories found")
                 return pd.DataFrame([{"message": "No HackerNews stories found for the given criteria"}])
             
-            return pd.DataFrame(stories)
+            return self._build(stories, "HackerNews")
             
         except Exception as e:
             self.logger.error(f"Error scraping HackerNews: {str(e)}")
+            return self._hackernews_instructions(e)
+    
+    async def _ascrape_hackernews(self, query_type, query, limit, date_from, include_metadata, include_replies, sink=None):
+        """
+        Asynchronous version of _scrape_hackernews.
+        
+        Stories are requested in windows of ``max_workers`` at a time and the
+        comments of a window are fetched together, while rows are still
+        written in listing order.
+        """
+        self.logger.info(f"Scraping HackerNews for {query_type}: {query}")
+        
+        stories = self._item_builder(sink)
+        client = self._async_client()
+        
+        async def fetch_item(item_id):
+            response = await client.get(f"{HN_API_BASE}/item/{item_id}.json", headers=self.default_headers, timeout=15)
+            response.raise_for_status()
+            return response.json()
+        
+        async def fetch_comment(kid_id):
+            try:
+                return await fetch_item(kid_id)
+            except Exception as e:
+                self.logger.warning(f"Error fetching comment {kid_id}: {str(e)}")
+                return None
+        
+        try:
+            response = await client.get(self._hn_stories_url(query_type), headers=self.default_headers, timeout=15)
+            response.raise_for_status()
+            story_ids = response.json()[:limit]
+            
+            chronological = ("HackerNews", query_type) in self.CHRONOLOGICAL_FEEDS
+            window = max(1, self.max_workers)
             
-            # Return a template with instructions
-            instructions = [{
-                'message': f"HackerNews data could not be retrieved: {str(e)}",
-                'solution': "To scrape HackerNews data, you can use the official API:",
-                'api_docs': "https://github.com/HackerNews/API",
-                'code_example': "import requests\n\n# Get top stories\ntop_stories = requests.get('https://hacker-news.firebaseio.com/v0/topstories.json').json()\n\n# Get story details\nfor story_id in top_stories[:10]:\n    story = requests.get(f'https://hacker-news.firebaseio.com/v0/item/{story_id}.json').json()\n    print(story['title'])",
-            }]
+            for offset in range(0, len(story_ids), window):
+                batch_ids = story_ids[offset:offset + window]
+                batch_data = await asyncio.gather(*(fetch_item(story_id) for story_id in batch_ids))
+                
+                kept = []
+                reached_date_from = False
+                for story_id, story_data in zip(batch_ids, batch_data):
+                    story_date = self._hn_story_date(story_data, date_from, query)
+                    if story_date is None:
+                        continue
+                    if story_date < date_from:
+                        if chronological:
+                            reached_date_from = True
+                            break
+                        continue
+                    kept.append((self._hn_story_row(story_id, story_data, story_date, include_metadata), story_data))
+                
+                kid_ids = [
+                    story_data.get('kids', [])[:5] if include_replies else []
+                    for _, story_data in kept
+                ]
+                comment_data = await asyncio.gather(*(fetch_comment(kid_id) for kids in kid_ids for kid_id in kids))
+                
+                position = 0
+                for (story_info, _), kids in zip(kept, kid_ids):
+                    stories.append(story_info)
+                    for data in comment_data[position:position + len(kids)]:
+                        comment_info = self._hn_comment_row(data, story_info, include_metadata)
+                        if comment_info:
+                            stories.append(comment_info)
+                    position += len(kids)
+                
+                if reached_date_from:
+                    break
             
-            return pd.DataFrame(instructions)
+            if not stories:
+                self.logger.warning("No HackerNews stories found")
+                return pd.DataFrame([{"message": "No HackerNews stories found for the given criteria"}])
+            
+            return self._build(stories, "HackerNews")
+            
+        except Exception as e:
+            self.logger.error(f"Error scraping HackerNews: {str(e)}")
+            return self._hackernews_instructions(e)
+    
+    def _hn_stories_url(self, query_type):
+        """Determine which story listing to fetch based on query_type"""
+        if query_type == "Top Stories":
+            return f"{HN_API_BASE}/topstories.json"
+        elif query_type == "New Stories":
+            return f"{HN_API_BASE}/newstories.json"
+        elif query_type == "Ask HN":
+            return f"{HN_API_BASE}/askstories.json"
+        elif query_type == "Show HN":
+            return f"{HN_API_BASE}/showstories.json"
+        else:
+            raise ValueError(f"Unsupported HackerNews query type: {query_type}")
+    
+    def _hn_story_date(self, story_data, date_from, query):
+        """
+        Return the posting time of a story, or None if it should be skipped.
+        
+        Stories without data or not matching the query are skipped; the
+        caller compares the returned time against date_from.
+        """
+        # Skip if no data
+        if not story_data or 'time' not in story_data:
+            return None
+        
+        # Check if the story matches the query (if provided)
+        story_date = datetime.fromtimestamp(story_data.get('time', 0))
+        if story_date >= date_from and query and not self._matches_query(story_data, query):
+            return None
+        
+        return story_date
+    
+    @timed_stage('extract', "HackerNews")
+    def _hn_story_row(self, story_id, story_data, story_date, include_metadata):
+        """Build the row of one story"""
+        story_info = {
+            'item_type': 'post',
+            'title': story_data.get('title', ''),
+            'by': story_data.get('by', ''),
+            'time': story_date,
+            'url': story_data.get('url', ''),
+            'text': story_data.get('text', ''),
+            'type': story_data.get('type', ''),
+        }
+        
+        # Add HN link
+        story_info['hn_link'] = f"https://news.ycombinator.com/item?id={story_id}"
+        
+        # Add metadata if requested
+        if include_metadata:
+            story_info.update({
+                'score': story_data.get('score', 0),
+                'descendants': story_data.get('descendants', 0),  # Comment count
+            })
+        
+        return story_info
+    
+    @timed_stage('extract', "HackerNews")
+    def _hn_comment_row(self, comment_data, story_info, include_metadata):
+        """Build the row of one top-level comment, or None if the item is not a comment"""
+        if not comment_data or comment_data.get('type') != 'comment':
+            return None
+        
+        comment_info = {
+            'item_type': 'comment',
+            'parent_id': story_info['hn_link'],
+            'by': comment_data.get('by', ''),
+            'text': comment_data.get('text', ''),
+            'time': datetime.fromtimestamp(comment_data.get('time', 0)),
+        }
+        
+        if include_metadata:
+            comment_info['reply_count'] = len(comment_data.get('kids', []))
+        
+        return comment_info
+    
+    def _hackernews_instructions(self, error):
+        """Return a template with instructions when HackerNews cannot be scraped"""
+        instructions = [{
+            'message': f"HackerNews data could not be retrieved: {str(error)}",
+            'solution': "To scrape HackerNews data, you can use the official API:",
+            'api_docs': "https://github.com/HackerNews/API",
+            'code_example': "import requests\n\n# Get top stories\ntop_stories = requests.get('https://hacker-news.firebaseio.com/v0/topstories.json').json()\n\n# Get story details\nfor story_id in top_stories[:10]:\n    story = requests.get(f'https://hacker-news.firebaseio.com/v0/item/{story_id}.json').json()\n    print(story['title'])",
+        }]
+        
+        return pd.DataFrame(instructions)
     
     def _matches_query(self, data, query):
         """Check if the data matches the query string"""
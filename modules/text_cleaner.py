@@ -0,0 +1,289 @@
+import re
+import time
+import random
+import logging
+import argparse
+import threading
+from functools import lru_cache
+from html import unescape
+import pandas as pd
+from .stopword_lists import BUNDLED_STOPWORDS
+
+logger = logging.getLogger(__name__)
+
+# NLTK is imported, and its data fetched, only when a text operation needs it
+_nltk_lock = threading.Lock()
+
+URL_PATTERN = re.compile(r'https?://\S+|www\.\S+')
+
+# Runs of characters that are neither word characters nor whitespace
+SPECIAL_CHARACTERS_PATTERN = re.compile(r'[^\w\s]+')
+
+# Tokens close to NLTK's word_tokenize: abbreviations such as "U.S.",
+# contractions split as "do" + "n't" and "it" + "'s", words with inner
+# hyphens or dots, ellipses and single punctuation marks
+TOKEN_PATTERN = re.compile(
+    r"(?:[^\W\d_]\.){2,}"
+    r"|\w+(?=[nN]['’][tT]\b)|[nN]['’][tT]\b"
+    r"|['’](?:[sSmMdD]|re|RE|ve|VE|ll|LL)\b"
+    r"|\w+(?:[-.]\w+)*"
+    r"|\.{2,}|[^\w\s]"
+)
+
+_TAG_BODY = r'(?:[^<>"\']|"[^"]*"|\'[^\']*\')*'
+
+# Comments, script/style blocks with their content, declarations and any
+# other tag. A "<" not starting a well-formed tag (e.g. "a < b") is left alone
+HTML_PATTERN = re.compile(
+    r'<!--.*?-->'
+    r'|<(?:script|style)\b' + _TAG_BODY + r'>.*?</(?:script|style)\s*>'
+    r'|</?[A-Za-z]' + _TAG_BODY + r'>'
+    r'|<![A-Za-z][^<>]*>|<\?[^<>]*>',
+    re.IGNORECASE | re.DOTALL,
+)
+
+# CDATA sections, whose content is kept as text
+CDATA_PATTERN = re.compile(r'<!\[CDATA\[(.*?)\]\]>', re.IGNORECASE | re.DOTALL)
+
+# Stands in for removed markup while whitespace-only text nodes are found
+_MARKUP = '\ufdd0'
+
+# Text nodes made only of whitespace, which BeautifulSoup collapses to a
+# newline when they contain one and to a space otherwise
+_NEWLINE_NODE_PATTERN = re.compile('\ufdd0[ \t\f\r]*\n[ \t\n\f\r]*(?=\ufdd0)')
+_SPACE_NODE_PATTERN = re.compile('\ufdd0(?! \ufdd0)[ \t\f\r]+(?=\ufdd0)')
+
+# Options that give the same result when applied twice in a row
+IDEMPOTENT_OPTIONS = {"Remove URLs", "Remove Special Characters", "Lowercase", "Remove Extra Spaces"}
+
+
+def strip_html(text):
+    """
+    Remove tags from HTML and decode character references, without building a parse tree.
+
+    Gives the same text as BeautifulSoup(text, "html.parser").get_text() for
+    well-formed markup, at a fraction of the cost.
+    """
+    if '<' in text:
+        if '<![' in text:
+            text = CDATA_PATTERN.sub(_MARKUP + r'\1' + _MARKUP, text)
+        # The outer markers let text nodes at the start and end be matched too
+        text = _MARKUP + HTML_PATTERN.sub(_MARKUP, text) + _MARKUP
+        text = _NEWLINE_NODE_PATTERN.sub(_MARKUP + '\n', text)
+        text = _SPACE_NODE_PATTERN.sub(_MARKUP + ' ', text).replace(_MARKUP, '')
+    elif text and not text.strip(' \t\n\f\r'):
+        text = '\n' if '\n' in text else ' '
+
+    if '&' in text:
+        text = unescape(text)
+    return text
+
+
+def remove_urls(text):
+    return URL_PATTERN.sub('', text)
+
+
+def remove_special_characters(text):
+    return SPECIAL_CHARACTERS_PATTERN.sub('', text)
+
+
+def collapse_spaces(text):
+    """Equivalent to re.sub(r'\\s+', ' ', text).strip()"""
+    return ' '.join(text.split())
+
+
+def _nltk_resource(path, package):
+    """Make sure an NLTK data package is installed, downloading it on first use"""
+    import nltk
+
+    with _nltk_lock:
+        try:
+            nltk.data.find(path)
+        except LookupError:
+            logger.info(f"Downloading NLTK resource '{package}'")
+            nltk.download(package, quiet=True)
+
+
+@lru_cache(maxsize=None)
+def get_stopwords(language='english'):
+    """
+    Return the stopwords of a language as a frozenset, loaded once per process.
+
+    Bundled lists are used when available, so English needs neither NLTK
+    data nor network access; other languages come from the NLTK corpus.
+    """
+    if language in BUNDLED_STOPWORDS:
+        return BUNDLED_STOPWORDS[language]
+
+    _nltk_resource('corpora/stopwords', 'stopwords')
+    from nltk.corpus import stopwords
+    return frozenset(stopwords.words(language))
+
+
+@lru_cache(maxsize=None)
+def _nltk_word_tokenize():
+    """Import NLTK's word_tokenize on first use, with the punkt models it needs"""
+    _nltk_resource('tokenizers/punkt_tab', 'punkt_tab')
+    from nltk.tokenize import word_tokenize
+    return word_tokenize
+
+
+def tokenize(text):
+    """Split a text into word and punctuation tokens with a single regex scan"""
+    return TOKEN_PATTERN.findall(text)
+
+
+def remove_stopwords(text, stop_words, nltk_compatible=False):
+    """
+    Drop stopwords from a text and join the remaining tokens with spaces.
+
+    Args:
+        text (str): Text to filter
+        stop_words (frozenset): Lowercase stopwords
+        nltk_compatible (bool): Tokenize with NLTK's word_tokenize, which
+            reproduces its output exactly (e.g. `` '' for double quotes and
+            sentence-aware periods) but is several times slower
+
+    Returns:
+        str: Remaining tokens separated by single spaces
+    """
+    tokens = _nltk_word_tokenize()(text) if nltk_compatible else TOKEN_PATTERN.findall(text)
+    return ' '.join([token for token in tokens if token.lower() not in stop_words])
+
+
+def plan_steps(clean_options):
+    """
+    Reduce the selected options to the steps that change the result.
+
+    Options keep their order, since most of them do not commute. Repeats of
+    an idempotent option are dropped, as is "Remove URLs" right after
+    "Remove Special Characters": without ":" and "." no URL can match.
+    """
+    steps = []
+    for option in clean_options:
+        if steps and option == steps[-1] and option in IDEMPOTENT_OPTIONS:
+            continue
+        if option == "Remove URLs" and steps and steps[-1] == "Remove Special Characters":
+            continue
+        steps.append(option)
+    return steps
+
+
+def build_cleaner(clean_options, stopword_filter=None):
+    """
+    Compose the selected options into one function applied per text.
+
+    Args:
+        clean_options (list): Text cleaning options, applied in order
+        stopword_filter (callable, optional): Function removing stopwords
+            from a text, required when "Remove Stopwords" is selected
+
+    Returns:
+        callable: Function cleaning a single string in one call
+    """
+    functions = []
+    for option in plan_steps(clean_options):
+        if option == "Remove HTML":
+            functions.append(strip_html)
+        elif option == "Remove URLs":
+            functions.append(remove_urls)
+        elif option == "Remove Special Characters":
+            functions.append(remove_special_characters)
+        elif option == "Lowercase":
+            functions.append(str.lower)
+        elif option == "Remove Extra Spaces":
+            functions.append(collapse_spaces)
+        elif option == "Remove Stopwords":
+            if stopword_filter is None:
+                raise ValueError("A stopword filter is required to remove stopwords")
+            functions.append(stopword_filter)
+
+    if not functions:
+        return None
+    if len(functions) == 1:
+        return functions[0]
+
+    def clean(text):
+        for function in functions:
+            text = function(text)
+        return text
+
+    return clean
+
+
+def clean_values(values, clean_options, stopword_filter=None):
+    """
+    Clean a sequence of strings in a single pass.
+
+    All selected options are fused into one function, so each value is
+    visited once instead of once per option.
+
+    Args:
+        values (iterable): Strings to clean
+        clean_options (list): Text cleaning options, applied in order
+        stopword_filter (callable, optional): See build_cleaner
+
+    Returns:
+        list: Cleaned strings
+    """
+    cleaner = build_cleaner(clean_options, stopword_filter)
+    if cleaner is None:
+        return list(values)
+    return [cleaner(value) for value in values]
+
+
+def run_stopword_benchmark(texts, stop_words=None):
+    """
+    Compare the regex stopword path with the NLTK-compatible one.
+
+    Args:
+        texts (list): Texts to filter, e.g. a large text column
+        stop_words (frozenset, optional): Stopwords, defaults to get_stopwords()
+
+    Returns:
+        pd.DataFrame: Seconds and rows per second for each mode, plus the share
+            of rows whose output is identical to the NLTK-compatible mode
+    """
+    stop_words = stop_words if stop_words is not None else get_stopwords()
+
+    results = {}
+    rows = []
+    for mode, nltk_compatible in (("nltk", True), ("regex", False)):
+        start = time.perf_counter()
+        results[mode] = [remove_stopwords(text, stop_words, nltk_compatible) for text in texts]
+        elapsed = time.perf_counter() - start
+        rows.append({
+            'mode': mode,
+            'rows': len(texts),
+            'seconds': round(elapsed, 4),
+            'rows_per_second': round(len(texts) / elapsed, 1) if elapsed else None,
+        })
+
+    matching = sum(fast == exact for fast, exact in zip(results['regex'], results['nltk']))
+    summary = pd.DataFrame(rows)
+    summary['identical_share'] = [1.0, round(matching / len(texts), 4) if texts else 1.0]
+    return summary
+
+
+def synthetic_texts(rows=10000, words_per_text=30, seed=0):
+    """Build English-like texts with stopwords, contractions and punctuation"""
+    rng = random.Random(seed)
+    words = ("the a of and to in is it that this was for on are with as but not they "
+             "data model release python community thread video feature benchmark update "
+             "don't it's can't we're I'm , , . ! ? ; ( ) - e-mail 3.14 U.S.").split()
+    return [' '.join(rng.choice(words) for _ in range(words_per_text)) for _ in range(rows)]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark stopword removal against NLTK's tokenizer")
+    parser.add_argument('--csv', help="CSV file to read the texts from instead of generating them")
+    parser.add_argument('--column', help="Text column of the CSV file")
+    parser.add_argument('--rows', type=int, default=20000, help="Number of texts to benchmark")
+    args = parser.parse_args()
+
+    if args.csv:
+        texts = pd.read_csv(args.csv, usecols=[args.column], nrows=args.rows)[args.column].astype(str).tolist()
+    else:
+        texts = synthetic_texts(args.rows)
+
+    print(run_stopword_benchmark(texts).to_string(index=False))
@@ -0,0 +1,86 @@
+import os
+import json
+import logging
+import threading
+from datetime import datetime
+
+DEFAULT_WATERMARK_PATH = os.path.join(os.path.expanduser("~"), ".dataminer", "watermarks.json")
+
+
+class WatermarkStore:
+    """
+    Remembers the newest item seen for each (platform, query_type, query).
+
+    A watermark holds the timestamp of the newest item plus the IDs of the
+    items sharing that timestamp, so a later run can request only what is
+    strictly newer without dropping items posted in the same second.
+    """
+
+    def __init__(self, path=None):
+        logging.basicConfig(level=logging.INFO)
+        self.logger = logging.getLogger(__name__)
+        self.path = path or DEFAULT_WATERMARK_PATH
+
+        self._lock = threading.Lock()
+        self._marks = self._load()
+
+    def get(self, platform, query_type, query):
+        """
+        Return the watermark for a query.
+
+        Returns:
+            dict or None: {'timestamp': datetime, 'ids': list} or None if never run
+        """
+        with self._lock:
+            mark = self._marks.get(self._key(platform, query_type, query))
+
+        if not mark:
+            return None
+
+        try:
+            timestamp = datetime.fromisoformat(mark['timestamp'])
+        except (KeyError, TypeError, ValueError):
+            return None
+
+        return {'timestamp': timestamp, 'ids': list(mark.get('ids', []))}
+
+    def set(self, platform, query_type, query, timestamp, ids=None):
+        """Store the newest timestamp (and IDs at that timestamp) seen for a query"""
+        with self._lock:
+            self._marks[self._key(platform, query_type, query)] = {
+                'timestamp': timestamp.isoformat(),
+                'ids': sorted({str(item_id) for item_id in (ids or [])}),
+            }
+            self._save()
+
+    def clear(self, platform=None, query_type=None, query=None):
+        """Forget one watermark, or all of them when no query is given"""
+        with self._lock:
+            if platform is None:
+                self._marks = {}
+            else:
+                self._marks.pop(self._key(platform, query_type, query), None)
+            self._save()
+
+    def _key(self, platform, query_type, query):
+        return f"{platform}|{query_type or ''}|{(query or '').strip().lower()}"
+
+    def _load(self):
+        """Read the watermark file, ignoring it if missing or corrupt"""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                marks = json.load(f)
+            return marks if isinstance(marks, dict) else {}
+        except (OSError, ValueError):
+            return {}
+
+    def _save(self):
+        """Atomically write the watermark file; callers must hold the lock"""
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self._marks, f, indent=2)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            self.logger.warning(f"Could not write watermark file: {str(e)}")
@@ -1,17 +1,28 @@
 import requests
 import pandas as pd
 import time
+import asyncio
 import trafilatura
 from bs4 import BeautifulSoup
 from urllib.parse import urljoin, urlparse
 import logging
+from .http_client import DEFAULT_HEADERS, get_default_client, get_default_async_client, httpx
+from .metrics import get_default_metrics, timed_stage
 
 class WebScraper:
-    def __init__(self):
-        self.session = requests.Session()
+    metrics_source = 'web'
+    
+    def __init__(self, session=None, async_session=None, metrics=None):
+        # Shared with the other scrapers so pooling and per-host limits are process-wide
+        self.session = session or get_default_client()
+        # Used by ascrape; defaults to the shared client of the running event loop
+        self.async_session = async_session
+        # Stage timings (fetch, parse, extract, build) are recorded here
+        self.metrics = metrics or get_default_metrics()
         logging.basicConfig(level=logging.INFO)
         self.logger = logging.getLogger(__name__)
     
+    @timed_stage('total')
     def scrape(self, url, method="Full Page Content", css_selector=None, 
                delay=1, user_agent=None, max_pages=1, timeout=30):
         """
@@ -29,27 +40,7 @@ class WebScraper:
         Returns:
             Data in appropriate format (DataFrame, list, str) based on method
         """
-        if not url.startswith(('http://', 'https://')):
-            url = 'https://' + url
-            
-        # Validate URL
-        try:
-            parsed_url = urlparse(url)
-            if not parsed_url.netloc:
-                raise ValueError("Invalid URL format")
-        except Exception as e:
-            self.logger.error(f"Invalid URL: {str(e)}")
-            raise ValueError(f"Invalid URL: {str(e)}")
-        
-        # Set headers
-        headers = {
-            'User-Agent': user_agent or 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.5',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1',
-            'Cache-Control': 'max-age=0',
-        }
+        url, headers = self._prepare_request(url, user_agent)
         
         try:
             if method == "Full Page Content":
@@ -76,27 +67,105 @@ class WebScraper:
             self.logger.error(f"Scraping error: {str(e)}")
             raise RuntimeError(f"Failed to scrape data: {str(e)}")
     
-    def _scrape_full_content(self, url, headers, timeout):
-        """Scrape full HTML content from the URL"""
+    @timed_stage('total')
+    async def ascrape(self, url, method="Full Page Content", css_selector=None,
+                      delay=1, user_agent=None, max_pages=1, timeout=30):
+        """
+        Asynchronous version of scrape.
+        
+        Pages are fetched with an httpx-based AsyncHttpClient, so many
+        scrapes can run concurrently on one event loop. Arguments and
+        results are the same as for scrape.
+        """
+        url, headers = self._prepare_request(url, user_agent)
+        
+        try:
+            if method == "Custom CSS Selector" and not css_selector:
+                raise ValueError("CSS selector is required for custom extraction")
+            
+            if method == "Tables":
+                return await self._ascrape_tables(url, headers, timeout, max_pages, delay)
+            elif method == "Links":
+                return await self._ascrape_links(url, headers, timeout, max_pages, delay)
+            elif method not in ("Full Page Content", "Text Only", "Images", "Custom CSS Selector"):
+                raise ValueError(f"Unknown scraping method: {method}")
+            
+            html = await self._afetch(url, headers, timeout)
+            
+            if method == "Full Page Content":
+                return html
+            elif method == "Text Only":
+                return self._parse_text(html)
+            elif method == "Images":
+                return self._parse_images(html, url)
+            else:
+                return self._parse_custom(html, css_selector)
+                
+        except Exception as e:
+            if httpx is not None and isinstance(e, httpx.HTTPError):
+                self.logger.error(f"Request error: {str(e)}")
+            else:
+                self.logger.error(f"Scraping error: {str(e)}")
+            raise RuntimeError(f"Failed to scrape data: {str(e)}")
+    
+    def _prepare_request(self, url, user_agent):
+        """Normalize and validate the URL and build the request headers"""
+        if not url.startswith(('http://', 'https://')):
+            url = 'https://' + url
+            
+        # Validate URL
+        try:
+            parsed_url = urlparse(url)
+            if not parsed_url.netloc:
+                raise ValueError("Invalid URL format")
+        except Exception as e:
+            self.logger.error(f"Invalid URL: {str(e)}")
+            raise ValueError(f"Invalid URL: {str(e)}")
+        
+        # Set headers
+        headers = {
+            **DEFAULT_HEADERS,
+            'User-Agent': user_agent or DEFAULT_HEADERS['User-Agent'],
+            'Upgrade-Insecure-Requests': '1',
+            'Cache-Control': 'max-age=0',
+        }
+        
+        return url, headers
+    
+    @timed_stage('fetch')
+    def _fetch(self, url, headers, timeout):
+        """Fetch the HTML of a page"""
         response = self.session.get(url, headers=headers, timeout=timeout)
         response.raise_for_status()
-        
         return response.text
     
+    @timed_stage('fetch')
+    async def _afetch(self, url, headers, timeout):
+        """Fetch the HTML of a page asynchronously"""
+        client = self.async_session or get_default_async_client()
+        response = await client.get(url, headers=headers, timeout=timeout)
+        response.raise_for_status()
+        return response.text
+    
+    def _scrape_full_content(self, url, headers, timeout):
+        """Scrape full HTML content from the URL"""
+        return self._fetch(url, headers, timeout)
+    
     def _scrape_text_only(self, url, headers, timeout):
         """Scrape and extract only text content from the URL using trafilatura"""
+        # Fetch through the shared session rather than trafilatura's own client
+        return self._parse_text(self._fetch(url, headers, timeout))
+    
+    @timed_stage('extract')
+    def _parse_text(self, html):
+        """Extract the readable text of a page"""
         # First attempt with trafilatura for better text extraction
-        downloaded = trafilatura.fetch_url(url)
-        if downloaded:
-            text = trafilatura.extract(downloaded)
-            if text:
-                return text
+        text = trafilatura.extract(html)
+        if text:
+            return text
         
         # Fallback to BeautifulSoup
-        response = self.session.get(url, headers=headers, timeout=timeout)
-        response.raise_for_status()
-        
-        soup = BeautifulSoup(response.text, 'html.parser')
+        soup = BeautifulSoup(html, 'html.parser')
         # Remove script and style elements
         for script_or_style in soup(["script", "style"]):
             script_or_style.decompose()
@@ -116,46 +185,74 @@ class WebScraper:
         current_url = url
         
         for page in range(max_pages):
-            response = self.session.get(current_url, headers=headers, timeout=timeout)
-            response.raise_for_status()
-            
-            # Parse the page
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            # Find all tables
-            tables = soup.find_all('table')
-            
-            if not tables:
-                if page == 0:
-                    self.logger.warning(f"No tables found on {url}")
-                break
-            
-            # Extract each table
-            for i, table in enumerate(tables):
-                try:
-                    # Use pandas to extract table
-                    dfs = pd.read_html(str(table))
-                    for df in dfs:
-                        all_tables.append(df)
-                except Exception as e:
-                    self.logger.warning(f"Failed to extract table {i}: {str(e)}")
+            next_url = self._parse_tables(self._fetch(current_url, headers, timeout), url, page, all_tables)
             
             # Check for pagination
-            if page < max_pages - 1:
-                # Look for a next page link
-                next_link = soup.find('a', string='Next') or \
-                            soup.find('a', string='next') or \
-                            soup.find('a', class_='next') or \
-                            soup.find('a', rel='next')
-                            
-                if next_link and next_link.get('href'):
-                    next_url = next_link['href']
-                    # Handle relative URLs
-                    current_url = urljoin(url, next_url)
-                    time.sleep(delay)  # Be respectful with delay
-                else:
-                    break  # No more pages
+            if next_url is None or page >= max_pages - 1:
+                break
+            current_url = next_url
+            time.sleep(delay)  # Be respectful with delay
+        
+        return self._combine_tables(all_tables)
+    
+    async def _ascrape_tables(self, url, headers, timeout, max_pages=1, delay=1):
+        """Asynchronous version of _scrape_tables"""
+        all_tables = []
+        current_url = url
+        
+        for page in range(max_pages):
+            next_url = self._parse_tables(await self._afetch(current_url, headers, timeout), url, page, all_tables)
             
+            if next_url is None or page >= max_pages - 1:
+                break
+            current_url = next_url
+            await asyncio.sleep(delay)
+        
+        return self._combine_tables(all_tables)
+    
+    @timed_stage('parse')
+    def _parse_tables(self, html, url, page, all_tables):
+        """
+        Append the tables of one page to all_tables.
+        
+        Returns:
+            str or None: URL of the next page, or None when there is none
+        """
+        # Parse the page
+        soup = BeautifulSoup(html, 'html.parser')
+        
+        # Find all tables
+        tables = soup.find_all('table')
+        
+        if not tables:
+            if page == 0:
+                self.logger.warning(f"No tables found on {url}")
+            return None
+        
+        # Extract each table
+        for i, table in enumerate(tables):
+            try:
+                # Use pandas to extract table
+                dfs = pd.read_html(str(table))
+                for df in dfs:
+                    all_tables.append(df)
+            except Exception as e:
+                self.logger.warning(f"Failed to extract table {i}: {str(e)}")
+        
+        # Look for a next page link
+        next_link = soup.find('a', string='Next') or \
+                    soup.find('a', string='next') or \
+                    soup.find('a', class_='next') or \
+                    soup.find('a', rel='next')
+        
+        if next_link and next_link.get('href'):
+            # Handle relative URLs
+            return urljoin(url, next_link['href'])
+        return None
+    
+    @timed_stage('build')
+    def _combine_tables(self, all_tables):
+        """Combine the extracted tables into one DataFrame"""
         if not all_tables:
             raise ValueError("No tables found on the page")
         
@@ -182,32 +279,37 @@ class WebScraper:
             visited_urls.add(current_url)
             
             try:
-                response = self.session.get(current_url, headers=headers, timeout=timeout)
-                response.raise_for_status()
+                html = self._fetch(current_url, headers, timeout)
+                self._parse_links(html, url, current_url, max_pages, all_links, urls_to_visit)
                 
-                soup = BeautifulSoup(response.text, 'html.parser')
+                time.sleep(delay)  # Be respectful with delay
+                
+            except Exception as e:
+                self.logger.warning(f"Failed to scrape links from {current_url}: {str(e)}")
+        
+        if not all_links:
+            raise ValueError("No links found on the page")
+            
+        return pd.DataFrame(all_links)
+    
+    async def _ascrape_links(self, url, headers, timeout, max_pages=1, delay=1):
+        """Asynchronous version of _scrape_links"""
+        all_links = []
+        visited_urls = set()
+        urls_to_visit = [url]
+        
+        for _ in range(min(max_pages, len(urls_to_visit))):
+            current_url = urls_to_visit.pop(0)
+            if current_url in visited_urls:
+                continue
                 
-                # Extract all links
-                for link in soup.find_all('a', href=True):
-                    href = link['href']
-                    text = link.get_text(strip=True)
-                    
-                    # Handle relative URLs
-                    full_url = urljoin(current_url, href)
-                    
-                    # Only add URLs from the same domain
-                    if urlparse(full_url).netloc == urlparse(url).netloc:
-                        all_links.append({
-                            'url': full_url,
-                            'text': text if text else None,
-                            'source_page': current_url
-                        })
-                        
-                        # Add to URLs to visit if within max_pages
-                        if len(urls_to_visit) < max_pages:
-                            urls_to_visit.append(full_url)
+            visited_urls.add(current_url)
+            
+            try:
+                html = await self._afetch(current_url, headers, timeout)
+                self._parse_links(html, url, current_url, max_pages, all_links, urls_to_visit)
                 
-                time.sleep(delay)  # Be respectful with delay
+                await asyncio.sleep(delay)
                 
             except Exception as e:
                 self.logger.warning(f"Failed to scrape links from {current_url}: {str(e)}")
@@ -217,12 +319,39 @@ class WebScraper:
             
         return pd.DataFrame(all_links)
     
+    @timed_stage('parse')
+    def _parse_links(self, html, url, current_url, max_pages, all_links, urls_to_visit):
+        """Append the same-domain links of one page to all_links and queue them for visiting"""
+        soup = BeautifulSoup(html, 'html.parser')
+        
+        # Extract all links
+        for link in soup.find_all('a', href=True):
+            href = link['href']
+            text = link.get_text(strip=True)
+            
+            # Handle relative URLs
+            full_url = urljoin(current_url, href)
+            
+            # Only add URLs from the same domain
+            if urlparse(full_url).netloc == urlparse(url).netloc:
+                all_links.append({
+                    'url': full_url,
+                    'text': text if text else None,
+                    'source_page': current_url
+                })
+                
+                # Add to URLs to visit if within max_pages
+                if len(urls_to_visit) < max_pages:
+                    urls_to_visit.append(full_url)
+    
     def _scrape_images(self, url, headers, timeout):
         """Scrape image info from the URL and return as DataFrame"""
-        response = self.session.get(url, headers=headers, timeout=timeout)
-        response.raise_for_status()
-        
-        soup = BeautifulSoup(response.text, 'html.parser')
+        return self._parse_images(self._fetch(url, headers, timeout), url)
+    
+    @timed_stage('parse')
+    def _parse_images(self, html, url):
+        """Extract image info from a page"""
+        soup = BeautifulSoup(html, 'html.parser')
         
         images = []
         for img in soup.find_all('img'):
@@ -249,10 +378,12 @@ class WebScraper:
     
     def _scrape_custom(self, url, css_selector, headers, timeout):
         """Scrape content using custom CSS selector"""
-        response = self.session.get(url, headers=headers, timeout=timeout)
-        response.raise_for_status()
-        
-        soup = BeautifulSoup(response.text, 'html.parser')
+        return self._parse_custom(self._fetch(url, headers, timeout), css_selector)
+    
+    @timed_stage('extract')
+    def _parse_custom(self, html, css_selector):
+        """Extract the elements matching a CSS selector"""
+        soup = BeautifulSoup(html, 'html.parser')
         
         elements = soup.select(css_selector)
         
@@ -0,0 +1,24 @@
+import pytest
+from modules.replay import async_replay_session, replay_session, synthetic_cassettes
+from modules.social_scraper import RateBudget, SocialMediaScraper
+
+
+@pytest.fixture(scope="session")
+def cassettes():
+    """Synthetic cassettes for every platform, built once per test run"""
+    return synthetic_cassettes(items=30)
+
+
+@pytest.fixture
+def make_scraper(tmp_path):
+    """Build a SocialMediaScraper replaying a cassette, with its state files under tmp_path"""
+    def make(cassette, **kwargs):
+        kwargs.setdefault('session', replay_session(cassette))
+        kwargs.setdefault('async_session', async_replay_session(cassette))
+        kwargs.setdefault('reddit_budget', RateBudget())
+        return SocialMediaScraper(
+            instance_cache_path=str(tmp_path / "instances.json"),
+            watermark_path=str(tmp_path / "watermarks.json"),
+            **kwargs,
+        )
+    return make
@@ -0,0 +1,44 @@
+from modules.http_client import HttpClient
+from modules.replay import Cassette, ReplayAdapter
+
+URL = "https://www.reddit.com/r/python/comments/abc.json"
+QUOTA = {'Content-Type': 'application/json', 'X-Ratelimit-Remaining': '50', 'X-Ratelimit-Reset': '600'}
+
+
+def replay_client(cassette, **kwargs):
+    client = HttpClient(**kwargs)
+    client.mount('https://', ReplayAdapter(cassette))
+    return client
+
+
+def test_cache_is_off_by_default():
+    cassette = Cassette()
+    cassette.add('GET', URL, 200, QUOTA, '[]')
+    client = replay_client(cassette)
+
+    assert client.cache is None
+    assert client.get(URL).from_cache is False
+    assert client.get(URL).from_cache is False
+
+
+def test_opted_in_cache_marks_replayed_responses():
+    cassette = Cassette()
+    cassette.add('GET', URL, 200, QUOTA, '[]')
+    client = replay_client(cassette, cache_ttl=60)
+
+    assert client.get(URL).from_cache is False
+    assert client.get(URL).from_cache is True
+    assert client.get(URL, headers={'Cache-Control': 'max-age=0'}).from_cache is False
+
+
+def test_cached_responses_do_not_refresh_the_reddit_budget(make_scraper):
+    cassette = Cassette()
+    cassette.add('GET', URL, 200, QUOTA, '[]')
+    scraper = make_scraper(cassette, session=replay_client(cassette, cache_ttl=60))
+
+    scraper._reddit_get(URL, {})
+    assert scraper.reddit_budget.remaining == 50
+
+    # The cached copy still says 50 remain, but the budget has spent one since
+    scraper._reddit_get(URL, {})
+    assert scraper.reddit_budget.remaining == 49
@@ -0,0 +1,69 @@
+from datetime import datetime, timedelta
+
+import pandas as pd
+
+T = datetime(2024, 5, 1, 12, 0, 0)
+
+
+def reddit_items():
+    """Posts around the watermark time T, each followed by one comment"""
+    rows = []
+    for name, created in [("old", T - timedelta(minutes=1)), ("seen", T), ("same_second", T),
+                          ("new", T + timedelta(minutes=1))]:
+        permalink = f"https://www.reddit.com/r/python/comments/{name}/"
+        rows.append({'item_type': 'post', 'permalink': permalink, 'created_utc': created, 'title': name})
+        rows.append({'item_type': 'comment', 'parent_id': permalink, 'created_utc': created, 'body': f"on {name}"})
+    return pd.DataFrame(rows)
+
+
+def test_watermark_keeps_only_newer_items_and_their_comments(make_scraper, cassettes):
+    scraper = make_scraper(cassettes["Reddit"])
+    watermark = {'timestamp': T, 'ids': ["https://www.reddit.com/r/python/comments/seen/"]}
+
+    result = scraper._apply_watermark("Reddit", "Subreddit", "python", reddit_items(), watermark)
+
+    assert result['title'].dropna().tolist() == ["same_second", "new"]
+    assert result['body'].dropna().tolist() == ["on same_second", "on new"]
+    stored = scraper.watermarks.get("Reddit", "Subreddit", "python")
+    assert stored == {'timestamp': T + timedelta(minutes=1),
+                      'ids': ["https://www.reddit.com/r/python/comments/new/"]}
+
+
+def test_watermark_merges_ids_sharing_the_newest_timestamp(make_scraper, cassettes):
+    scraper = make_scraper(cassettes["Reddit"])
+    items = reddit_items()
+    items = items[items['title'].isin(["seen", "same_second"]) | items['body'].isin(["on seen", "on same_second"])]
+    watermark = {'timestamp': T, 'ids': ["https://www.reddit.com/r/python/comments/seen/"]}
+
+    scraper._apply_watermark("Reddit", "Subreddit", "python", items, watermark)
+
+    stored = scraper.watermarks.get("Reddit", "Subreddit", "python")
+    assert stored['timestamp'] == T
+    assert sorted(stored['ids']) == ["https://www.reddit.com/r/python/comments/same_second/",
+                                     "https://www.reddit.com/r/python/comments/seen/"]
+
+
+def test_second_incremental_run_returns_nothing_new(make_scraper, cassettes):
+    scraper = make_scraper(cassettes["Reddit"])
+
+    first = scraper.scrape("Reddit", "Subreddit", "python", limit=30, date_range="All time", incremental=True)
+    second = scraper.scrape("Reddit", "Subreddit", "python", limit=30, date_range="All time", incremental=True)
+
+    assert (first['item_type'] == 'post').sum() == 30
+    assert second.to_dict('records') == [{"message": "No new items since the last run"}]
+
+
+def test_incremental_sink_matches_in_memory_filtering(make_scraper, cassettes, tmp_path):
+    scraper = make_scraper(cassettes["Reddit"])
+    scraper.scrape("Reddit", "Subreddit", "python", limit=30, date_range="All time", incremental=True)
+    newest = scraper.watermarks.get("Reddit", "Subreddit", "python")
+    # Step the watermark back so the newest posts count as new again
+    scraper.watermarks.set("Reddit", "Subreddit", "python", newest['timestamp'] - timedelta(minutes=30))
+
+    streamed = scraper.scrape("Reddit", "Subreddit", "python", limit=30, date_range="All time",
+                              incremental=True, sink=str(tmp_path / "reddit.ndjson")).to_dataframe()
+
+    posts = streamed[streamed['item_type'] == 'post']
+    assert 0 < len(posts) < 30
+    assert (posts['created_utc'] > newest['timestamp'] - timedelta(minutes=30)).all()
+    assert set(streamed.loc[streamed['item_type'] == 'comment', 'parent_id']) <= set(posts['permalink'])
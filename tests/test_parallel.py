@@ -0,0 +1,15 @@
+from modules import parallel
+
+
+def test_pools_of_different_sizes_are_kept_side_by_side():
+    try:
+        pool = parallel._get_pool(2)
+        assert parallel._get_pool(2) is pool
+
+        # Asking for another size must not shut down a pool other callers may still use
+        parallel._get_pool(3)
+        assert pool.submit(abs, -4).result(timeout=30) == 4
+    finally:
+        parallel.shutdown()
+
+    assert parallel._pools == {}
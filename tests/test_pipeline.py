@@ -0,0 +1,139 @@
+import random
+
+import pandas as pd
+import pytest
+
+from modules.data_processor import DataProcessor
+from modules.pipeline import plan_steps
+
+COLUMNS = ['a', 'b', 't', 'flag']
+
+
+@pytest.fixture
+def processor():
+    return DataProcessor(workers=1)
+
+
+def run_in_order(processor, data, steps):
+    """Call the DataProcessor methods one by one, as the pipeline must match"""
+    for step in steps:
+        data = getattr(processor, step['step'])(data, **{k: v for k, v in step.items() if k != 'step'})
+    return data
+
+
+def random_frame(rng):
+    rows = rng.randint(0, 12)
+    return pd.DataFrame({
+        'a': [rng.choice([1, 2, 3, None]) for _ in range(rows)],
+        'b': [rng.choice([0.5, 2.0, None, 7.0]) for _ in range(rows)],
+        't': [rng.choice(['Hello <b>World</b>', 'x http://a.b', None, 'yes']) for _ in range(rows)],
+        'flag': [rng.choice(['true', 'false', None, 'yes']) for _ in range(rows)],
+    })
+
+
+def random_step(rng):
+    name = rng.choice(['remove_duplicates', 'remove_empty_rows', 'fill_missing_values',
+                       'convert_data_type', 'filter_data', 'clean_text'])
+    step = {'step': name}
+    if name == 'fill_missing_values':
+        step['method'] = rng.choice(['Mean', 'Forward Fill', 'Custom Value', 'Mode'])
+        if step['method'] == 'Custom Value':
+            step['fill_value'] = '0'
+    elif name == 'convert_data_type':
+        step.update(column=rng.choice(COLUMNS), target_type=rng.choice(['String', 'Integer', 'Float', 'Boolean']))
+    elif name == 'filter_data':
+        step.update(column=rng.choice(COLUMNS),
+                    filter_type=rng.choice(['Contains', 'Equals', 'Greater Than', 'Less Than']),
+                    filter_value=rng.choice(['1', '2', 'e', 'true']))
+    elif name == 'clean_text':
+        step.update(column=rng.choice(COLUMNS),
+                    clean_options=rng.sample(['Remove HTML', 'Lowercase', 'Remove URLs', 'Remove Extra Spaces'],
+                                             rng.randint(1, 2)))
+    return step
+
+
+def test_filter_moves_ahead_of_clean_text_on_another_column():
+    steps = [
+        {'step': 'clean_text', 'column': 't', 'clean_options': ['Lowercase']},
+        {'step': 'filter_data', 'column': 'a', 'filter_type': 'Greater Than', 'filter_value': '1'},
+    ]
+
+    assert [step['step'] for step in plan_steps(steps)] == ['filter_data', 'clean_text']
+
+
+@pytest.mark.parametrize("step", [
+    {'step': 'convert_data_type', 'column': 'flag', 'target_type': 'Boolean'},
+    {'step': 'clean_text', 'column': 'a', 'clean_options': ['Lowercase']},
+    {'step': 'fill_missing_values', 'method': 'Mean'},
+])
+def test_filter_stays_behind_steps_it_does_not_commute_with(step):
+    steps = [step, {'step': 'filter_data', 'column': 'a', 'filter_type': 'Greater Than', 'filter_value': '1'}]
+
+    assert plan_steps(steps) == steps
+
+
+def test_repeats_are_dropped_and_clean_text_merged():
+    steps = [
+        {'step': 'remove_duplicates'},
+        {'step': 'remove_duplicates'},
+        {'step': 'clean_text', 'column': 't', 'clean_options': ['Remove HTML']},
+        {'step': 'clean_text', 'column': 't', 'clean_options': ['Lowercase']},
+    ]
+
+    assert plan_steps(steps) == [
+        {'step': 'remove_duplicates'},
+        {'step': 'clean_text', 'column': 't', 'clean_options': ['Remove HTML', 'Lowercase']},
+    ]
+
+
+def test_unknown_steps_and_arguments_are_rejected():
+    with pytest.raises(ValueError):
+        plan_steps([{'step': 'drop_table'}])
+    with pytest.raises(ValueError):
+        plan_steps([{'step': 'remove_duplicates', 'column': 'a'}])
+
+
+def test_boolean_conversion_keeps_its_dtype_when_followed_by_a_filter(processor):
+    data = pd.DataFrame({'a': [1, 2, 3], 'flag': ['true', None, 'false']})
+    steps = [
+        {'step': 'convert_data_type', 'column': 'flag', 'target_type': 'Boolean'},
+        {'step': 'filter_data', 'column': 'a', 'filter_type': 'Greater Than', 'filter_value': '2'},
+    ]
+
+    pd.testing.assert_frame_equal(processor.run_pipeline(data, steps), run_in_order(processor, data, steps))
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_random_pipelines_match_calling_the_methods_in_order(processor, seed):
+    rng = random.Random(seed)
+    for _ in range(100):
+        data = random_frame(rng)
+        steps = [random_step(rng) for _ in range(rng.randint(1, 5))]
+
+        expected = run_in_order(processor, data, steps)
+        pd.testing.assert_frame_equal(processor.run_pipeline(data, steps), expected, obj=repr(steps))
+
+
+def test_pipeline_never_modifies_its_input(processor):
+    data = pd.DataFrame({'a': [1, None, 3], 't': ['<b>X</b>', 'y', None]})
+    before = data.copy()
+
+    processor.run_pipeline(data, [
+        {'step': 'fill_missing_values', 'method': 'Forward Fill'},
+        {'step': 'clean_text', 'column': 't', 'clean_options': ['Remove HTML', 'Lowercase']},
+    ])
+
+    pd.testing.assert_frame_equal(data, before)
+
+
+def test_copy_on_write_stays_scoped_to_the_processor():
+    data = pd.DataFrame({'a': [1, None, 3], 't': ['<b>X</b>', 'y', None]})
+    before = data.copy()
+
+    DataProcessor(workers=1, copy_on_write=True).run_pipeline(data, [
+        {'step': 'fill_missing_values', 'method': 'Forward Fill'},
+        {'step': 'clean_text', 'column': 't', 'clean_options': ['Remove HTML']},
+    ])
+
+    assert pd.get_option('mode.copy_on_write') is False
+    pd.testing.assert_frame_equal(data, before)
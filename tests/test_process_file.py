@@ -0,0 +1,86 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from modules.data_processor import DataProcessor
+
+STEPS = [
+    {'step': 'remove_duplicates'},
+    {'step': 'fill_missing_values', 'method': 'Forward Fill'},
+    {'step': 'filter_data', 'column': 'score', 'filter_type': 'Greater Than', 'filter_value': '20'},
+    {'step': 'clean_text', 'column': 'text', 'clean_options': ['Remove HTML', 'Lowercase']},
+    {'step': 'convert_data_type', 'column': 'score', 'target_type': 'Float'},
+]
+
+
+@pytest.fixture
+def processor():
+    return DataProcessor(workers=1)
+
+
+@pytest.fixture
+def posts():
+    """Posts with duplicates spread across chunks and gaps to forward fill over chunk boundaries"""
+    rng = np.random.default_rng(0)
+    rows = 500
+    data = pd.DataFrame({
+        'platform': rng.choice(['Reddit', 'HackerNews', None], rows),
+        'score': rng.integers(0, 100, rows).astype(float),
+        'text': [f"<p>Post <b>{i % 40}</b></p>" for i in range(rows)],
+    })
+    data.loc[rng.choice(rows, 60, replace=False), 'score'] = np.nan
+    return data
+
+
+@pytest.mark.parametrize("extension", ['.csv', '.csv.gz', '.parquet', '.arrow'])
+def test_chunked_output_matches_in_memory_pipeline(processor, posts, tmp_path, extension):
+    source = tmp_path / f"posts{extension}"
+    destination = tmp_path / f"processed{extension}"
+    if extension == '.arrow':
+        posts.to_feather(source)
+    elif extension == '.parquet':
+        posts.to_parquet(source, index=False)
+    else:
+        posts.to_csv(source, index=False)
+
+    stats = processor.process_file(str(source), str(destination), STEPS, chunksize=37)
+
+    if extension == '.arrow':
+        expected = processor.run_pipeline(pd.read_feather(source), STEPS)
+        result = pd.read_feather(destination)
+    elif extension == '.parquet':
+        expected = processor.run_pipeline(pd.read_parquet(source), STEPS)
+        result = pd.read_parquet(destination)
+    else:
+        expected = processor.run_pipeline(pd.read_csv(source), STEPS)
+        result = pd.read_csv(destination)
+        # Both sides go through CSV so dtypes are inferred the same way
+        expected = pd.read_csv(pd.io.common.StringIO(expected.to_csv(index=False)))
+
+    assert stats == {'rows_in': len(posts), 'rows_out': len(expected), 'chunks': -(-len(posts) // 37)}
+    pd.testing.assert_frame_equal(result, expected.reset_index(drop=True))
+
+
+def test_fills_needing_the_whole_file_are_rejected(processor, posts, tmp_path):
+    source = tmp_path / "posts.csv"
+    posts.to_csv(source, index=False)
+
+    with pytest.raises(ValueError):
+        processor.process_file(str(source), str(tmp_path / "out.csv"),
+                               [{'step': 'fill_missing_values', 'method': 'Mean'}])
+
+
+def test_failed_run_leaves_existing_destination_untouched(processor, posts, tmp_path):
+    destination = tmp_path / "processed.parquet"
+    destination.write_bytes(b"previous output")
+
+    # Scores in the second chunk are not numbers, so it cannot take the schema of the first
+    broken = tmp_path / "broken.csv"
+    pd.concat([posts.head(5), posts.tail(5).assign(score='unknown')]).to_csv(broken, index=False)
+
+    with pytest.raises(ValueError):
+        processor.process_file(str(broken), str(destination),
+                               [{'step': 'remove_empty_rows'}], chunksize=5)
+
+    assert destination.read_bytes() == b"previous output"
+    assert list(tmp_path.glob("*.tmp")) == []
@@ -0,0 +1,65 @@
+import asyncio
+
+import pandas as pd
+import pytest
+import requests
+
+from modules.replay import BENCHMARK_JOBS, Cassette, replay_session
+
+EXPECTED_ROWS = {
+    "Twitter/X": 30,
+    "Reddit": 180,
+    "YouTube Comments": 31,
+    "HackerNews": 180,
+}
+
+
+@pytest.mark.parametrize("platform", sorted(BENCHMARK_JOBS))
+def test_replayed_scrape_is_complete_and_matches_async(make_scraper, cassettes, platform):
+    query_type, query = BENCHMARK_JOBS[platform]
+    scraper = make_scraper(cassettes[platform])
+
+    result = scraper.scrape(platform, query_type, query, limit=30, date_range="All time")
+    async_result = asyncio.run(scraper.ascrape(platform, query_type, query, limit=30, date_range="All time"))
+
+    assert 'message' not in result.columns
+    assert len(result) == EXPECTED_ROWS[platform]
+    pd.testing.assert_frame_equal(result, async_result)
+
+
+@pytest.mark.parametrize("platform", ["Reddit", "HackerNews"])
+def test_comments_follow_their_post(make_scraper, cassettes, platform):
+    query_type, query = BENCHMARK_JOBS[platform]
+    result = make_scraper(cassettes[platform]).scrape(platform, query_type, query, limit=30, date_range="All time")
+
+    link = 'permalink' if platform == "Reddit" else 'hn_link'
+    current_post = None
+    for row in result.to_dict('records'):
+        if row['item_type'] == 'post':
+            current_post = row[link]
+        else:
+            assert row['parent_id'] == current_post
+
+
+def test_cassette_round_trip(tmp_path, cassettes):
+    path = tmp_path / "reddit.json"
+    cassettes["Reddit"].save(str(path))
+    loaded = Cassette.load(str(path))
+
+    assert len(loaded) == len(cassettes["Reddit"])
+    interaction = next(iter(cassettes["Reddit"].interactions.values()))
+    assert loaded.find(interaction['method'], interaction['url']) == interaction
+
+
+def test_lookup_ignores_query_parameter_order():
+    cassette = Cassette()
+    cassette.add('GET', 'https://example.com/api?b=2&a=1', 200, {}, 'ok')
+
+    response = replay_session(cassette).get('https://example.com/api', params={'a': 1, 'b': 2})
+
+    assert response.text == 'ok'
+
+
+def test_unrecorded_request_fails_like_an_unreachable_host():
+    with pytest.raises(requests.exceptions.ConnectionError):
+        replay_session(Cassette()).get('https://example.com/missing')
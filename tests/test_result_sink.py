@@ -0,0 +1,78 @@
+import pytest
+
+from modules.replay import Cassette
+from modules.result_sink import open_sink
+
+VIDEO_URL = "https://www.youtube.com/watch?v=dQw4w9WgXcQ"
+
+
+class RecordingSink:
+    """Sink counting the items written, for checking when they arrive"""
+
+    def __init__(self):
+        self.items = []
+
+    def __len__(self):
+        return len(self.items)
+
+    def append(self, item):
+        self.items.append(item)
+
+    def build(self):
+        return list(self.items)
+
+    def close(self):
+        pass
+
+
+def test_ndjson_sink_round_trip(tmp_path):
+    with open_sink(str(tmp_path / "items.ndjson")) as sink:
+        sink.append({'title': "first", 'score': 1})
+        sink.append({'title': "second", 'score': 2})
+
+    assert sink.build().to_dataframe().to_dict('records') == [
+        {'title': "first", 'score': 1}, {'title': "second", 'score': 2},
+    ]
+
+
+def test_parquet_sink_refuses_a_non_empty_directory(tmp_path):
+    path = str(tmp_path / "items.parquet")
+    with open_sink(path) as sink:
+        sink.append({'title': "first"})
+
+    with pytest.raises(FileExistsError):
+        open_sink(path)
+
+    with open_sink(path, overwrite=True) as sink:
+        sink.append({'title': "second"})
+    assert sink.build().to_dataframe()['title'].tolist() == ["second"]
+
+
+def test_youtube_rows_reach_the_sink_before_the_next_comment_page(make_scraper, cassettes):
+    scraper = make_scraper(cassettes["YouTube Comments"])
+    sink = RecordingSink()
+    rows_before_request = []
+    fetch_page = scraper.session.get
+
+    def get(url, *args, **kwargs):
+        if '/comments/' in url:
+            rows_before_request.append(len(sink))
+        return fetch_page(url, *args, **kwargs)
+
+    scraper.session.get = get
+    scraper.scrape("YouTube Comments", None, VIDEO_URL, limit=30, date_range="All time", sink=sink)
+
+    # The video row and the first page are written before the second page is requested
+    assert rows_before_request == [0, 21]
+    assert len(sink) == 31
+
+
+def test_youtube_rows_written_before_a_failed_page_are_kept(make_scraper, cassettes):
+    recorded = cassettes["YouTube Comments"].interactions.values()
+    cassette = Cassette([interaction for interaction in recorded if 'continuation=' not in interaction['url']])
+    sink = RecordingSink()
+
+    make_scraper(cassette).scrape("YouTube Comments", None, VIDEO_URL, limit=30, date_range="All time", sink=sink)
+
+    assert len(sink) == 21
+    assert sink.items[0]['video_type'] == 'video_info'
@@ -0,0 +1,50 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from modules.ai_assistant import AIAssistant
+from modules.data_processor import DataProcessor
+from modules.social_schema import ColumnarFrameBuilder
+
+
+@pytest.fixture
+def scraped():
+    """A frame typed the way SocialMediaScraper returns it"""
+    builder = ColumnarFrameBuilder()
+    builder.append({'title': "First post", 'text': "true", 'score': 3})
+    builder.append({'title': "Second post", 'text': "False", 'score': 5})
+    builder.append({'title': "Third post", 'text': None, 'score': None})
+    return builder.build()
+
+
+@pytest.fixture
+def assistant(monkeypatch):
+    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+    return AIAssistant()
+
+
+def test_scraped_text_columns_are_string_typed(scraped):
+    assert pd.api.types.is_string_dtype(scraped['text'])
+    assert not pd.api.types.is_object_dtype(scraped['text'])
+
+
+def test_boolean_conversion_parses_scraped_text(scraped):
+    result = DataProcessor(workers=1).convert_data_type(scraped, 'text', 'Boolean')
+
+    assert result['text'].tolist()[:2] == [True, False]
+    assert np.isnan(result['text'].iloc[2])
+
+
+def test_fallback_suggestions_see_scraped_text_columns(scraped, assistant):
+    cleaning = assistant._get_fallback_cleaning_suggestions(scraped.drop(columns='text'))
+    cleaned_columns = [op['column'] for op in cleaning['operations'] if op['issue'] == "Text data may need cleaning"]
+    assert cleaned_columns == ['title']
+
+    assert "Columns: title" in assistant._get_fallback_visualization_suggestions(scraped)
+
+
+def test_sql_export_keeps_nullable_column_types(scraped):
+    sql = DataProcessor(workers=1).export_to_sql(scraped, 'posts')
+
+    assert "    score INTEGER" in sql
+    assert "    title TEXT" in sql
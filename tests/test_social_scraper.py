@@ -0,0 +1,151 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import requests
+
+from modules.replay import ReplayAdapter
+from modules.social_scraper import RateBudget, SocialMediaScraper, get_default_reddit_budget
+
+QUOTA = {'X-Ratelimit-Remaining': '100', 'X-Ratelimit-Reset': '60'}
+
+
+def peak_concurrency(budget, headers, count=16, workers=8, fail=()):
+    """Run requests through a budget from a thread pool and return the most in flight at once"""
+    lock = threading.Lock()
+    state = {'now': 0, 'peak': 0}
+
+    def request(number):
+        budget.acquire()
+        with lock:
+            state['now'] += 1
+            state['peak'] = max(state['peak'], state['now'])
+        time.sleep(0.01)
+        with lock:
+            state['now'] -= 1
+        budget.update(None if number in fail else headers)
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        list(executor.map(request, range(count)))
+    return state['peak']
+
+
+def test_budget_serializes_requests_without_rate_limit_headers():
+    assert peak_concurrency(RateBudget(), {}) == 1
+
+
+def test_budget_allows_concurrency_once_the_quota_is_known():
+    assert peak_concurrency(RateBudget(), QUOTA) > 1
+
+
+def test_failed_probe_releases_the_waiting_workers():
+    budget = RateBudget()
+    budget.PROBE_TIMEOUT = 5
+
+    started = time.monotonic()
+    peak_concurrency(budget, QUOTA, fail={0})
+
+    assert time.monotonic() - started < budget.PROBE_TIMEOUT
+
+
+def test_exhausted_quota_waits_for_the_reset():
+    budget = RateBudget(reserve=0)
+    budget.update({'X-Ratelimit-Remaining': '0', 'X-Ratelimit-Reset': '0.2'})
+
+    started = time.monotonic()
+    budget.acquire()
+
+    assert time.monotonic() - started >= 0.15
+
+
+def test_scrapers_share_the_process_reddit_budget(tmp_path):
+    def make():
+        return SocialMediaScraper(instance_cache_path=str(tmp_path / "instances.json"),
+                                  watermark_path=str(tmp_path / "watermarks.json"))
+
+    # A scraper rebuilt on every app rerun must keep the quota learned by the last one
+    assert make().reddit_budget is make().reddit_budget is get_default_reddit_budget()
+
+
+def test_async_budget_lets_one_probe_through():
+    async def scenario():
+        budget = RateBudget()
+        await budget.async_acquire()
+        waiter = asyncio.ensure_future(budget.async_acquire())
+        # The second caller waits for the probe to report back
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(asyncio.shield(waiter), 0.1)
+        budget.update(QUOTA)
+        await asyncio.wait_for(waiter, 1)
+
+    asyncio.run(scenario())
+
+
+class SlowPagesAdapter(ReplayAdapter):
+    """Replays a cassette, delaying every request for a later timeline page"""
+
+    def send(self, request, **kwargs):
+        if 'cursor=' in request.url:
+            time.sleep(1)
+        return super().send(request, **kwargs)
+
+
+def test_nitter_does_not_wait_for_a_prefetch_it_no_longer_needs(make_scraper, cassettes):
+    session = requests.Session()
+    session.mount('https://', SlowPagesAdapter(cassettes["Twitter/X"]))
+    scraper = make_scraper(cassettes["Twitter/X"], session=session)
+
+    started = time.monotonic()
+    result = scraper.scrape("Twitter/X", "Username", "nasa", limit=5, date_range="All time")
+
+    assert len(result) == 5
+    assert time.monotonic() - started < 0.9
+
+
+def test_async_reddit_comments_are_fetched_at_most_max_workers_at_a_time(make_scraper, cassettes):
+    scraper = make_scraper(cassettes["Reddit"], max_workers=3)
+    state = {'now': 0, 'peak': 0}
+
+    async def fetch(client, permalink, headers):
+        state['now'] += 1
+        state['peak'] = max(state['peak'], state['now'])
+        await asyncio.sleep(0.01)
+        state['now'] -= 1
+        return [{'permalink': permalink}]
+
+    async def scenario():
+        posts = [{'permalink': f"/r/test/{i}"} for i in range(12)]
+        return [rows async for rows in scraper._afetch_reddit_comments(None, posts, {})]
+
+    scraper._afetch_reddit_post_comments = fetch
+    comments = asyncio.run(scenario())
+
+    assert [rows[0]['permalink'] for rows in comments] == [f"/r/test/{i}" for i in range(12)]
+    assert state['peak'] == 3
+
+
+def test_async_nitter_prefetch_is_cancelled_when_parsing_fails(make_scraper, cassettes):
+    scraper = make_scraper(cassettes["Twitter/X"])
+    fetch_page = scraper._afetch_nitter_page
+
+    async def fetch(client, url):
+        if 'cursor=' in url:
+            await asyncio.sleep(5)
+        return await fetch_page(client, url)
+
+    def collect(*args):
+        raise ValueError("unparseable page")
+
+    async def scenario():
+        result = await scraper.ascrape("Twitter/X", "Username", "nasa", limit=100, date_range="All time")
+        # Let a cancelled prefetch finish; one left running would still be pending
+        await asyncio.sleep(0)
+        return result, asyncio.all_tasks() - {asyncio.current_task()}
+
+    scraper._afetch_nitter_page = fetch
+    scraper._collect_nitter_page = collect
+    scraper._twitter_search_fallback = lambda query, limit: "fallback"
+
+    assert asyncio.run(scenario()) == ("fallback", set())